@@ -87,6 +87,9 @@ class FeaturesConfig(BaseModel):
     max_context_messages: int = 24  # Bigger context for better memory without huge prompts
     project_scan_depth: int = 5
     code_search_max_results: int = 50
+    enable_response_cache: bool = False
+    response_cache_max_history: int = 10  # Skip caching once a conversation passes this many messages
+    max_message_bytes: int = 1_000_000  # Reject larger user messages before sending
 
 
 class ModelRoutingConfig(BaseModel):
@@ -3,15 +3,46 @@
 import hashlib
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
-from typing import Dict, List, Optional, Generator, Tuple, Any
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Generator, Tuple, Any
 
+import httpx
 import ollama
 import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
 from .config import Config, OllamaLocalConfig, OllamaCloudConfig
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; fall back to a linear trigger scan
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; fall back to the stdlib json module
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes without decoding to str first.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)
+
 
 class OllamaClient:
     """Wrapper for Ollama API interactions."""
@@ -24,25 +55,45 @@ class OllamaClient:
         """
         self.config = config
         self.model_type = config.model_type
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounded history: the deque evicts the oldest message in O(1) on append
+        self.conversation_history: Deque[Dict[str, str]] = deque(
+            maxlen=config.features.max_context_messages
+        )
+        # Messages added since the last clear; unlike the history itself this
+        # is not reduced when chat() trims old turns
+        self._messages_added = 0
 
         if self.model_type == "local":
             self.model_config = config.ollama.local
         else:
             self.model_config = config.ollama.cloud
 
+        # Shared HTTP session so cloud calls reuse keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._configure_session()
+
+        # Local streaming client, created on first use
+        self._stream_client: Optional[ollama.Client] = None
+        self._stream_client_timeout: Optional[float] = None
+
         # Model routing enabled?
         self.routing_enabled = getattr(config, "enable_model_routing", False)
         self.routing_config = getattr(config, "model_routing", None)
+        self._build_router()
 
-        # Important keywords for smart trimming
-        self.important_keywords = ["created", "error", "warning", "file", "installed", "configured"]
-
-        # Response cache (simple in-memory cache)
-        self.response_cache: Dict[str, Tuple[str, float]] = {}  # hash -> (response, timestamp)
+        # Response cache (in-memory LRU keyed on model, sampling params and recent turns)
+        self.response_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
         self.cache_ttl_seconds = 3600  # 1 hour
-        self.cache_max_size = 100
+        self.cache_max_size = 128
+        self.cache_context_messages = 3  # Only the last K messages feed the key
         self.cache_enabled = getattr(config.features, "enable_response_cache", False)
+        self.cache_max_history = getattr(config.features, "response_cache_max_history", 10)
+
+        # Upper bound on a single user message, in UTF-8 bytes
+        self.max_message_bytes = getattr(config.features, "max_message_bytes", 1_000_000)
 
     def switch_mode(self, model_type: str) -> None:
         """Switch between local and cloud modes without re-instantiating.
@@ -55,8 +106,18 @@ class OllamaClient:
 
         self.model_type = model_type
         self.model_config = self.config.ollama.local if model_type == "local" else self.config.ollama.cloud
+        self._configure_session()
+        self._build_router()
         self.clear_history()
 
+    def _configure_session(self) -> None:
+        """Set default headers on the HTTP session for the active mode."""
+        self._session.headers["Content-Type"] = "application/json"
+        if self.model_type == "cloud":
+            self._session.headers["Authorization"] = f"Bearer {self.model_config.api_key}"
+        else:
+            self._session.headers.pop("Authorization", None)
+
     def set_default_model(self, model_name: str) -> None:
         """Update the default model for the active mode."""
         self.model_config.model = model_name
@@ -64,6 +125,47 @@ class OllamaClient:
             self.config.ollama.local.model = model_name
         else:
             self.config.ollama.cloud.model = model_name
+        self._build_router()
+
+    def _build_router(self) -> None:
+        """Precompile routing triggers into a lowercase lookup table.
+
+        Triggers are stored as (priority, model) pairs so the first configured
+        trigger still wins when several match the same message.
+        """
+        self._trigger_table: List[Tuple[str, Tuple[int, str]]] = []
+        self._ac = None
+        # Routing decisions for recently seen messages, keyed on a digest of the
+        # lowercased text so large messages are not kept alive; invalid once
+        # the table changes
+        self._route_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self.route_cache_max_size = 256
+        self._default_model = self.model_config.model
+
+        if not self.routing_enabled or not self.routing_config:
+            return
+
+        routing = self.routing_config
+        if not isinstance(routing, dict):
+            routing = routing.dict()
+
+        self._default_model = routing.get("default_model") or self.model_config.model
+
+        priority = 0
+        for model_info in routing.get("models", {}).values():
+            model = model_info.get("model", self._default_model)
+            for trigger in model_info.get("triggers", []):
+                self._trigger_table.append((trigger.lower(), (priority, model)))
+                priority += 1
+
+        if ahocorasick is not None and self._trigger_table:
+            automaton = ahocorasick.Automaton()
+            for trigger, value in self._trigger_table:
+                # Keep the earliest priority if a trigger is listed twice
+                if trigger not in automaton:
+                    automaton.add_word(trigger, value)
+            automaton.make_automaton()
+            self._ac = automaton
 
     def _select_model(self, user_message: str) -> str:
         """Select the best model for the given message.
@@ -78,25 +180,39 @@ class OllamaClient:
         if not self.routing_enabled or not self.routing_config:
             return self.model_config.model
 
-        # Get default model from routing config
-        default_model = self.routing_config.get("default_model", self.model_config.model)
+        if not self._trigger_table:
+            return self._default_model
 
-        # Check message against triggers
         message_lower = user_message.lower()
-        models_dict = self.routing_config.get("models", {})
+        cache_key = hashlib.blake2b(
+            message_lower.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            self._route_cache.move_to_end(cache_key)
+            return cached
+
+        if self._ac is not None:
+            # Single pass over the message; pick the highest-priority hit
+            match = min((value for _, value in self._ac.iter(message_lower)), default=None)
+        else:
+            match = next(
+                (value for trigger, value in self._trigger_table if trigger in message_lower),
+                None
+            )
 
-        # Check each model type's triggers
-        for model_type, model_info in models_dict.items():
-            triggers = model_info.get("triggers", [])
-            for trigger in triggers:
-                if trigger.lower() in message_lower:
-                    selected = model_info.get("model", default_model)
-                    logger.debug(f"Model routing: '{trigger}' matched -> {selected}")
-                    return selected
+        if match:
+            logger.debug(f"Model routing: trigger matched -> {match[1]}")
+            model = match[1]
+        else:
+            logger.debug(f"Model routing: No triggers matched -> {self._default_model}")
+            model = self._default_model
 
-        # No triggers matched, use default
-        logger.debug(f"Model routing: No triggers matched -> {default_model}")
-        return default_model
+        self._route_cache[cache_key] = model
+        if len(self._route_cache) > self.route_cache_max_size:
+            self._route_cache.popitem(last=False)
+        return model
 
     def chat(self, message: str, stream: bool = False, override_model: Optional[str] = None) -> str:
         """Send a chat message to Ollama.
@@ -110,28 +226,30 @@ class OllamaClient:
             Assistant's response.
 
         Raises:
+            ValueError: If the message exceeds the configured size limit.
             Exception: If the request fails.
         """
+        self._check_message_size(message)
+
         # Compact history to avoid long prompts / truncation
         self._shrink_history(max_messages=6, max_chars=2000)
 
         # Select model based on message content (unless overridden)
         selected_model = override_model or self._select_model(message)
 
+        # Add user message to history with smart trimming
+        self._add_to_history("user", message)
+
         # Check cache for non-streaming requests
+        cache_key = None
         if not stream and self.cache_enabled:
-            cache_key = self._get_cache_key(message, selected_model)
-            cached_response = self._get_from_cache(cache_key)
-            if cached_response:
+            cache_key = self._get_cache_key(selected_model)
+            cached_response = self._get_from_cache(cache_key) if cache_key else None
+            if cached_response is not None:
                 logger.debug(f"Cache hit for message: {message[:50]}...")
-                # Add to history
-                self._add_to_history("user", message)
                 self._add_to_history("assistant", cached_response)
                 return cached_response
 
-        # Add user message to history with smart trimming
-        self._add_to_history("user", message)
-
         try:
             if stream:
                 response = self._stream_chat(selected_model)
@@ -139,7 +257,7 @@ class OllamaClient:
                 response = self._standard_chat(selected_model)
 
             # Cache the response for non-streaming requests
-            if not stream and self.cache_enabled:
+            if cache_key:
                 self._add_to_cache(cache_key, response)
 
             return response
@@ -173,7 +291,7 @@ class OllamaClient:
         try:
             response = ollama.chat(
                 model=model,
-                messages=self.conversation_history,
+                messages=self._compact_history(),
                 options={
                     "temperature": self.model_config.temperature,
                     "top_p": self.model_config.top_p,
@@ -199,14 +317,9 @@ class OllamaClient:
         """
         cloud_config: OllamaCloudConfig = self.model_config
 
-        headers = {
-            "Authorization": f"Bearer {cloud_config.api_key}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": cloud_config.model,
-            "messages": self.conversation_history,
+            "messages": self._compact_history(),
             "temperature": cloud_config.temperature,
             "top_p": cloud_config.top_p,
             # Force non-streaming responses so we can parse a single JSON object
@@ -214,20 +327,19 @@ class OllamaClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{cloud_config.endpoint}/api/chat",
-                headers=headers,
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=cloud_config.timeout
             )
             response.raise_for_status()
 
             try:
-                result = response.json()
+                result = _json_loads(response.content)
             except json.JSONDecodeError:
                 # Some endpoints may return newline-delimited JSON chunks; parse the first one
-                first_line = response.text.strip().splitlines()[0]
-                result = json.loads(first_line)
+                first_line = response.content.strip().splitlines()[0]
+                result = _json_loads(first_line)
 
             assistant_message = result['message']['content']
 
@@ -254,9 +366,11 @@ class OllamaClient:
         stall_timeout = min(configured_timeout, 90)
 
         if self.model_type == "local":
-            stream = ollama.chat(
+            # The client's read timeout bounds the wait for each chunk, so a
+            # stalled model raises at the socket instead of hanging the loop
+            stream = self._get_stream_client(stall_timeout).chat(
                 model=model,
-                messages=self.conversation_history,
+                messages=self._compact_history(),
                 stream=True,
                 options={
                     "temperature": self.model_config.temperature,
@@ -265,66 +379,63 @@ class OllamaClient:
             )
 
             full_response = ""
-            with ThreadPoolExecutor(max_workers=1) as pool:
-                iterator = iter(stream)
-                while True:
-                    future = pool.submit(next, iterator, None)
-                    try:
-                        chunk = future.result(timeout=stall_timeout)
-                    except FuturesTimeout:
-                        future.cancel()
-                        raise TimeoutError(
-                            "No tokens received from local model within timeout window"
-                        )
-
-                    if chunk is None:
-                        break
-
+            try:
+                for chunk in stream:
                     content = chunk['message']['content']
                     full_response += content
                     yield content
+            except httpx.TimeoutException:
+                raise TimeoutError(
+                    "No tokens received from local model within timeout window"
+                )
 
             # Add complete response to history with smart trimming
             self._add_to_history("assistant", full_response)
         else:
             yield from self._stream_cloud_chat(stall_timeout)
 
+    def _get_stream_client(self, stall_timeout: float) -> ollama.Client:
+        """Get a local Ollama client whose read timeout matches the stall window.
+
+        Args:
+            stall_timeout: Seconds to wait for the next chunk before failing.
+
+        Returns:
+            Cached Ollama client.
+        """
+        if self._stream_client is None or self._stream_client_timeout != stall_timeout:
+            self._stream_client = ollama.Client(timeout=stall_timeout)
+            self._stream_client_timeout = stall_timeout
+        return self._stream_client
+
     def _stream_cloud_chat(self, stall_timeout: Optional[int] = None) -> Generator[str, None, None]:
         """Stream chat responses from Ollama Cloud when available."""
         cloud_config: OllamaCloudConfig = self.model_config
-        headers = {
-            "Authorization": f"Bearer {cloud_config.api_key}",
-            "Content-Type": "application/json"
-        }
 
         payload = {
             "model": cloud_config.model,
-            "messages": self.conversation_history,
+            "messages": self._compact_history(),
             "temperature": cloud_config.temperature,
             "top_p": cloud_config.top_p,
             "stream": True,
         }
+        # Encode the (potentially large) history once, up front, and hand the
+        # transport a ready byte buffer with its length
+        body = _json_dumps(payload)
 
         full_response = ""
         last_chunk_time = time.time()
         try:
-            with requests.post(
+            with self._session.post(
                 f"{cloud_config.endpoint}/api/chat",
-                headers=headers,
-                json=payload,
+                data=body,
+                headers={"Content-Length": str(len(body))},
                 timeout=cloud_config.timeout,
                 stream=True,
             ) as response:
                 response.raise_for_status()
 
-                for line in response.iter_lines():
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line.decode("utf-8"))
-                    except json.JSONDecodeError:
-                        continue
-
+                for data in self._iter_ndjson(response):
                     content = data.get("message", {}).get("content") or data.get("content")
                     if content:
                         full_response += content
@@ -345,28 +456,90 @@ class OllamaClient:
         if full_response:
             self._add_to_history("assistant", full_response)
 
+    @staticmethod
+    def _iter_ndjson(response: requests.Response, chunk_size: int = 8192) -> Generator[Dict[str, Any], None, None]:
+        """Parse a newline-delimited JSON response body as it arrives.
+
+        Splits raw byte chunks on newlines and parses each line as bytes, skipping
+        per-line UTF-8 decoding and any lines that are not valid JSON.
+
+        Args:
+            response: Streaming response to read from.
+            chunk_size: Number of bytes to read per chunk.
+
+        Yields:
+            Parsed JSON objects.
+        """
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            buffer += chunk
+            if b"\n" not in chunk:
+                continue
+            *lines, tail = buffer.split(b"\n")
+            buffer = bytearray(tail)
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    yield _json_loads(bytes(line))
+                except json.JSONDecodeError:
+                    continue
+
+        if buffer.strip():
+            try:
+                yield _json_loads(bytes(buffer))
+            except json.JSONDecodeError:
+                pass
+
     def clear_history(self) -> None:
-        """Clear conversation history."""
-        self.conversation_history = []
+        """Clear conversation history, keeping the system prompt.
+
+        Keeping the system message as the first entry means the next request
+        starts with the same prompt prefix, so Ollama can reuse its KV cache
+        for it instead of re-processing the prompt.
+        """
+        system = self._pop_system_message()
+        self.conversation_history.clear()
+        self._messages_added = 0
+        if system:
+            self.conversation_history.append(system)
         logger.info("Conversation history cleared")
 
+    @property
+    def _has_system(self) -> bool:
+        """Whether the history starts with a system message."""
+        history = self.conversation_history
+        return bool(history) and history[0].get("role") == "system"
+
+    def _pop_system_message(self) -> Optional[Dict[str, Any]]:
+        """Remove and return the leading system message, if any.
+
+        Returns:
+            The system message or None.
+        """
+        if self._has_system:
+            return self.conversation_history.popleft()
+        return None
+
     def set_system_prompt(self, system_prompt: str) -> None:
         """Set a system prompt for the conversation.
 
         Args:
             system_prompt: System instructions for the model.
         """
-        # Remove existing system message if present
-        self.conversation_history = [
-            msg for msg in self.conversation_history
-            if msg.get("role") != "system"
-        ]
-
-        # Add new system message at the beginning
-        self.conversation_history.insert(0, {
+        system_message = {
             "role": "system",
             "content": system_prompt
-        })
+        }
+        history = self.conversation_history
+
+        # The system message always lives at index 0, so replacing it is O(1)
+        if self._has_system:
+            history[0] = system_message
+        else:
+            if len(history) == history.maxlen:
+                history.popleft()  # Make room without evicting the newest turn
+            history.appendleft(system_message)
 
         logger.info("System prompt set")
 
@@ -384,12 +557,8 @@ class OllamaClient:
             else:
                 # Try to ping cloud endpoint
                 cloud_config: OllamaCloudConfig = self.model_config
-                headers = {
-                    "Authorization": f"Bearer {cloud_config.api_key}",
-                }
-                response = requests.get(
+                response = self._session.get(
                     f"{cloud_config.endpoint}/api/tags",
-                    headers=headers,
                     timeout=5
                 )
                 return response.status_code == 200
@@ -415,7 +584,11 @@ class OllamaClient:
             return []
 
     def _add_to_history(self, role: str, content: str) -> None:
-        """Add message to conversation history with smart context management.
+        """Add message to conversation history.
+
+        The history deque is bounded by ``max_context_messages`` so the oldest
+        message is dropped automatically once the limit is reached. A leading
+        system prompt is never evicted.
 
         Args:
             role: Message role (user, assistant, system).
@@ -423,46 +596,82 @@ class OllamaClient:
         """
         from datetime import datetime
 
-        self.conversation_history.append({
+        max_messages = self.config.features.max_context_messages
+        if self.conversation_history.maxlen != max_messages:
+            # Limit changed at runtime; rebuild with the new bound
+            self.conversation_history = deque(self.conversation_history, maxlen=max_messages)
+
+        history = self.conversation_history
+        if 1 < max_messages == len(history) and self._has_system:
+            # Evict the oldest non-system message so the system prompt stays first
+            system = history.popleft()
+            history.popleft()
+            history.appendleft(system)
+
+        history.append({
             "role": role,
             "content": content,
             "timestamp": datetime.now().isoformat()
         })
+        if role != "system":
+            self._messages_added += 1
 
-        max_messages = self.config.features.max_context_messages
+    def _compact_history(self) -> List[Dict[str, Any]]:
+        """Build a copy of the history to send to the model.
+
+        History itself is left untouched. Messages are reduced to the fields
+        the API uses, dropping local metadata such as timestamps.
 
-        # Smart trimming: Keep recent messages + important context
-        if len(self.conversation_history) > max_messages:
-            # Always keep the most recent messages
-            recent = self.conversation_history[-max_messages:]
+        Returns:
+            List of message dicts ready for the chat API.
+        """
+        return [
+            {"role": msg["role"], "content": msg.get("content", "")}
+            for msg in self.conversation_history
+        ]
 
-            # Keep important messages from earlier (file creations, errors, etc.)
-            important_old = [
-                msg for msg in self.conversation_history[:-max_messages]
-                if any(keyword in msg["content"].lower() for keyword in self.important_keywords)
-            ]
+    def _check_message_size(self, message: str) -> None:
+        """Reject a message whose UTF-8 encoding exceeds ``max_message_bytes``.
 
-            # Combine: up to 3 important old messages + all recent messages
-            self.conversation_history = important_old[-3:] + recent
+        Args:
+            message: Message to check.
+
+        Raises:
+            ValueError: If the message is too large.
+        """
+        limit = self.max_message_bytes
+        # UTF-8 uses at most 4 bytes per character, so short messages skip encoding
+        if not limit or len(message) * 4 <= limit:
+            return
+        size = len(message.encode("utf-8", errors="ignore"))
+        if size > limit:
+            raise ValueError(
+                f"Message is too large ({size} bytes, limit is {limit} bytes)"
+            )
 
     def _shrink_history(self, max_messages: int = 6, max_chars: int = 2000) -> None:
-        """Trim conversation history aggressively to avoid prompt truncation and repeated answers."""
+        """Trim conversation history aggressively to avoid prompt truncation and repeated answers.
+
+        The system prompt is always kept at the front so every request shares
+        the same prefix and the server-side KV cache stays warm.
+        """
+        history = self.conversation_history
+        system = self._pop_system_message()
+        if system:
+            max_messages -= 1
+            max_chars -= len(system.get("content", ""))
+
         # Limit by message count first
-        if len(self.conversation_history) > max_messages:
-            self.conversation_history = self.conversation_history[-max_messages:]
-
-        # Limit by total character length
-        total_chars = sum(len(msg.get("content", "")) for msg in self.conversation_history)
-        if total_chars > max_chars:
-            trimmed: list[Dict[str, Any]] = []
-            running = 0
-            for msg in reversed(self.conversation_history):
-                content_len = len(msg.get("content", ""))
-                if running + content_len > max_chars:
-                    break
-                trimmed.append(msg)
-                running += content_len
-            self.conversation_history = list(reversed(trimmed))
+        while len(history) > max_messages:
+            history.popleft()
+
+        # Limit by total character length, dropping the oldest messages first
+        total_chars = sum(len(msg.get("content", "")) for msg in history)
+        while history and total_chars > max_chars:
+            total_chars -= len(history.popleft().get("content", ""))
+
+        if system:
+            history.appendleft(system)
 
     def get_display_history(self) -> List[Dict[str, Any]]:
         """Get conversation history for display purposes.
@@ -470,7 +679,7 @@ class OllamaClient:
         Returns:
             Copy of conversation history.
         """
-        return self.conversation_history.copy()
+        return list(self.conversation_history)
 
     def get_history_count(self) -> int:
         """Get the number of messages in history.
@@ -480,23 +689,43 @@ class OllamaClient:
         """
         return len(self.conversation_history)
 
-    def _get_cache_key(self, message: str, model: str) -> str:
-        """Generate a cache key from message and model.
+    def _get_cache_key(self, model: str) -> Optional[bytes]:
+        """Generate a cache key from the most recent turns and sampling params.
+
+        Only the last few messages are hashed so the key stays stable as the
+        history grows. Conversations longer than ``cache_max_history``
+        messages (counted since the last clear, before any trimming) are not
+        cached at all, because the answer likely depends on earlier context.
 
         Args:
-            message: The message to cache.
             model: The model used.
 
         Returns:
-            Hash string for cache key.
+            Digest bytes for the cache key, or None if caching should be skipped.
         """
-        # Include recent context in cache key
-        recent_context = self.conversation_history[-3:] if len(self.conversation_history) >= 3 else []
-        context_str = json.dumps([{"role": m["role"], "content": m["content"]} for m in recent_context])
-        key_string = f"{model}:{message}:{context_str}"
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        if self._messages_added > self.cache_max_history:
+            return None
 
-    def _get_from_cache(self, cache_key: str) -> Optional[str]:
+        recent = [
+            {"role": m["role"], "content": m["content"]}
+            for m in islice(
+                self.conversation_history,
+                max(0, len(self.conversation_history) - self.cache_context_messages),
+                None
+            )
+        ]
+        key_data = {
+            "model": model,
+            "temperature": self.model_config.temperature,
+            "top_p": self.model_config.top_p,
+            "messages": recent,
+        }
+        return hashlib.blake2b(
+            json.dumps(key_data, sort_keys=True).encode(),
+            digest_size=16
+        ).digest()
+
+    def _get_from_cache(self, cache_key: bytes) -> Optional[str]:
         """Get response from cache if available and fresh.
 
         Args:
@@ -505,32 +734,31 @@ class OllamaClient:
         Returns:
             Cached response or None.
         """
-        if cache_key not in self.response_cache:
+        entry = self.response_cache.get(cache_key)
+        if entry is None:
             return None
 
-        response, timestamp = self.response_cache[cache_key]
+        response, timestamp = entry
 
         # Check if cache entry is still fresh
         if time.time() - timestamp > self.cache_ttl_seconds:
             del self.response_cache[cache_key]
             return None
 
+        self.response_cache.move_to_end(cache_key)
         return response
 
-    def _add_to_cache(self, cache_key: str, response: str) -> None:
-        """Add response to cache.
+    def _add_to_cache(self, cache_key: bytes, response: str) -> None:
+        """Add response to cache, evicting the least recently used entry.
 
         Args:
             cache_key: Cache key.
             response: Response to cache.
         """
-        # Check cache size limit
-        if len(self.response_cache) >= self.cache_max_size:
-            # Remove oldest entry
-            oldest_key = min(self.response_cache.items(), key=lambda x: x[1][1])[0]
-            del self.response_cache[oldest_key]
-
         self.response_cache[cache_key] = (response, time.time())
+        self.response_cache.move_to_end(cache_key)
+        if len(self.response_cache) > self.cache_max_size:
+            self.response_cache.popitem(last=False)
         logger.debug(f"Cached response (size: {len(self.response_cache)})")
 
     def clear_response_cache(self) -> None:
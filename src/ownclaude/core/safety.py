@@ -1,11 +1,13 @@
 """Safety and permissions system for PBOS AI."""
 
 import json
+import os
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from collections import deque
+from collections import OrderedDict
 
 from loguru import logger
 
@@ -31,9 +33,66 @@ class OperationType(Enum):
     SYSTEM_COMMAND = "system_command"
 
 
+# Permission groups: operation types gated by the same SystemPermissions flag
+_APP_OPS = frozenset({
+    OperationType.APP_OPEN,
+    OperationType.APP_CLOSE,
+})
+
+_FILE_OPS = frozenset({
+    OperationType.FILE_CREATE,
+    OperationType.FILE_APPEND,
+    OperationType.FILE_MODIFY,
+    OperationType.FILE_DELETE,
+    OperationType.FILE_READ,
+    OperationType.FILE_OPEN,
+    OperationType.FILE_SEARCH,
+    OperationType.DIR_CREATE,
+    OperationType.DIR_DELETE,
+    OperationType.DIR_LIST,
+})
+
+_BROWSER_OPS = frozenset({
+    OperationType.BROWSER_OPEN,
+    OperationType.BROWSER_CLOSE,
+})
+
+_SYSTEM_OPS = frozenset({
+    OperationType.SYSTEM_COMMAND,
+})
+
+# (group, SystemPermissions attribute, denial message)
+_PERMISSION_TABLE = (
+    (_APP_OPS, "allow_app_control", "Application control is disabled"),
+    (_FILE_OPS, "allow_file_operations", "File operations are disabled"),
+    (_BROWSER_OPS, "allow_browser_control", "Browser control is disabled"),
+    (_SYSTEM_OPS, "allow_system_commands", "System commands are disabled"),
+)
+
+# Operation type -> ConfirmationSettings attribute
+_CONFIRMATION_MAP = {
+    OperationType.FILE_DELETE: "file_deletion",
+    OperationType.DIR_DELETE: "file_deletion",
+    OperationType.APP_CLOSE: "app_closure",
+    OperationType.SYSTEM_COMMAND: "system_commands",
+    OperationType.FILE_MODIFY: "file_modification",
+    OperationType.FILE_APPEND: "file_modification",
+}
+
+# One bit per operation type, so permission state packs into a single int
+_OP_BIT = {op: 1 << index for index, op in enumerate(OperationType)}
+
+_DENIALS = {
+    op: denial for group, _, denial in _PERMISSION_TABLE for op in group
+}
+
+
 class Operation:
     """Represents an operation to be performed."""
 
+    # Slots keep the per-instance footprint small for recorded operations
+    __slots__ = ("operation_type", "target", "details", "_created_ns", "_id", "_timestamp")
+
     def __init__(
         self,
         operation_type: OperationType,
@@ -50,8 +109,24 @@ class Operation:
         self.operation_type = operation_type
         self.target = target
         self.details = details or {}
-        self.timestamp = datetime.now()
-        self.id = f"{self.timestamp.timestamp()}_{operation_type.value}"
+        # Capture creation time cheaply; id and datetime are built on first use
+        self._created_ns = time.time_ns()
+        self._id: Optional[str] = None
+        self._timestamp: Optional[datetime] = None
+
+    @property
+    def id(self) -> str:
+        """Unique operation id derived from the creation time and type."""
+        if self._id is None:
+            self._id = f"{self._created_ns}_{self.operation_type.value}"
+        return self._id
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local creation time of the operation."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created_ns / 1_000_000_000)
+        return self._timestamp
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert operation to dictionary.
@@ -78,8 +153,12 @@ class RollbackManager:
             max_operations: Maximum number of operations to keep for rollback.
         """
         self.max_operations = max_operations
-        self.operations: deque = deque(maxlen=max_operations)
-        self.rollback_data: Dict[str, Any] = {}
+        # Insertion-ordered id -> (operation, rollback info). Keeping both in
+        # one entry means evicting the oldest operation frees its rollback
+        # data (which may hold full file contents) in the same step.
+        self.operations: "OrderedDict[str, tuple[Operation, Optional[dict]]]" = (
+            OrderedDict()
+        )
 
     def record_operation(
         self,
@@ -92,9 +171,10 @@ class RollbackManager:
             operation: The operation that was performed.
             rollback_info: Information needed to rollback the operation.
         """
-        self.operations.append(operation)
-        if rollback_info:
-            self.rollback_data[operation.id] = rollback_info
+        self.operations[operation.id] = (operation, rollback_info or None)
+        self.operations.move_to_end(operation.id)
+        while len(self.operations) > self.max_operations:
+            self.operations.popitem(last=False)
         logger.debug(f"Recorded operation: {operation.operation_type.value}")
 
     def can_rollback(self, operation_id: str) -> bool:
@@ -106,7 +186,8 @@ class RollbackManager:
         Returns:
             True if rollback is possible, False otherwise.
         """
-        return operation_id in self.rollback_data
+        entry = self.operations.get(operation_id)
+        return entry is not None and entry[1] is not None
 
     def rollback(self, operation_id: str) -> bool:
         """Attempt to rollback an operation.
@@ -121,14 +202,7 @@ class RollbackManager:
             logger.warning(f"Cannot rollback operation: {operation_id}")
             return False
 
-        rollback_info = self.rollback_data[operation_id]
-        operation = next(
-            (op for op in self.operations if op.id == operation_id),
-            None
-        )
-
-        if not operation:
-            return False
+        operation, rollback_info = self.operations[operation_id]
 
         try:
             # Perform rollback based on operation type
@@ -149,6 +223,21 @@ class RollbackManager:
                     logger.info(f"Rolled back file deletion: {file_path}")
                     return True
 
+            elif (
+                operation.operation_type == OperationType.FILE_APPEND
+                and 'original_size' in rollback_info
+            ):
+                # Cut the file back to its old length, or remove it if the
+                # append created it
+                file_path = Path(rollback_info['path'])
+                original_size = rollback_info['original_size']
+                if original_size is None:
+                    file_path.unlink(missing_ok=True)
+                else:
+                    os.truncate(file_path, original_size)
+                logger.info(f"Rolled back file append: {file_path}")
+                return True
+
             elif operation.operation_type in (
                 OperationType.FILE_MODIFY,
                 OperationType.FILE_APPEND
@@ -175,12 +264,11 @@ class RollbackManager:
         Returns:
             List of operations as dictionaries.
         """
-        return [op.to_dict() for op in self.operations]
+        return [op.to_dict() for op, _ in self.operations.values()]
 
     def clear(self) -> None:
         """Clear operation history."""
         self.operations.clear()
-        self.rollback_data.clear()
         logger.info("Operation history cleared")
 
 
@@ -199,6 +287,33 @@ class SafetyManager:
         self.rollback_manager = RollbackManager(
             max_operations=self.security.max_rollback_operations
         )
+        # (exact, prefix) string pairs so the hot check is plain str comparisons
+        self._sensitive_prefixes: List[tuple[str, str]] = []
+        for sensitive in self.security.sensitive_paths:
+            resolved = os.path.realpath(sensitive)
+            self._sensitive_prefixes.append((resolved, resolved.rstrip(os.sep) + os.sep))
+        self.refresh_permissions()
+
+    def refresh_permissions(self) -> None:
+        """Recompute the permission and confirmation bitmasks.
+
+        Call this after changing ``self.permissions`` at runtime.
+        """
+        allowed = 0
+        for op_type, bit in _OP_BIT.items():
+            if op_type not in _DENIALS:
+                allowed |= bit
+        for group, permission, _ in _PERMISSION_TABLE:
+            if getattr(self.permissions, permission):
+                for op_type in group:
+                    allowed |= _OP_BIT[op_type]
+        self._allowed_mask = allowed
+
+        confirm = 0
+        for op_type, setting in _CONFIRMATION_MAP.items():
+            if getattr(self.permissions.require_confirmation, setting):
+                confirm |= _OP_BIT[op_type]
+        self._confirmation_mask = confirm
 
     def check_permission(self, operation: Operation) -> tuple[bool, Optional[str]]:
         """Check if an operation is permitted.
@@ -209,43 +324,15 @@ class SafetyManager:
         Returns:
             Tuple of (is_permitted, reason_if_denied).
         """
+        op_type = operation.operation_type
+
         # Check type-based permissions
-        if operation.operation_type in [
-            OperationType.APP_OPEN,
-            OperationType.APP_CLOSE
-        ]:
-            if not self.permissions.allow_app_control:
-                return False, "Application control is disabled"
-
-        elif operation.operation_type in [
-            OperationType.FILE_CREATE,
-            OperationType.FILE_APPEND,
-            OperationType.FILE_MODIFY,
-            OperationType.FILE_DELETE,
-            OperationType.FILE_READ,
-            OperationType.FILE_OPEN,
-            OperationType.FILE_SEARCH,
-            OperationType.DIR_CREATE,
-            OperationType.DIR_DELETE,
-            OperationType.DIR_LIST
-        ]:
-            if not self.permissions.allow_file_operations:
-                return False, "File operations are disabled"
-
-            # Check sensitive paths
-            if self._is_sensitive_path(operation.target):
-                return False, f"Access to sensitive path denied: {operation.target}"
-
-        elif operation.operation_type in [
-            OperationType.BROWSER_OPEN,
-            OperationType.BROWSER_CLOSE
-        ]:
-            if not self.permissions.allow_browser_control:
-                return False, "Browser control is disabled"
-
-        elif operation.operation_type == OperationType.SYSTEM_COMMAND:
-            if not self.permissions.allow_system_commands:
-                return False, "System commands are disabled"
+        if not self._allowed_mask & _OP_BIT[op_type]:
+            return False, _DENIALS[op_type]
+
+        # Check sensitive paths
+        if op_type in _FILE_OPS and self._is_sensitive_path(operation.target):
+            return False, f"Access to sensitive path denied: {operation.target}"
 
         return True, None
 
@@ -258,24 +345,7 @@ class SafetyManager:
         Returns:
             True if confirmation is required, False otherwise.
         """
-        confirmations = self.permissions.require_confirmation
-
-        if operation.operation_type == OperationType.FILE_DELETE:
-            return confirmations.file_deletion
-
-        elif operation.operation_type == OperationType.DIR_DELETE:
-            return confirmations.file_deletion
-
-        elif operation.operation_type == OperationType.APP_CLOSE:
-            return confirmations.app_closure
-
-        elif operation.operation_type == OperationType.SYSTEM_COMMAND:
-            return confirmations.system_commands
-
-        elif operation.operation_type in (OperationType.FILE_MODIFY, OperationType.FILE_APPEND):
-            return confirmations.file_modification
-
-        return False
+        return bool(self._confirmation_mask & _OP_BIT[operation.operation_type])
 
     def _is_sensitive_path(self, path: str) -> bool:
         """Check if a path is in the sensitive paths list.
@@ -286,18 +356,13 @@ class SafetyManager:
         Returns:
             True if path is sensitive, False otherwise.
         """
-        path_obj = Path(path).resolve()
-
-        for sensitive in self.security.sensitive_paths:
-            sensitive_obj = Path(sensitive)
-            try:
-                # Check if path is within or is a sensitive path
-                path_obj.relative_to(sensitive_obj)
-                return True
-            except ValueError:
-                continue
-
-        return False
+        # Resolved on every call: a path can become a symlink into a
+        # sensitive directory after it was last checked
+        target = os.path.realpath(path)
+        return any(
+            target == exact or target.startswith(prefix)
+            for exact, prefix in self._sensitive_prefixes
+        )
 
     def log_operation(
         self,
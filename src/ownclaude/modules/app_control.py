@@ -2,13 +2,64 @@
 
 import os
 import platform
+import shutil
 import subprocess
+import time
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import psutil
 from loguru import logger
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; fall back to per-name substring checks
+    ahocorasick = None
+
+
+# Friendly names -> executables, per platform (keys are lowercase)
+_WIN_APPS = MappingProxyType({
+    "vscode": "code",
+    "vs code": "code",
+    "visual studio code": "code",
+    "code": "code",
+    "notepad": "notepad.exe",
+    "calculator": "calc.exe",
+    "paint": "mspaint.exe",
+    "cmd": "cmd.exe",
+    "powershell": "powershell.exe",
+    "explorer": "explorer.exe",
+    "excel": "excel.exe",
+    "word": "winword.exe",
+    "chrome": "chrome.exe",
+    "firefox": "firefox.exe",
+    "edge": "msedge.exe",
+})
+
+_MAC_APPS = MappingProxyType({
+    "safari": "Safari",
+    "chrome": "Google Chrome",
+    "firefox": "Firefox",
+    "mail": "Mail",
+    "notes": "Notes",
+    "calculator": "Calculator",
+    "terminal": "Terminal",
+    "finder": "Finder",
+    "excel": "Microsoft Excel",
+    "word": "Microsoft Word",
+})
+
+_LINUX_APPS = MappingProxyType({
+    "browser": "xdg-open http://",
+    "chrome": "google-chrome",
+    "firefox": "firefox",
+    "terminal": "gnome-terminal",
+    "files": "nautilus",
+    "calculator": "gnome-calculator",
+    "text": "gedit",
+})
+
 
 class AppController:
     """Controls application launching and management."""
@@ -18,6 +69,139 @@ class AppController:
         self.system = platform.system()
         self.running_apps = {}
 
+        # Lowercased process name -> processes, rebuilt at most every snapshot_ttl seconds
+        self.snapshot_ttl = 2.0
+        self._name_index: Dict[str, List[psutil.Process]] = {}
+        self._snapshot_ts = 0.0
+
+        # Command name -> absolute executable path (None if not on PATH)
+        self._executables: Dict[str, Optional[str]] = {}
+        self._vscode_path: Optional[str] = None
+
+        # Also warms psutil's Process cache so the first lookup isn't a cold walk
+        self._snapshot_names()
+
+    def refresh(self) -> None:
+        """Drop cached process and executable lookups so the next call starts fresh.
+
+        process_iter() reuses Process instances across calls; this is only
+        needed when a caller must not see any state carried over from them.
+        """
+        psutil.process_iter.cache_clear()
+        self._snapshot_ts = 0.0
+        self._executables.clear()
+        self._vscode_path = None
+
+    def _which(self, command: str) -> Optional[str]:
+        """Resolve a command to an absolute executable path, caching the result.
+
+        Args:
+            command: Command name or path.
+
+        Returns:
+            Absolute path, or None if it cannot be found.
+        """
+        if command not in self._executables:
+            self._executables[command] = shutil.which(command)
+        return self._executables[command]
+
+    def _find_vscode(self) -> str:
+        """Locate the VS Code executable on Windows, caching the result.
+
+        Returns:
+            Path to Code.exe if installed in a standard location, else "code".
+        """
+        if self._vscode_path is None:
+            candidates = [
+                Path(os.environ.get("ProgramFiles", "")) / "Microsoft VS Code" / "Code.exe",
+                Path(os.environ.get("ProgramFiles(x86)", "")) / "Microsoft VS Code" / "Code.exe",
+                Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Microsoft VS Code" / "Code.exe",
+            ]
+            self._vscode_path = next(
+                (str(candidate) for candidate in candidates if candidate.is_file()),
+                "code"
+            )
+        return self._vscode_path
+
+    def _spawn(self, argv: List[str]) -> subprocess.Popen:
+        """Start a background process without a shell.
+
+        The executable is passed as an absolute path with default fd handling
+        and no session changes, which lets subprocess use posix_spawn/vfork on
+        POSIX instead of fork+exec of this (possibly large) process.
+
+        Args:
+            argv: Command and arguments.
+
+        Returns:
+            The started process.
+
+        Raises:
+            FileNotFoundError: If the command is not on PATH.
+        """
+        executable = self._which(argv[0])
+        if executable is None:
+            raise FileNotFoundError(f"{argv[0]} not found on PATH")
+
+        kwargs = {}
+        if self.system == "Windows":
+            kwargs["creationflags"] = subprocess.DETACHED_PROCESS
+        return subprocess.Popen(
+            [executable, *argv[1:]],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,  # Our fds are non-inheritable; True rules out posix_spawn
+            **kwargs
+        )
+
+    def _snapshot_names(self, force: bool = False) -> Dict[str, List[psutil.Process]]:
+        """Build (or reuse) the process name index.
+
+        The index keeps the Process objects from process_iter() rather than
+        bare pids: they remember each process' creation time, so signalling
+        one whose pid has since been reused raises NoSuchProcess.
+
+        Args:
+            force: Rebuild even if the current snapshot is still fresh.
+
+        Returns:
+            Mapping of lowercased process name to the processes running it.
+        """
+        now = time.monotonic()
+        if not force and now - self._snapshot_ts < self.snapshot_ttl:
+            return self._name_index
+
+        index: Dict[str, List[psutil.Process]] = {}
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if name:
+                index.setdefault(name.lower(), []).append(proc)
+
+        self._name_index = index
+        self._snapshot_ts = now
+        return index
+
+    def _match_processes(
+        self, app_name: str, index: Dict[str, List[psutil.Process]]
+    ) -> List[Tuple[psutil.Process, str]]:
+        """Find processes whose name contains ``app_name``.
+
+        Args:
+            app_name: Name (or part of a name) to look for.
+            index: Name index from _snapshot_names().
+
+        Returns:
+            List of (process, process name) pairs.
+        """
+        needle = app_name.lower()
+        return [
+            (proc, name)
+            for name, procs in index.items()
+            if needle in name
+            for proc in procs
+        ]
+
     def open_application(self, app_name: str) -> tuple[bool, str]:
         """Open an application by name.
 
@@ -49,41 +233,19 @@ class AppController:
         Returns:
             Tuple of (success, message).
         """
-        # Common Windows applications
-        app_mappings = {
-            "vscode": "code",
-            "vs code": "code",
-            "visual studio code": "code",
-            "code": "code",
-            "notepad": "notepad.exe",
-            "calculator": "calc.exe",
-            "paint": "mspaint.exe",
-            "cmd": "cmd.exe",
-            "powershell": "powershell.exe",
-            "explorer": "explorer.exe",
-            "excel": "excel.exe",
-            "word": "winword.exe",
-            "chrome": "chrome.exe",
-            "firefox": "firefox.exe",
-            "edge": "msedge.exe",
-        }
-
-        app_to_open = app_mappings.get(app_name.lower(), app_name)
+        app_to_open = _WIN_APPS.get(app_name.lower(), app_name)
 
         # Special handling for VS Code to find the actual executable if "code" isn't on PATH
         if app_to_open.lower() == "code":
-            candidates = [
-                Path(os.environ.get("ProgramFiles", "")) / "Microsoft VS Code" / "Code.exe",
-                Path(os.environ.get("ProgramFiles(x86)", "")) / "Microsoft VS Code" / "Code.exe",
-                Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Microsoft VS Code" / "Code.exe",
-            ]
-            for candidate in candidates:
-                if candidate.is_file():
-                    app_to_open = str(candidate)
-                    break
+            app_to_open = self._find_vscode()
 
         try:
-            subprocess.Popen(app_to_open, shell=True)
+            if self._which(app_to_open):
+                self._spawn([app_to_open])
+            else:
+                # Not on PATH (e.g. Office, browsers): let the shell's App Paths
+                # lookup find it without going through cmd.exe
+                os.startfile(app_to_open)
             return True, f"Opened {app_name}"
         except Exception as e:
             return False, f"Failed to open {app_name}: {e}"
@@ -97,24 +259,10 @@ class AppController:
         Returns:
             Tuple of (success, message).
         """
-        # Common macOS applications
-        app_mappings = {
-            "safari": "Safari",
-            "chrome": "Google Chrome",
-            "firefox": "Firefox",
-            "mail": "Mail",
-            "notes": "Notes",
-            "calculator": "Calculator",
-            "terminal": "Terminal",
-            "finder": "Finder",
-            "excel": "Microsoft Excel",
-            "word": "Microsoft Word",
-        }
-
-        app_to_open = app_mappings.get(app_name.lower(), app_name)
+        app_to_open = _MAC_APPS.get(app_name.lower(), app_name)
 
         try:
-            subprocess.Popen(["open", "-a", app_to_open])
+            self._spawn(["open", "-a", app_to_open])
             return True, f"Opened {app_name}"
         except Exception as e:
             return False, f"Failed to open {app_name}: {e}"
@@ -128,21 +276,12 @@ class AppController:
         Returns:
             Tuple of (success, message).
         """
-        # Common Linux applications
-        app_mappings = {
-            "browser": "xdg-open http://",
-            "chrome": "google-chrome",
-            "firefox": "firefox",
-            "terminal": "gnome-terminal",
-            "files": "nautilus",
-            "calculator": "gnome-calculator",
-            "text": "gedit",
-        }
-
-        app_to_open = app_mappings.get(app_name.lower(), app_name)
+        # Mapped commands may carry arguments; a raw name may be a path with spaces
+        mapped = _LINUX_APPS.get(app_name.lower())
+        argv = mapped.split() if mapped else [app_name]
 
         try:
-            subprocess.Popen([app_to_open], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self._spawn(argv)
             return True, f"Opened {app_name}"
         except Exception as e:
             return False, f"Failed to open {app_name}: {e}"
@@ -159,18 +298,20 @@ class AppController:
         """
         try:
             closed_count = 0
-            app_name_lower = app_name.lower()
 
-            for proc in psutil.process_iter(['pid', 'name']):
+            # A fresh snapshot, and the Process objects themselves rather than
+            # pids, so a process that exited (and had its pid reused) since the
+            # listing is never signalled
+            matches = self._match_processes(app_name, self._snapshot_names(force=True))
+
+            for proc, proc_name in matches:
                 try:
-                    proc_name = proc.info['name'].lower()
-                    if app_name_lower in proc_name:
-                        if force:
-                            proc.kill()
-                        else:
-                            proc.terminate()
-                        closed_count += 1
-                        logger.info(f"Closed process: {proc.info['name']} (PID: {proc.info['pid']})")
+                    if force:
+                        proc.kill()
+                    else:
+                        proc.terminate()
+                    closed_count += 1
+                    logger.info(f"Closed process: {proc_name} (PID: {proc.pid})")
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
@@ -192,17 +333,20 @@ class AppController:
         apps = []
         seen_names = set()
 
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+        # process_iter with attrs fills proc.info in a single oneshot() pass,
+        # so name and memory come from one read of the process' stat files
+        for proc in psutil.process_iter(['name', 'memory_info']):
             try:
                 info = proc.info
                 name = info['name']
 
                 # Skip system processes and duplicates
                 if name and name not in seen_names:
+                    memory = info['memory_info']
                     apps.append({
                         'name': name,
-                        'pid': info['pid'],
-                        'memory_mb': info['memory_info'].rss / (1024 * 1024)
+                        'pid': proc.pid,
+                        'memory_mb': memory.rss / (1024 * 1024) if memory else 0.0
                     })
                     seen_names.add(name)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -219,16 +363,62 @@ class AppController:
         Returns:
             True if running, False otherwise.
         """
-        app_name_lower = app_name.lower()
+        needle = app_name.lower()
+        index = self._snapshot_names()
+        if needle in index:
+            return True
+        return any(needle in name for name in index)
 
-        for proc in psutil.process_iter(['name']):
-            try:
-                if app_name_lower in proc.info['name'].lower():
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+    def build_matcher(self, names: Iterable[str]) -> Optional[Any]:
+        """Compile app names into a multi-pattern matcher.
+
+        Args:
+            names: Application names to look for.
+
+        Returns:
+            An Aho-Corasick automaton mapping each lowercased name back to the
+            original, or None if pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            if name:
+                automaton.add_word(name.lower(), name)
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+        return automaton
 
-        return False
+    def which_running(self, names: Iterable[str], matcher: Optional[Any] = None) -> Set[str]:
+        """Check several applications at once.
+
+        Each process name is scanned once against all requested names, instead
+        of once per name as repeated is_running() calls would.
+
+        Args:
+            names: Application names to check.
+            matcher: Optional automaton from build_matcher() to reuse across calls.
+
+        Returns:
+            The subset of names that are running.
+        """
+        names = [name for name in names if name]
+        index = self._snapshot_names()
+
+        matcher = matcher or self.build_matcher(names)
+        if matcher is None:
+            return {
+                name for name in names
+                if any(name.lower() in proc_name for proc_name in index)
+            }
+
+        running: Set[str] = set()
+        for proc_name in index:
+            for _, name in matcher.iter(proc_name):
+                running.add(name)
+        return running
 
     def open_url(self, url: str) -> tuple[bool, str]:
         """Open a URL in the default browser.
@@ -259,16 +449,26 @@ class AppController:
         """
         path = Path(file_path)
 
+        if self.system == "Windows":
+            # ShellExecute reports a missing file itself, so skip the extra stat
+            try:
+                os.startfile(str(path))
+                return True, f"Opened {file_path} with default application"
+            except FileNotFoundError:
+                return False, f"File not found: {file_path}"
+            except OSError as e:
+                logger.error(f"Failed to open file {file_path}: {e}")
+                return False, str(e)
+
+        # open/xdg-open return before the file is touched, so check up front
         if not path.exists():
             return False, f"File not found: {file_path}"
 
         try:
-            if self.system == "Windows":
-                subprocess.Popen(["start", "", str(path)], shell=True)
-            elif self.system == "Darwin":
-                subprocess.Popen(["open", str(path)])
+            if self.system == "Darwin":
+                self._spawn(["open", str(path)])
             elif self.system == "Linux":
-                subprocess.Popen(["xdg-open", str(path)])
+                self._spawn(["xdg-open", str(path)])
 
             return True, f"Opened {file_path} with default application"
         except Exception as e:
@@ -1,15 +1,31 @@
 """Code search and navigation tools for finding and analyzing code."""
 
+import os
 import re
 import ast
-from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+import base64
+import bisect
+import fnmatch
+import io
+import json
+import mmap
+import multiprocessing
+import shutil
+import subprocess
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from array import array
+from itertools import chain, islice, repeat
+from pathlib import Path, PurePath
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Any, FrozenSet, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchMatch:
     """Represents a search match in code."""
     file_path: Path
@@ -21,7 +37,7 @@ class SearchMatch:
     match_end: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeDefinition:
     """Represents a code definition (function, class, etc.)."""
     name: str
@@ -34,6 +50,451 @@ class CodeDefinition:
     parent: Optional[str]  # For methods, the class name
 
 
+@dataclass
+class SymbolTable:
+    """Definitions of one file, stored column-wise.
+
+    Filters scan a single column (usually ``names``) and only build
+    CodeDefinition objects for the rows that match.
+    """
+    file_path: Path
+    names: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    lines: array = field(default_factory=lambda: array('i'))
+    end_lines: array = field(default_factory=lambda: array('i'))  # 0 when unknown
+    parents: List[Optional[str]] = field(default_factory=list)
+    signatures: List[Optional[str]] = field(default_factory=list)
+    docstrings: List[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(
+        self,
+        name: str,
+        def_type: str,
+        line_number: int,
+        end_line: Optional[int],
+        signature: Optional[str],
+        docstring: Optional[str],
+        parent: Optional[str]
+    ) -> None:
+        """Add one definition as a new row."""
+        self.names.append(name)
+        self.types.append(def_type)
+        self.lines.append(line_number)
+        self.end_lines.append(end_line or 0)
+        self.signatures.append(signature)
+        self.docstrings.append(docstring)
+        self.parents.append(parent)
+
+    def definition(self, index: int) -> CodeDefinition:
+        """Materialize the definition stored at a row."""
+        return CodeDefinition(
+            name=self.names[index],
+            type=self.types[index],
+            file_path=self.file_path,
+            line_number=self.lines[index],
+            end_line=self.end_lines[index] or None,
+            signature=self.signatures[index],
+            docstring=self.docstrings[index],
+            parent=self.parents[index]
+        )
+
+    def definitions(self, indices: Optional[Iterable[int]] = None) -> List[CodeDefinition]:
+        """Materialize the given rows, or every row when no indices are given."""
+        if indices is None:
+            indices = range(len(self.names))
+        return [self.definition(index) for index in indices]
+
+
+# CodeDefinition.type -> get_file_symbols() bucket
+_SYMBOL_KEYS = {'class': 'classes', 'function': 'functions', 'method': 'methods'}
+
+
+def _source_lines(source: str) -> List[str]:
+    """Split source into lines, keeping line ends, the way the parser counts them.
+
+    Only ``\\r\\n``, ``\\r`` and ``\\n`` end a line. ``str.splitlines`` also
+    breaks on form feeds and other separators, which would shift every
+    later ``lineno``.
+    """
+    return io.StringIO(source, newline='').readlines()
+
+
+def _src_slice(source_lines: List[str], node: ast.AST) -> str:
+    """Return the source text of a node by slicing the original lines.
+
+    Column offsets from the parser are UTF-8 byte offsets, so lines with
+    non-ASCII text are sliced as bytes.
+
+    Args:
+        source_lines: Source split into lines by ``_source_lines``.
+        node: Node with position information.
+
+    Returns:
+        The node's source text, with any line breaks collapsed to spaces.
+    """
+    first, last = node.lineno - 1, node.end_lineno - 1
+    if first == last:
+        line = source_lines[first]
+        if line.isascii():
+            return line[node.col_offset:node.end_col_offset]
+        return line.encode('utf-8')[node.col_offset:node.end_col_offset].decode('utf-8')
+
+    text = ''.join(source_lines[first:last + 1]).encode('utf-8')
+    last_start = len(text) - len(source_lines[last].encode('utf-8'))
+    text = text[node.col_offset:last_start + node.end_col_offset].decode('utf-8')
+    return ' '.join(text.split())
+
+
+def _function_signature(node: ast.AST, source_lines: List[str]) -> str:
+    """Build a ``def name(args) -> ret`` signature for a function node."""
+    args = []
+    for arg in node.args.args:
+        arg_str = arg.arg
+        if arg.annotation:
+            arg_str += f": {_src_slice(source_lines, arg.annotation)}"
+        args.append(arg_str)
+
+    signature = f"def {node.name}({', '.join(args)})"
+    if node.returns:
+        signature += f" -> {_src_slice(source_lines, node.returns)}"
+    return signature
+
+
+def _class_signature(node: ast.ClassDef, source_lines: List[str]) -> str:
+    """Build a ``class Name(Base, ...)`` signature for a class node."""
+    bases = [_src_slice(source_lines, base) for base in node.bases]
+    signature = f"class {node.name}"
+    if bases:
+        signature += f"({', '.join(bases)})"
+    return signature
+
+
+class _DefCollector(ast.NodeVisitor):
+    """Collect class and function definitions in a single tree traversal.
+
+    A scope stack records the enclosing definition while descending, so each
+    function knows whether it sits directly in a class body (a method) without
+    re-walking the tree.
+    """
+
+    def __init__(self, file_path: Path, source_lines: List[str]):
+        """Initialize the collector.
+
+        Args:
+            file_path: File the tree was parsed from.
+            source_lines: The parsed source, split with ``keepends=True``.
+        """
+        self.source_lines = source_lines
+        self.symbols = SymbolTable(file_path)
+        # Enclosing class name, or None for an enclosing function
+        self._scope: List[Optional[str]] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.symbols.append(
+            node.name, 'class', node.lineno, node.end_lineno,
+            _class_signature(node, self.source_lines),
+            ast.get_docstring(node), None
+        )
+
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def _visit_function(self, node: ast.AST) -> None:
+        parent = self._scope[-1] if self._scope else None
+        self.symbols.append(
+            node.name, 'method' if parent else 'function', node.lineno, node.end_lineno,
+            _function_signature(node, self.source_lines),
+            ast.get_docstring(node), parent
+        )
+
+        self._scope.append(None)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+
+_NEWLINE = re.compile(rb'\n')
+_NEWLINE_TEXT = re.compile(r'\n')
+_NON_ASCII = re.compile(rb'[\x80-\xff]')
+_DOTTED_NAME = re.compile(r'[\w.]+')
+
+_TODO_PATTERN = r'#\s*TODO|//\s*TODO|/\*\s*TODO'
+_TODO_RE = re.compile(_TODO_PATTERN, re.IGNORECASE | re.MULTILINE)
+
+# Files at least this large are mmap'd for grep rather than read into memory
+_MMAP_MIN_SIZE = 64 * 1024
+
+_IGNORE_PATTERNS = (
+    '.git', '__pycache__', 'node_modules', 'venv', '.venv',
+    'build', 'dist', '.tox', '.eggs', '*.pyc', '*.min.js'
+)
+
+
+@lru_cache(maxsize=8)
+def _split_ignore_patterns(patterns: Tuple[str, ...]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Split ignore patterns into directory names to prune and file suffixes to skip.
+
+    Args:
+        patterns: Ignore patterns, as passed to ripgrep's ``--glob !...``.
+
+    Returns:
+        Tuple of (directory names, file name suffixes).
+    """
+    dirs = frozenset(p for p in patterns if not p.startswith('*'))
+    suffixes = tuple(p[1:] for p in patterns if p.startswith('*'))
+    return dirs, suffixes
+
+
+@lru_cache(maxsize=64)
+def _glob_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a filename glob once; case-insensitive where the OS is."""
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def _bytes_twin(regex: "re.Pattern[str]") -> Optional["re.Pattern[bytes]"]:
+    """Compile an ASCII str pattern for bytes, or None if it isn't ASCII.
+
+    On ASCII data the twin matches exactly what the str pattern matches; a
+    non-ASCII pattern has no such twin (``[é]`` would become a byte class).
+    """
+    if not regex.pattern.isascii():
+        return None
+    return re.compile(regex.pattern.encode('ascii'), regex.flags & ~re.UNICODE)
+
+
+# Per-file workers live at module level so a process pool can pickle them
+
+def _grep_file(
+    file_path: Path,
+    regex: "re.Pattern[str]",
+    bytes_regex: Optional["re.Pattern[bytes]"],
+    context_lines: int,
+    max_results: int,
+    literal: Optional[bytes] = None,
+    ignore_case: bool = False
+) -> List[SearchMatch]:
+    """Search a single file for a compiled pattern.
+
+    ASCII files are scanned as one bytes buffer without decoding; line
+    numbers come from a newline index built only once the file is known to
+    match, and only the matched and context lines are decoded. Other files
+    are decoded first, so ``.``, ``\\w`` and character classes see whole
+    characters exactly as on the ripgrep path.
+
+    Args:
+        file_path: File to search.
+        regex: Compiled str pattern (with re.MULTILINE).
+        bytes_regex: ``_bytes_twin(regex)``, or None if the pattern isn't ASCII.
+        context_lines: Number of context lines before/after match.
+        max_results: Stop after this many matches in the file.
+        literal: Bytes every match contains (lowercased if ignore_case).
+        ignore_case: Whether the literal check ignores ASCII case.
+
+    Returns:
+        List of SearchMatch objects (empty if the file cannot be read).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            args = (regex, bytes_regex, context_lines, max_results, literal, ignore_case)
+            if size < _MMAP_MIN_SIZE:
+                return _grep_buffer(file_path, f.read(), *args)
+            # Large files are paged in on demand instead of copied into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _grep_buffer(file_path, data, *args)
+    except Exception as e:
+        logger.debug(f"Error searching {file_path}: {e}")
+        return []
+
+
+def _grep_buffer(
+    file_path: Path,
+    data: Union[bytes, mmap.mmap],
+    regex: "re.Pattern[str]",
+    bytes_regex: Optional["re.Pattern[bytes]"],
+    context_lines: int,
+    max_results: int,
+    literal: Optional[bytes],
+    ignore_case: bool
+) -> List[SearchMatch]:
+    """Search a file's contents (bytes or a read-only mmap); see _grep_file."""
+    matches: List[SearchMatch] = []
+
+    # A substring test (memchr/memmem) is far cheaper than the regex engine
+    if literal:
+        if ignore_case:
+            if literal not in data[:].lower():
+                return matches
+        elif data.find(literal) == -1:
+            return matches
+
+    text = bytes_regex is None or _NON_ASCII.search(data) is not None
+    if text:
+        data = data[:].decode('utf-8', errors='ignore')
+        newlines, cr, lf = _NEWLINE_TEXT, '\r', '\n'
+    else:
+        regex = bytes_regex
+        newlines, cr, lf = _NEWLINE, b'\r', b'\n'
+    if data.find(cr) != -1:
+        # Same universal-newline handling as reading in text mode
+        data = data[:].replace(cr + lf, lf).replace(cr, lf)
+
+    match = regex.search(data)
+    if match is None:
+        return matches
+
+    line_starts = [0]
+    line_starts.extend(newline.end() for newline in newlines.finditer(data))
+    if len(line_starts) > 1 and line_starts[-1] == len(data):
+        line_starts.pop()  # Trailing newline does not start another line
+    line_count = len(line_starts)
+    ends_with_newline = data[-1:] == lf
+
+    def line_end(i: int) -> int:
+        if i + 1 < line_count:
+            return line_starts[i + 1] - 1
+        return len(data) - 1 if ends_with_newline else len(data)
+
+    def line_text(i: int) -> str:
+        line = data[line_starts[i]:line_end(i)]
+        return (line if text else line.decode('ascii')).rstrip()
+
+    while match is not None and len(matches) < max_results:
+        i = bisect.bisect_right(line_starts, match.start()) - 1
+        start, end = line_starts[i], line_end(i)
+
+        # Results are per line, so retry a match that ran past the line end
+        # within the line alone
+        if match.end() > end:
+            match = regex.search(data, start, end)
+
+        if match is not None:
+            matches.append(SearchMatch(
+                file_path=file_path,
+                line_number=i + 1,
+                line_content=line_text(i),
+                context_before=[
+                    line_text(j) for j in range(max(0, i - context_lines), i)
+                ],
+                context_after=[
+                    line_text(j) for j in range(i + 1, min(line_count, i + context_lines + 1))
+                ],
+                # Offsets into an ASCII line are the same in bytes and str
+                match_start=match.start() - start,
+                match_end=match.end() - start
+            ))
+
+        # First match per line only; resume at the next line
+        if i + 1 >= line_count:
+            break
+        match = regex.search(data, line_starts[i + 1])
+
+    return matches
+
+
+def _literal_hint(name: str) -> Optional[str]:
+    """Pick a substring every regex match of ``name`` must contain.
+
+    Only plain and dotted identifiers qualify; in ``os.path`` the dots match any
+    character, so the longest dot-separated part is used.
+
+    Args:
+        name: Identifier used as a regex pattern.
+
+    Returns:
+        The literal, or None if ``name`` uses other regex syntax.
+    """
+    if not _DOTTED_NAME.fullmatch(name):
+        return None
+    return max(name.split('.'), key=len) or None
+
+
+def _rg_text(value: Dict[str, str]) -> str:
+    """Decode a ripgrep JSON string value, which is either text or base64 bytes."""
+    if 'text' in value:
+        return value['text']
+    return base64.b64decode(value['bytes']).decode('utf-8', errors='ignore')
+
+
+def _rg_span(line: str, submatches: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Convert ripgrep's byte offsets for the first submatch to str offsets."""
+    if not submatches:
+        return 0, 0
+    start, end = submatches[0]['start'], submatches[0]['end']
+    if line.isascii():
+        return start, end
+    raw = line.encode('utf-8')
+    return (
+        len(raw[:start].decode('utf-8', errors='ignore')),
+        len(raw[:end].decode('utf-8', errors='ignore'))
+    )
+
+
+def _read_source(file_path: Path) -> Optional[Tuple[int, str]]:
+    """Read a Python file along with its modification time.
+
+    Args:
+        file_path: Path to Python file.
+
+    Returns:
+        Tuple of (mtime_ns, source), or None if the file cannot be read.
+    """
+    try:
+        mtime = file_path.stat().st_mtime_ns
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return mtime, f.read()
+    except Exception as e:
+        logger.debug(f"Error reading {file_path}: {e}")
+        return None
+
+
+def _parse_source(file_path: Path, mtime: int, source: str) -> Tuple[int, SymbolTable]:
+    """Parse already-read Python source and collect its definitions.
+
+    Args:
+        file_path: File the source was read from.
+        mtime: Modification time the source was read at.
+        source: File contents.
+
+    Returns:
+        Tuple of (mtime_ns, symbols). Syntax errors yield an empty table.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        logger.debug(f"Syntax error in {file_path}")
+        return mtime, SymbolTable(file_path)
+
+    collector = _DefCollector(file_path, _source_lines(source))
+    collector.visit(tree)
+    return mtime, collector.symbols
+
+
+def _parse_definitions(file_path: Path) -> Optional[Tuple[int, SymbolTable]]:
+    """Read and parse a Python file and collect its definitions.
+
+    Args:
+        file_path: Path to Python file.
+
+    Returns:
+        Tuple of (mtime_ns, symbols), or None if the file cannot be read.
+        Files with syntax errors yield an empty table.
+    """
+    loaded = _read_source(file_path)
+    if loaded is None:
+        return None
+    return _parse_source(file_path, *loaded)
+
+
 class CodeSearch:
     """Advanced code search and navigation."""
 
@@ -44,10 +505,42 @@ class CodeSearch:
             root_path: Root path to search in. Defaults to current directory.
         """
         self.root_path = root_path or Path.cwd()
-        self.ignore_patterns = [
-            '.git', '__pycache__', 'node_modules', 'venv', '.venv',
-            'build', 'dist', '.tox', '.eggs', '*.pyc', '*.min.js'
-        ]
+        self.ignore_patterns = list(_IGNORE_PATTERNS)
+        # Path -> (mtime_ns, symbols); LRU so long sessions stay bounded. It
+        # always grows to hold every file of the latest load, since definition
+        # searches scan the whole tree in order and a smaller LRU would miss
+        # on every file.
+        self._ast_cache: "OrderedDict[Path, Tuple[int, SymbolTable]]" = OrderedDict()
+        self.ast_cache_max_size = 512
+
+        # Per-file work fans out to a process pool once there is enough data
+        # to amortize handing it to workers; smaller searches stay in-process.
+        # The pool is started on first use and kept until close().
+        self.max_workers = os.cpu_count() or 1
+        self.parallel_min_bytes = 64 * 1024 * 1024
+        self.pool_chunksize = 32
+        self.read_workers = 32
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # (file stat signature, matches) from the last find_todos() call
+        self._todo_cache: Optional[Tuple[tuple, List[SearchMatch]]] = None
+
+        # ripgrep does the scan when installed; the Python path is the fallback
+        self._rg_path = shutil.which("rg")
+
+    def close(self) -> None:
+        """Stop the worker processes, if the pool was started."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def grep(
         self,
@@ -56,7 +549,8 @@ class CodeSearch:
         case_sensitive: bool = False,
         whole_word: bool = False,
         context_lines: int = 2,
-        max_results: int = 100
+        max_results: int = 100,
+        literal_hint: Optional[str] = None
     ) -> List[SearchMatch]:
         """Search for pattern in files (similar to grep).
 
@@ -67,67 +561,192 @@ class CodeSearch:
             whole_word: Whether to match whole words only.
             context_lines: Number of context lines before/after match.
             max_results: Maximum number of results to return.
+            literal_hint: Text every match is known to contain. Files without
+                it are skipped before the regex runs.
 
         Returns:
             List of SearchMatch objects.
         """
-        matches = []
-
         # Compile regex pattern
         flags = 0 if case_sensitive else re.IGNORECASE
         if whole_word:
             pattern = r'\b' + pattern + r'\b'
 
         try:
-            regex = re.compile(pattern, flags)
+            re.compile(pattern, flags)
         except re.error as e:
             logger.error(f"Invalid regex pattern: {e}")
             return []
 
-        # Find files to search
-        files = self._find_files(file_pattern)
+        if self._rg_path:
+            rg_matches = self._grep_ripgrep(
+                pattern, file_pattern, case_sensitive, context_lines, max_results
+            )
+            if rg_matches is not None:
+                return rg_matches
+
+        # The fallback scans whole files; MULTILINE keeps ^/$ anchored to lines
+        regex = re.compile(pattern, flags | re.MULTILINE)
+
+        literal = None
+        # bytes.lower() folds ASCII only, so a non-ASCII hint can't be
+        # checked case-insensitively
+        if literal_hint and (case_sensitive or literal_hint.isascii()):
+            literal = literal_hint.encode('utf-8')
+            if not case_sensitive:
+                literal = literal.lower()
+
+        return self._scan_files(
+            self._find_files(file_pattern), regex, context_lines,
+            max_results, literal, not case_sensitive
+        )
 
-        for file_path in files:
-            if len(matches) >= max_results:
-                break
+    def _scan_files(
+        self,
+        files: Iterable[Path],
+        regex: "re.Pattern[str]",
+        context_lines: int,
+        max_results: int,
+        literal: Optional[bytes] = None,
+        ignore_case: bool = False
+    ) -> List[SearchMatch]:
+        """Run the Python grep over a list of files.
 
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
+        Args:
+            files: Files to search.
+            regex: Compiled str pattern (with re.MULTILINE).
+            context_lines: Number of context lines before/after match.
+            max_results: Maximum number of results to return.
+            literal: Bytes every match contains, for the prefilter.
+            ignore_case: Whether the literal check ignores ASCII case.
 
-                for i, line in enumerate(lines):
-                    if len(matches) >= max_results:
-                        break
+        Returns:
+            List of SearchMatch objects.
+        """
+        matches = self._iter_scan(files, regex, context_lines, max_results, literal, ignore_case)
+        try:
+            return list(islice(matches, max_results))
+        finally:
+            # Stops the file walk and any pending per-file work
+            matches.close()
 
-                    match = regex.search(line)
-                    if match:
-                        # Get context lines
-                        start_context = max(0, i - context_lines)
-                        end_context = min(len(lines), i + context_lines + 1)
-
-                        context_before = [
-                            lines[j].rstrip()
-                            for j in range(start_context, i)
-                        ]
-                        context_after = [
-                            lines[j].rstrip()
-                            for j in range(i + 1, end_context)
-                        ]
+    def _iter_scan(
+        self,
+        files: Iterable[Path],
+        regex: "re.Pattern[str]",
+        context_lines: int,
+        max_results: int,
+        literal: Optional[bytes],
+        ignore_case: bool
+    ) -> Iterator[SearchMatch]:
+        """Lazily yield matches file by file; see _scan_files."""
+        results = self._map_files(
+            _grep_file, files, regex, _bytes_twin(regex), context_lines, max_results,
+            literal, ignore_case
+        )
+        try:
+            for file_matches in results:
+                yield from file_matches
+        finally:
+            results.close()
+
+    def _grep_ripgrep(
+        self,
+        pattern: str,
+        file_pattern: str,
+        case_sensitive: bool,
+        context_lines: int,
+        max_results: int
+    ) -> Optional[List[SearchMatch]]:
+        """Run the search through ripgrep's JSON output.
+
+        Args:
+            pattern: Regex pattern to search for.
+            file_pattern: Glob pattern for files to search.
+            case_sensitive: Whether search is case sensitive.
+            context_lines: Number of context lines before/after match.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List of SearchMatch objects, or None if ripgrep failed (for example
+            on regex syntax it does not support) and the caller should fall back.
+        """
+        # Search what the Python walker would: no .gitignore, include dotfiles
+        cmd = [
+            self._rg_path, '--json', '--no-ignore', '--hidden', '--no-messages',
+            '--context', str(context_lines), '--max-count', str(max_results),
+        ]
+        if not case_sensitive:
+            cmd.append('--ignore-case')
+        if file_pattern != '*':
+            cmd += ['--glob', file_pattern]
+        for ignore in self.ignore_patterns:
+            cmd += ['--glob', f'!{ignore}']
+        cmd += ['--regexp', pattern, '--', str(self.root_path)]
 
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            logger.debug(f"ripgrep unavailable: {e}")
+            return None
+
+        matches: List[SearchMatch] = []
+        # Per file: line number -> text for every emitted line, plus the matches
+        file_lines: Dict[int, str] = {}
+        pending: List[Tuple[int, int, int]] = []
+        stopped = False
+
+        try:
+            for raw in proc.stdout:
+                event = json.loads(raw)
+                kind = event['type']
+                data = event['data']
+
+                if kind == 'begin':
+                    file_lines = {}
+                    pending = []
+
+                elif kind in ('match', 'context'):
+                    text = _rg_text(data['lines'])
+                    line_number = data['line_number']
+                    file_lines[line_number] = text.rstrip()
+
+                    if kind == 'match' and len(matches) + len(pending) < max_results:
+                        start, end = _rg_span(text, data['submatches'])
+                        pending.append((line_number, start, end))
+
+                elif kind == 'end':
+                    file_path = Path(_rg_text(data['path']))
+                    for line_number, start, end in pending:
                         matches.append(SearchMatch(
                             file_path=file_path,
-                            line_number=i + 1,
-                            line_content=line.rstrip(),
-                            context_before=context_before,
-                            context_after=context_after,
-                            match_start=match.start(),
-                            match_end=match.end()
+                            line_number=line_number,
+                            line_content=file_lines[line_number],
+                            context_before=[
+                                file_lines[j]
+                                for j in range(max(1, line_number - context_lines), line_number)
+                                if j in file_lines
+                            ],
+                            context_after=[
+                                file_lines[j]
+                                for j in range(line_number + 1, line_number + context_lines + 1)
+                                if j in file_lines
+                            ],
+                            match_start=start,
+                            match_end=end
                         ))
-
-            except Exception as e:
-                logger.debug(f"Error searching {file_path}: {e}")
-                continue
-
+                    if len(matches) >= max_results:
+                        stopped = True
+                        break
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+        # Exit code 2 with nothing found means rg rejected the pattern or arguments
+        if not stopped and proc.returncode not in (0, 1) and not matches:
+            return None
         return matches
 
     def find_definition(
@@ -147,129 +766,199 @@ class CodeSearch:
         definitions = []
 
         # Search Python files
-        python_files = self._find_files("*.py")
-
-        for file_path in python_files:
-            try:
-                defs = self._find_python_definitions(file_path, name, def_type)
-                definitions.extend(defs)
-            except Exception as e:
-                logger.debug(f"Error analyzing {file_path}: {e}")
-                continue
+        parsed = self._load_definitions(self._find_files("*.py"))
+
+        for symbols in parsed.values():
+            types = symbols.types
+            for index, symbol_name in enumerate(symbols.names):
+                if symbol_name != name:
+                    continue
+                if not def_type:
+                    definitions.append(symbols.definition(index))
+                elif def_type == 'class':
+                    if types[index] == 'class':
+                        definitions.append(symbols.definition(index))
+                elif def_type in ('function', 'method'):
+                    if types[index] != 'class':
+                        definitions.append(symbols.definition(index))
 
         return definitions
 
-    def _find_python_definitions(
-        self,
-        file_path: Path,
-        name: str,
-        def_type: Optional[str]
-    ) -> List[CodeDefinition]:
-        """Find definitions in a Python file.
+    def _get_definitions(self, file_path: Path) -> SymbolTable:
+        """Get all definitions in a Python file, reusing the cache while it is unchanged.
 
         Args:
             file_path: Path to Python file.
-            name: Name to search for.
-            def_type: Optional type filter.
 
         Returns:
-            List of CodeDefinition objects.
+            The file's symbol table (empty if it cannot be read).
         """
-        definitions = []
+        symbols = self._load_definitions([file_path]).get(file_path)
+        return symbols if symbols is not None else SymbolTable(file_path)
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if node.name == name and (not def_type or def_type in ['function', 'method']):
-                        # Determine if it's a method or function
-                        is_method = self._is_method(node, tree)
-                        parent_class = self._get_parent_class(node, tree) if is_method else None
-
-                        # Build signature
-                        args = []
-                        for arg in node.args.args:
-                            arg_str = arg.arg
-                            if arg.annotation:
-                                arg_str += f": {ast.unparse(arg.annotation)}"
-                            args.append(arg_str)
-
-                        signature = f"def {node.name}({', '.join(args)})"
-                        if node.returns:
-                            signature += f" -> {ast.unparse(node.returns)}"
-
-                        definitions.append(CodeDefinition(
-                            name=node.name,
-                            type='method' if is_method else 'function',
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            end_line=node.end_lineno,
-                            signature=signature,
-                            docstring=ast.get_docstring(node),
-                            parent=parent_class
-                        ))
+    def _load_definitions(self, files: Iterable[Path]) -> Dict[Path, SymbolTable]:
+        """Get definitions for many Python files, parsing only those that changed.
 
-                elif isinstance(node, ast.ClassDef):
-                    if node.name == name and (not def_type or def_type == 'class'):
-                        # Build signature
-                        bases = [ast.unparse(base) for base in node.bases]
-                        signature = f"class {node.name}"
-                        if bases:
-                            signature += f"({', '.join(bases)})"
-
-                        definitions.append(CodeDefinition(
-                            name=node.name,
-                            type='class',
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            end_line=node.end_lineno,
-                            signature=signature,
-                            docstring=ast.get_docstring(node),
-                            parent=None
-                        ))
+        Args:
+            files: Python files to load.
 
-        except SyntaxError:
-            logger.debug(f"Syntax error in {file_path}")
-        except Exception as e:
-            logger.debug(f"Error parsing {file_path}: {e}")
+        Returns:
+            Mapping of readable file path to its symbol table, in input order.
+        """
+        results: Dict[Path, Optional[SymbolTable]] = {}
+        misses = []
+        miss_bytes = 0
 
-        return definitions
+        for file_path in files:
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            mtime = st.st_mtime_ns
+            hit = self._ast_cache.get(file_path)
+            if hit is not None and hit[0] == mtime:
+                self._ast_cache.move_to_end(file_path)
+                results[file_path] = hit[1]
+            else:
+                # Reserve the slot so results keep the input order
+                results[file_path] = None
+                misses.append(file_path)
+                miss_bytes += st.st_size
+
+        if self.max_workers > 1 and miss_bytes >= self.parallel_min_bytes:
+            parsed = self._map_files(_parse_definitions, misses)
+        else:
+            # Too little source for the process pool: overlap the reads on
+            # threads, then parse here
+            parsed = (
+                None if loaded is None else _parse_source(file_path, *loaded)
+                for file_path, loaded in zip(misses, self._read_sources(misses))
+            )
+        max_size = max(self.ast_cache_max_size, len(results))
+        try:
+            for file_path, entry in zip(misses, parsed):
+                if entry is None:
+                    del results[file_path]
+                    continue
+                results[file_path] = entry[1]
+                self._ast_cache[file_path] = entry
+                if len(self._ast_cache) > max_size:
+                    # Least recently used first: files no longer being loaded
+                    self._ast_cache.popitem(last=False)
+        finally:
+            parsed.close()
 
-    def _is_method(self, node: ast.FunctionDef, tree: ast.AST) -> bool:
-        """Check if a function is a method.
+        return results
+
+    def _read_sources(self, files: List[Path]) -> Iterator[Optional[Tuple[int, str]]]:
+        """Read many source files concurrently, yielding results in input order.
+
+        File reads release the GIL, so a thread pool keeps several reads in
+        flight and hides per-file open/read latency on cold caches.
 
         Args:
-            node: Function node.
-            tree: AST tree.
+            files: Files to read.
 
-        Returns:
-            True if node is a method.
+        Yields:
+            (mtime_ns, source) for each file, or None if it cannot be read.
         """
-        for parent in ast.walk(tree):
-            if isinstance(parent, ast.ClassDef):
-                if node in parent.body:
-                    return True
-        return False
+        if len(files) < 2:
+            yield from map(_read_source, files)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.read_workers, len(files))) as executor:
+            yield from executor.map(_read_source, files)
+
+    def _map_files(
+        self,
+        func: Callable[..., Any],
+        files: Iterable[Path],
+        *args: Any
+    ) -> Iterator[Any]:
+        """Apply a per-file worker to each file, in order.
 
-    def _get_parent_class(self, node: ast.FunctionDef, tree: ast.AST) -> Optional[str]:
-        """Get parent class name for a method.
+        Uses the process pool once the files add up to ``parallel_min_bytes``.
+        Below that, files are pulled lazily, so closing the returned iterator
+        early also stops whatever produces them; with the pool, work not yet
+        started is cancelled.
 
         Args:
-            node: Function node.
-            tree: AST tree.
+            func: Module-level worker taking the file path first.
+            files: Files to process.
+            *args: Extra arguments passed to every call.
+
+        Yields:
+            The worker's result for each file.
+        """
+        files = iter(files)
+        if self.max_workers <= 1:
+            for file_path in files:
+                yield func(file_path, *args)
+            return
+
+        # Only buffer enough paths to decide whether the pool is worth it
+        head: List[Path] = []
+        total = 0
+        for file_path in files:
+            head.append(file_path)
+            try:
+                total += os.stat(file_path).st_size
+            except OSError:
+                pass
+            if total >= self.parallel_min_bytes:
+                break
+        files = chain(head, files)
+
+        executor = self._get_pool() if total >= self.parallel_min_bytes else None
+        if executor is None:
+            for file_path in files:
+                yield func(file_path, *args)
+            return
+
+        # map() submits everything up front anyway; the list lets a broken
+        # pool hand the remaining files back to this process
+        files = list(files)
+        done = 0
+        try:
+            # Closing map's iterator cancels the chunks not yet started
+            for result in executor.map(
+                func, files, *(repeat(arg) for arg in args),
+                chunksize=self.pool_chunksize
+            ):
+                yield result
+                done += 1
+        except BrokenExecutor as e:
+            logger.debug(f"Process pool failed, searching serially: {e}")
+            with self._pool_lock:
+                if self._pool is executor:
+                    self._pool = None
+            # Workers that died once (e.g. spawn can't re-import __main__)
+            # will die again; stay in-process from now on
+            self.max_workers = 1
+            for file_path in files[done:]:
+                yield func(file_path, *args)
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the worker pool, starting it on first use.
+
+        Workers are spawned rather than forked: forking a process that is
+        running thread pools elsewhere can leave a worker holding a lock
+        that no thread will ever release.
 
         Returns:
-            Parent class name or None.
+            The pool, or None if processes cannot be started here.
         """
-        for parent in ast.walk(tree):
-            if isinstance(parent, ast.ClassDef):
-                if node in parent.body:
-                    return parent.name
-        return None
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+                except (OSError, NotImplementedError) as e:
+                    logger.debug(f"Process pool unavailable, searching serially: {e}")
+                    return None
+            return self._pool
 
     def find_references(
         self,
@@ -290,7 +979,8 @@ class CodeSearch:
             pattern=name,
             whole_word=True,
             context_lines=1,
-            max_results=max_results
+            max_results=max_results,
+            literal_hint=_literal_hint(name)
         )
 
     def find_imports(
@@ -307,7 +997,10 @@ class CodeSearch:
         """
         # Pattern to match various import styles
         pattern = rf'(?:from\s+{module_name}|import\s+{module_name})'
-        return self.grep(pattern, file_pattern="*.py", context_lines=0)
+        return self.grep(
+            pattern, file_pattern="*.py", context_lines=0,
+            literal_hint=_literal_hint(module_name)
+        )
 
     def find_todos(self) -> List[SearchMatch]:
         """Find all TODO comments in code.
@@ -315,46 +1008,75 @@ class CodeSearch:
         Returns:
             List of SearchMatch objects.
         """
-        pattern = r'#\s*TODO|//\s*TODO|/\*\s*TODO'
-        return self.grep(pattern, case_sensitive=False, context_lines=1)
+        files = list(self._find_files("*"))
 
-    def _find_files(self, pattern: str) -> List[Path]:
+        # Reuse the last result while no file was added, removed or modified
+        signature = []
+        for file_path in files:
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            signature.append((file_path, st.st_mtime_ns, st.st_size))
+        signature = tuple(signature)
+        if self._todo_cache is not None and self._todo_cache[0] == signature:
+            return list(self._todo_cache[1])
+
+        if self._rg_path:
+            matches = self.grep(_TODO_PATTERN, case_sensitive=False, context_lines=1)
+        else:
+            matches = self._scan_files(files, _TODO_RE, 1, 100, b'todo', True)
+
+        self._todo_cache = (signature, matches)
+        return list(matches)
+
+    def _find_files(self, pattern: str) -> Iterator[Path]:
         """Find files matching a pattern.
 
+        The walk is top-down like ``os.walk``: a directory's files come before
+        its subdirectories, and ignored subdirectories are dropped from the
+        pending list before they are ever opened. It is lazy, only advancing
+        as the caller consumes paths.
+
         Args:
             pattern: Glob pattern.
 
-        Returns:
-            List of matching file paths.
+        Yields:
+            Matching file paths.
         """
-        files = []
-
+        # Patterns with a directory part match the path tail, like rglob does
+        match_path = '/' in pattern
+        name_matches = _glob_regex(pattern).match
+
+        # Read at walk time so ripgrep and this walker honour the same setting
+        ignore_dirs, ignore_suffixes = _split_ignore_patterns(tuple(self.ignore_patterns))
+        # scandir rather than os.walk: the entry types come from the directory
+        # listing, so filtering out non-regular files needs no extra stat
+        pending = [str(self.root_path)]
         try:
-            for file_path in self.root_path.rglob(pattern):
-                if file_path.is_file() and not self._should_ignore(file_path):
-                    files.append(file_path)
+            while pending:
+                directory = pending.pop()
+                subdirs = []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in ignore_dirs:
+                                    subdirs.append(entry.path)
+                            elif entry.name.endswith(ignore_suffixes) or not entry.is_file():
+                                continue
+                            elif match_path:
+                                if PurePath(entry.path).match(pattern):
+                                    yield Path(entry.path)
+                            elif name_matches(entry.name):
+                                yield Path(entry.path)
+                except OSError as e:
+                    logger.debug(f"Cannot list {directory}: {e}")
+                # Reversed so subdirectories are visited in listing order
+                pending.extend(reversed(subdirs))
         except Exception as e:
             logger.error(f"Error finding files: {e}")
 
-        return files
-
-    def _should_ignore(self, path: Path) -> bool:
-        """Check if a path should be ignored.
-
-        Args:
-            path: Path to check.
-
-        Returns:
-            True if should be ignored.
-        """
-        path_str = str(path)
-
-        for pattern in self.ignore_patterns:
-            if pattern in path_str:
-                return True
-
-        return False
-
     def get_file_symbols(self, file_path: Path) -> Dict[str, List[CodeDefinition]]:
         """Get all symbols (functions, classes) in a file.
 
@@ -374,43 +1096,8 @@ class CodeSearch:
             return symbols
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    symbols['classes'].append(CodeDefinition(
-                        name=node.name,
-                        type='class',
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        end_line=node.end_lineno,
-                        signature=f"class {node.name}",
-                        docstring=ast.get_docstring(node),
-                        parent=None
-                    ))
-
-                elif isinstance(node, ast.FunctionDef):
-                    is_method = self._is_method(node, tree)
-                    parent = self._get_parent_class(node, tree) if is_method else None
-
-                    definition = CodeDefinition(
-                        name=node.name,
-                        type='method' if is_method else 'function',
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        end_line=node.end_lineno,
-                        signature=f"def {node.name}",
-                        docstring=ast.get_docstring(node),
-                        parent=parent
-                    )
-
-                    if is_method:
-                        symbols['methods'].append(definition)
-                    else:
-                        symbols['functions'].append(definition)
+            for definition in self._get_definitions(file_path).definitions():
+                symbols[_SYMBOL_KEYS[definition.type]].append(definition)
 
         except Exception as e:
             logger.debug(f"Error getting symbols from {file_path}: {e}")
@@ -443,14 +1130,13 @@ class CodeSearch:
 
         regex = re.compile(pattern, re.IGNORECASE)
 
-        python_files = self._find_files("*.py")
-
-        for file_path in python_files:
-            symbols = self.get_file_symbols(file_path)
+        parsed = self._load_definitions(self._find_files("*.py"))
 
-            for symbol_type, definitions in symbols.items():
-                for definition in definitions:
-                    if regex.search(definition.name):
-                        results[symbol_type].append(definition)
+        # Match against the name column alone; only hits become CodeDefinitions
+        search = regex.search
+        for symbols in parsed.values():
+            hits = [index for index, name in enumerate(symbols.names) if search(name)]
+            for definition in symbols.definitions(hits):
+                results[_SYMBOL_KEYS[definition.type]].append(definition)
 
         return results
@@ -1,16 +1,353 @@
 """Context manager for maintaining project and folder awareness."""
 
 import ast
+import bisect
 import json
+import mmap
 import os
+import re
+import struct
 import time
-from collections import defaultdict
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import ItemsView, Mapping, Sequence, ValuesView
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Union
 import fnmatch
 
 from loguru import logger
 
+# Literal text before the first glob metacharacter
+_GLOB_PREFIX = re.compile(r'[^*?\[]*')
+
+# Nodes that can contain statements. Definitions and imports are statements,
+# and expressions never contain statements, so nothing else needs visiting.
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _walk_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield the statement-level nodes of a tree in ``ast.walk`` order.
+
+    Expression subtrees, which make up most of a typical module, are skipped
+    without being visited.
+
+    Args:
+        tree: Parsed module.
+
+    Yields:
+        Statement nodes (and the handler/case nodes that hold statements).
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        yield node
+        queue.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_NODES)
+        )
+
+
+# On-disk project index: magic, header length, JSON header, then aligned
+# native unsigned int arrays and the path bytes they point into. The file is
+# a local cache, so native byte order is fine. See _write_index.
+_INDEX_MAGIC = b'OCIDX\x00\x01\x00'
+_HEADER_LEN = struct.Struct('=I')
+_ID_SIZE = array('I').itemsize
+
+
+def _write_index(
+    cache_file: Path,
+    header: Dict[str, Any],
+    file_index: Mapping[str, str],
+    language_files: Mapping[str, Sequence[str]]
+) -> None:
+    """Write the project index in the format read by ``_MappedIndex``.
+
+    Every distinct path is stored once. The file index and each language
+    list are arrays of path ids, and a copy of the file index ids sorted by
+    file name lets lookups bisect without loading anything.
+
+    Args:
+        cache_file: Destination; replaced atomically.
+        header: Small JSON-serializable metadata to store alongside.
+        file_index: Filename -> path mapping, in index order.
+        language_files: Language -> paths mapping.
+    """
+    path_ids: Dict[str, int] = {}
+    blob = bytearray()
+    offsets = array('I', [0])
+
+    def path_id(path: str) -> int:
+        index = path_ids.get(path)
+        if index is None:
+            index = path_ids[path] = len(offsets) - 1
+            blob.extend(os.fsencode(path))
+            offsets.append(len(blob))
+        return index
+
+    index_ids = array('I', map(path_id, file_index.values()))
+    sorted_ids = array('I', sorted(
+        index_ids, key=lambda i: os.path.basename(bytes(blob[offsets[i]:offsets[i + 1]]))
+    ))
+    languages = []
+    language_ids = array('I')
+    for lang, files in language_files.items():
+        language_ids.extend(map(path_id, files))
+        languages.append([lang, len(files)])
+
+    header = dict(
+        header,
+        path_count=len(offsets) - 1,
+        index_count=len(index_ids),
+        languages=languages
+    )
+    header_bytes = json.dumps(header).encode('utf-8')
+    prefix = _INDEX_MAGIC + _HEADER_LEN.pack(len(header_bytes)) + header_bytes
+    prefix += b'\0' * (-len(prefix) % _ID_SIZE)
+
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(prefix)
+        for table in (offsets, index_ids, sorted_ids, language_ids):
+            table.tofile(f)
+        f.write(blob)
+    os.replace(tmp_file, cache_file)
+
+
+class _MappedIndex:
+    """Read-only, memory-mapped view of an index written by ``_write_index``.
+
+    Opening one only maps the file and parses the small header; paths are
+    decoded when they are asked for.
+    """
+
+    def __init__(self, cache_file: Path):
+        """Map an index file.
+
+        Args:
+            cache_file: File written by ``_write_index``.
+
+        Raises:
+            ValueError: If the file is not a complete index.
+        """
+        with open(cache_file, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._tables: List[memoryview] = []
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        if self._mm[:len(_INDEX_MAGIC)] != _INDEX_MAGIC:
+            raise ValueError("not a project index")
+        pos = len(_INDEX_MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(self._mm, pos)
+        pos += _HEADER_LEN.size
+        self.header = json.loads(self._mm[pos:pos + header_len])
+        pos += header_len
+        pos += -pos % _ID_SIZE
+
+        def table(count: int) -> memoryview:
+            nonlocal pos
+            view = self._view[pos:pos + _ID_SIZE * count].cast('I')
+            self._tables.append(view)
+            pos += _ID_SIZE * count
+            return view
+
+        index_count = self.header['index_count']
+        self._offsets = table(self.header['path_count'] + 1)
+        self.index_ids = table(index_count)
+        self.sorted_ids = table(index_count)
+        self.language_ids = table(sum(count for _, count in self.header['languages']))
+        self._blob_start = pos
+        if len(self._mm) != pos + self._offsets[-1]:
+            raise ValueError("truncated project index")
+
+    def path_bytes(self, path_id: int) -> bytes:
+        """Encoded path for an id."""
+        start = self._blob_start
+        return self._mm[start + self._offsets[path_id]:start + self._offsets[path_id + 1]]
+
+    def path(self, path_id: int) -> str:
+        """Path for an id."""
+        return os.fsdecode(self.path_bytes(path_id))
+
+    def name(self, path_id: int) -> str:
+        """File name (last path component) for an id."""
+        return os.fsdecode(os.path.basename(self.path_bytes(path_id)))
+
+    def close(self) -> None:
+        """Unmap the file; paths already handed out stay valid."""
+        for view in self._tables:
+            view.release()
+        self._view.release()
+        self._mm.close()
+
+
+class _MappedFileIndex(Mapping):
+    """Filename -> path mapping served from a ``_MappedIndex``."""
+
+    def __init__(self, index: _MappedIndex):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index.index_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        name = self._index.name
+        for path_id in self._index.index_ids:
+            yield name(path_id)
+
+    def __getitem__(self, name: str) -> str:
+        index = self._index
+        key = os.fsencode(name)
+        sorted_ids = index.sorted_ids
+        # Bisect over names in the mapped sorted table
+        lo, hi = 0, len(sorted_ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if os.path.basename(index.path_bytes(sorted_ids[mid])) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(sorted_ids) and os.path.basename(index.path_bytes(sorted_ids[lo])) == key:
+            return index.path(sorted_ids[lo])
+        raise KeyError(name)
+
+    def values(self) -> "ValuesView[str]":
+        return _MappedValues(self)
+
+    def items(self) -> "ItemsView[str, str]":
+        return _MappedItems(self)
+
+    def _paths(self) -> Iterator[str]:
+        path = self._index.path
+        for path_id in self._index.index_ids:
+            yield path(path_id)
+
+
+class _MappedValues(ValuesView):
+    """Index-order paths, without a name lookup per path."""
+
+    def __iter__(self) -> Iterator[str]:
+        return self._mapping._paths()
+
+
+class _MappedItems(ItemsView):
+    """Index-order (name, path) pairs, without a name lookup per path."""
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        index = self._mapping._index
+        for path_id in index.index_ids:
+            path = index.path(path_id)
+            yield os.path.basename(path), path
+
+
+class _MappedPaths(Sequence):
+    """One language's file list served from a ``_MappedIndex``."""
+
+    def __init__(self, index: _MappedIndex, start: int, count: int):
+        self._index = index
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        return self._index.path(self._index.language_ids[self._start + position])
+
+
+class _JoinedText:
+    """Case-insensitive substring search over many strings at once.
+
+    The lowercased strings are joined with NUL, which no path can contain,
+    so a single ``str.find`` loop (running in C) visits only the hits.
+    """
+
+    def __init__(self, strings: List[str]):
+        """Join the strings for searching.
+
+        Args:
+            strings: Strings to search, e.g. file names or paths.
+        """
+        lowered = [string.lower() for string in strings]
+        self._blob = '\0'.join(lowered)
+        self._starts = []
+        offset = 0
+        for string in lowered:
+            self._starts.append(offset)
+            offset += len(string) + 1
+
+    def containing(self, text: str) -> List[int]:
+        """Positions of the strings containing ``text``, in order."""
+        needle = text.lower()
+        if not needle:
+            return list(range(len(self._starts)))
+        if '\0' in needle:
+            return []
+
+        hits = []
+        find = self._blob.find
+        starts = self._starts
+        position = find(needle)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            hits.append(index)
+            if index + 1 == len(starts):
+                break
+            # Resume at the next string so each one is reported once
+            position = find(needle, starts[index + 1])
+        return hits
+
+
+class _NameIndex:
+    """File lookups that avoid testing every indexed file in Python.
+
+    Prefix queries bisect a sorted copy of the lowercased names, the flat
+    equivalent of a trie. Substring queries over names or full paths go
+    through ``_JoinedText``. All queries return positions in
+    ``names``/``paths``, which keep the file index order. ``stems`` maps
+    each file name without its extension to the paths sharing it.
+    """
+
+    def __init__(self, file_index: Dict[str, str]):
+        """Index the names and paths of a filename -> path mapping.
+
+        Args:
+            file_index: The project's file index.
+        """
+        self.names = list(file_index)
+        self.paths = list(file_index.values())
+        self.name_text = _JoinedText(self.names)
+        self.path_text = _JoinedText(self.paths)
+
+        self.stems: Dict[str, List[str]] = defaultdict(list)
+        for name, path in zip(self.names, self.paths):
+            self.stems[os.path.splitext(name)[0]].append(path)
+
+        lowered = [name.lower() for name in self.names]
+        order = sorted(range(len(lowered)), key=lowered.__getitem__)
+        self._sorted_names = [lowered[i] for i in order]
+        self._sorted_positions = order
+
+    def with_prefix(self, prefix: str) -> List[int]:
+        """Positions of names starting with ``prefix``, ignoring case."""
+        prefix = prefix.lower()
+        first = bisect.bisect_left(self._sorted_names, prefix)
+        last = bisect.bisect_left(self._sorted_names, prefix + '\U0010ffff', first)
+        return self._sorted_positions[first:last]
+
 
 class ProjectContext:
     """Maintains context about the current project/folder structure."""
@@ -26,6 +363,9 @@ class ProjectContext:
         "*.min.js", "*.min.css",
     ]
 
+    # Hidden names that are still indexed
+    ALLOWED_HIDDEN = frozenset({'.gitignore', '.env', '.env.example'})
+
     # Language file extensions
     LANGUAGE_EXTENSIONS = {
         'python': ['.py', '.pyx', '.pyi'],
@@ -47,6 +387,28 @@ class ProjectContext:
         'shell': ['.sh', '.bash', '.zsh'],
     }
 
+    # Common important files, reported in this order
+    IMPORTANT_FILE_PATTERNS = [
+        'README*', 'readme*',
+        'LICENSE*', 'LICENCE*',
+        'CONTRIBUTING*',
+        '.gitignore',
+        'Makefile',
+        'Dockerfile',
+        '.dockerignore',
+        'docker-compose.yml',
+        'config.*', 'settings.*',
+        '.env.example',
+    ]
+
+    # Extension -> language. Built in reverse so an extension listed under
+    # several languages ('.h') maps to the first, as a linear scan would.
+    EXT_TO_LANG = {
+        ext: lang
+        for lang, extensions in reversed(LANGUAGE_EXTENSIONS.items())
+        for ext in extensions
+    }
+
     def __init__(self, root_path: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """Initialize project context.
 
@@ -56,15 +418,41 @@ class ProjectContext:
         """
         self.root_path = root_path or Path.cwd()
         self.cache_dir = cache_dir or (self.root_path / ".ownclaude")
-        self.cache_file = self.cache_dir / "project_cache.json"
+        self.cache_file = self.cache_dir / "project_index.bin"
+        # Mapped cache backing file_index/language_files after a cache load
+        self._mapped_index: Optional[_MappedIndex] = None
         self.file_tree: Dict[str, Any] = {}
-        self.file_index: Dict[str, Path] = {}  # filename -> full path
-        self.language_files: Dict[str, List[Path]] = defaultdict(list)
+        # Paths are kept as plain strings; Path objects are only created
+        # for the few results handed back to callers
+        self.file_index: Dict[str, str] = {}  # filename -> full path
+        self.language_files: Dict[str, List[str]] = defaultdict(list)
         self.project_type: Optional[str] = None
         self.important_files: List[Path] = []
         self.cached_summaries: Dict[Path, str] = {}
+        # Built from file_index on first use; see find_files
+        self._name_index: Optional[_NameIndex] = None
         self._initialized = False
         self._cache_max_age_seconds = 3600  # 1 hour
+        # Threads used to scan top-level directories concurrently
+        self.scan_workers = 8
+        # Path -> (mtime_ns, size, analysis); LRU so long sessions stay bounded
+        self._analysis_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        self.analysis_cache_max_size = 256
+
+        # All ignore globs as one regex, so each name is matched once.
+        # fnmatch compares case-insensitively on Windows; keep doing so.
+        self._ignore_re = re.compile(
+            '|'.join(fnmatch.translate(p) for p in self.DEFAULT_IGNORE_PATTERNS),
+            re.IGNORECASE if os.name == 'nt' else 0
+        )
+        # Likewise for important files; group p<i> tells which pattern hit
+        self._important_re = re.compile(
+            '|'.join(
+                f'(?P<p{i}>{fnmatch.translate(p)})'
+                for i, p in enumerate(self.IMPORTANT_FILE_PATTERNS)
+            ),
+            re.IGNORECASE if os.name == 'nt' else 0
+        )
 
     def initialize(self, max_depth: int = 5) -> None:
         """Scan and index the project structure.
@@ -73,6 +461,8 @@ class ProjectContext:
             max_depth: Maximum depth to scan.
         """
         logger.info(f"Initializing project context for: {self.root_path}")
+        self._name_index = None
+        self._close_mapped_index()
 
         # Try loading from cache first
         if self._load_from_cache():
@@ -82,7 +472,7 @@ class ProjectContext:
 
         # Cache miss or stale - do full scan
         logger.info("Cache miss or stale, performing full project scan...")
-        self.file_tree = self._build_tree(self.root_path, max_depth)
+        self.file_tree = self._build_tree(str(self.root_path), max_depth)
         self.project_type = self._detect_project_type()
         self.important_files = self._find_important_files()
 
@@ -93,60 +483,171 @@ class ProjectContext:
         # Save to cache for next time
         self._save_to_cache()
 
-    def _build_tree(
-        self,
-        path: Path,
-        max_depth: int,
-        current_depth: int = 0
-    ) -> Dict[str, Any]:
+    def _build_tree(self, path: str, max_depth: int) -> Dict[str, Any]:
         """Build a tree structure of the project.
 
+        Entries come from ``os.scandir``, whose directory listing already
+        carries each entry's type, so classifying an entry costs no extra
+        stat. Symlinked directories are indexed as files rather than followed.
+
+        Each top-level directory is scanned on its own worker thread: the scan
+        is mostly waiting on directory reads, which release the GIL. Results
+        are merged in listing order, so the indexes come out exactly as a
+        sequential depth-first walk would build them.
+
         Args:
-            path: Path to scan.
+            path: Directory to scan.
             max_depth: Maximum depth to scan.
-            current_depth: Current recursion depth.
 
         Returns:
             Tree structure dictionary.
         """
-        if current_depth >= max_depth:
+        if max_depth <= 0:
             return {}
 
-        tree = {
-            'type': 'directory' if path.is_dir() else 'file',
-            'path': path,
-            'name': path.name,
-            'children': {}
-        }
+        tree = self._directory_node(path)
+        entries = [
+            entry for entry in self._scan_directory(path)
+            if not self._should_ignore_name(entry.name)
+        ]
+        subdirs = [
+            entry.path for entry in entries
+            if max_depth > 1 and entry.is_dir(follow_symlinks=False)
+        ]
+
+        if self.scan_workers > 1 and len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.scan_workers, len(subdirs))) as executor:
+                scans = executor.map(lambda subdir: self._scan_subtree(subdir, max_depth), subdirs)
+                scanned = dict(zip(subdirs, scans))
+        else:
+            scanned = {subdir: self._scan_subtree(subdir, max_depth) for subdir in subdirs}
+
+        children = tree['children']
+        for entry in entries:
+            name = entry.name
+            if max_depth <= 1:
+                children[name] = {}
+            elif entry.path in scanned:
+                node, file_index, language_files = scanned[entry.path]
+                children[name] = node
+                self.file_index.update(file_index)
+                for lang, files in language_files.items():
+                    self.language_files[lang].extend(files)
+            else:
+                children[name] = self._index_file(
+                    entry.path, name, self.file_index, self.language_files
+                )
 
-        if not path.is_dir():
-            # Index file
-            self.file_index[path.name] = path
+        return tree
 
-            # Categorize by language
-            ext = path.suffix.lower()
-            for lang, extensions in self.LANGUAGE_EXTENSIONS.items():
-                if ext in extensions:
-                    self.language_files[lang].append(path)
-                    break
+    def _scan_subtree(
+        self,
+        path: str,
+        max_depth: int
+    ) -> Tuple[Dict[str, Any], Dict[str, str], Dict[str, List[str]]]:
+        """Scan a top-level directory into its own tree node and indexes.
+
+        Touches no shared state, so several subtrees can be scanned at once.
+        The walk keeps an explicit stack of partly consumed directory listings
+        instead of recursing, so deep trees cannot hit the recursion limit.
+        Ignored directories are skipped before they are listed, the same
+        pruning ``os.walk`` gets from editing ``dirs`` in place; ``os.walk``
+        itself is not used because it separates files from directories and
+        the tree must keep each directory's listing order.
 
-            return tree
+        Args:
+            path: Directory directly under the project root.
+            max_depth: Maximum depth to scan, counted from the root.
 
-        try:
-            for item in path.iterdir():
+        Returns:
+            Tuple of (tree node, file index, language files) for the subtree.
+        """
+        file_index: Dict[str, str] = {}
+        language_files: Dict[str, List[str]] = defaultdict(list)
+
+        tree = self._directory_node(path)
+        # (remaining entries, children dict they belong in, their depth)
+        stack = [(iter(self._scan_directory(path)), tree['children'], 2)]
+
+        while stack:
+            entries, children, depth = stack[-1]
+            for entry in entries:
+                name = entry.name
                 # Skip ignored patterns
-                if self._should_ignore(item):
+                if self._should_ignore_name(name):
                     continue
 
-                tree['children'][item.name] = self._build_tree(
-                    item,
-                    max_depth,
-                    current_depth + 1
-                )
-        except (PermissionError, OSError) as e:
+                if depth >= max_depth:
+                    children[name] = {}
+                elif entry.is_dir(follow_symlinks=False):
+                    node = self._directory_node(entry.path)
+                    children[name] = node
+                    # Descend now; the rest of this listing resumes afterwards
+                    stack.append((iter(self._scan_directory(entry.path)), node['children'], depth + 1))
+                    break
+                else:
+                    children[name] = self._index_file(entry.path, name, file_index, language_files)
+            else:
+                stack.pop()
+
+        return tree, file_index, language_files
+
+    def _scan_directory(self, path: str) -> List[os.DirEntry]:
+        """List a directory's entries.
+
+        Args:
+            path: Directory to list.
+
+        Returns:
+            The entries, or an empty list if the directory cannot be read.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return list(entries)
+        except OSError as e:
             logger.warning(f"Cannot access {path}: {e}")
+            return []
 
-        return tree
+    def _directory_node(self, path: str) -> Dict[str, Any]:
+        """Create the (still empty) tree node for a directory."""
+        return {
+            'type': 'directory',
+            'path': path,
+            'name': os.path.basename(path),
+            'children': {}
+        }
+
+    def _index_file(
+        self,
+        file_path: str,
+        name: str,
+        file_index: Dict[str, str],
+        language_files: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        """Record a file in the given indexes and return its tree node.
+
+        Args:
+            file_path: Full path of the file.
+            name: File name.
+            file_index: Filename index to add the file to.
+            language_files: Per-language file lists to add the file to.
+
+        Returns:
+            Tree node for the file.
+        """
+        file_index[name] = file_path
+
+        # Categorize by language
+        lang = self.EXT_TO_LANG.get(os.path.splitext(name)[1].lower())
+        if lang:
+            language_files[lang].append(file_path)
+
+        return {
+            'type': 'file',
+            'path': file_path,
+            'name': name,
+            'children': {}
+        }
 
     def _should_ignore(self, path: Path) -> bool:
         """Check if a path should be ignored.
@@ -157,17 +658,22 @@ class ProjectContext:
         Returns:
             True if should be ignored.
         """
-        name = path.name
+        return self._should_ignore_name(path.name)
 
-        for pattern in self.DEFAULT_IGNORE_PATTERNS:
-            if fnmatch.fnmatch(name, pattern):
-                return True
+    def _should_ignore_name(self, name: str) -> bool:
+        """Check if a file or directory name should be ignored.
 
-        # Ignore hidden files/folders (except .gitignore, .env)
-        if name.startswith('.') and name not in ['.gitignore', '.env', '.env.example']:
+        Args:
+            name: Entry name, without any directory part.
+
+        Returns:
+            True if should be ignored.
+        """
+        if self._ignore_re.match(name):
             return True
 
-        return False
+        # Ignore hidden files/folders (except .gitignore, .env)
+        return name.startswith('.') and name not in self.ALLOWED_HIDDEN
 
     def _detect_project_type(self) -> Optional[str]:
         """Detect the type of project.
@@ -183,12 +689,19 @@ class ProjectContext:
             'go': ['go.mod', 'go.sum'],
             'ruby': ['Gemfile', 'Rakefile'],
             'php': ['composer.json', 'composer.lock'],
+            # Matched by extension
             'dotnet': ['.csproj', '.sln', '.fsproj'],
         }
 
+        # One listing of the root instead of a stat per marker
+        root_names = frozenset(
+            entry.name for entry in self._scan_directory(str(self.root_path))
+        )
+        root_suffixes = frozenset(os.path.splitext(name)[1] for name in root_names)
+
         for proj_type, files in indicators.items():
             for file in files:
-                if (self.root_path / file).exists():
+                if file in root_names or (file.startswith('.') and file in root_suffixes):
                     return proj_type
 
         # Fallback to most common language
@@ -203,59 +716,60 @@ class ProjectContext:
         Returns:
             List of important file paths.
         """
+        # One listing of the root, each name matched against all patterns
         important = []
+        for entry in self._scan_directory(str(self.root_path)):
+            match = self._important_re.match(entry.name)
+            if match and entry.is_file():
+                important.append((int(match.lastgroup[1:]), Path(entry.path)))
 
-        # Common important files
-        patterns = [
-            'README*', 'readme*',
-            'LICENSE*', 'LICENCE*',
-            'CONTRIBUTING*',
-            '.gitignore',
-            'Makefile',
-            'Dockerfile',
-            '.dockerignore',
-            'docker-compose.yml',
-            'config.*', 'settings.*',
-            '.env.example',
-        ]
-
-        for pattern in patterns:
-            matches = list(self.root_path.glob(pattern))
-            important.extend([m for m in matches if m.is_file()])
-
-        return important
+        # Group by pattern as before; the sort is stable within a pattern
+        important.sort(key=lambda item: item[0])
+        return [path for _, path in important]
 
     def _load_from_cache(self) -> bool:
         """Load project context from cache if available and fresh.
 
+        The index is memory-mapped rather than read: file_index and
+        language_files are served from the mapping and paths are only
+        decoded when used. The cache is stale after an hour, or as soon as
+        the root directory's own entries change.
+
         Returns:
             True if cache was loaded successfully, False otherwise.
         """
         try:
-            if not self.cache_file.exists():
+            try:
+                cache_mtime = self.cache_file.stat().st_mtime
+            except FileNotFoundError:
                 return False
 
             # Check cache age
-            cache_age = time.time() - self.cache_file.stat().st_mtime
+            cache_age = time.time() - cache_mtime
             if cache_age > self._cache_max_age_seconds:
                 logger.debug(f"Cache is stale (age: {cache_age:.0f}s)")
                 return False
 
-            # Load cache
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-
-            # Reconstruct file_index and language_files
-            self.file_index = {name: Path(path) for name, path in cache_data.get('file_index', {}).items()}
+            index = _MappedIndex(self.cache_file)
+            header = index.header
+            if (
+                header.get('root_path') != str(self.root_path)
+                or header.get('root_mtime_ns') != os.stat(self.root_path).st_mtime_ns
+            ):
+                logger.debug("Cache is stale (project root changed)")
+                index.close()
+                return False
 
-            # Reconstruct language_files
-            lang_files_dict = cache_data.get('language_files', {})
+            self._mapped_index = index
+            self.file_index = _MappedFileIndex(index)
             self.language_files = defaultdict(list)
-            for lang, paths in lang_files_dict.items():
-                self.language_files[lang] = [Path(p) for p in paths]
+            start = 0
+            for lang, count in header['languages']:
+                self.language_files[lang] = _MappedPaths(index, start, count)
+                start += count
 
-            self.project_type = cache_data.get('project_type')
-            self.important_files = [Path(p) for p in cache_data.get('important_files', [])]
+            self.project_type = header.get('project_type')
+            self.important_files = [Path(p) for p in header.get('important_files', [])]
 
             # Note: We don't cache file_tree as it's complex nested structure with Path objects
             # Can be reconstructed if needed, but not essential for most operations
@@ -269,34 +783,48 @@ class ProjectContext:
     def _save_to_cache(self) -> None:
         """Save project context to cache."""
         try:
-            # Create cache directory if it doesn't exist
+            # Create cache directory if it doesn't exist. Done before reading
+            # the root's mtime, since creating it may change that mtime.
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Prepare cache data (convert Path objects to strings for JSON serialization)
-            cache_data = {
+            header = {
                 'timestamp': time.time(),
                 'root_path': str(self.root_path),
-                'file_index': {name: str(path) for name, path in self.file_index.items()},
-                'language_files': {lang: [str(p) for p in paths] for lang, paths in self.language_files.items()},
+                'root_mtime_ns': os.stat(self.root_path).st_mtime_ns,
                 'project_type': self.project_type,
                 'important_files': [str(p) for p in self.important_files],
             }
-
-            # Write cache
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            _write_index(self.cache_file, header, self.file_index, self.language_files)
 
             logger.debug(f"Saved project context cache to {self.cache_file}")
 
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
 
+    def _close_mapped_index(self) -> None:
+        """Drop a mapped cache so its file can be replaced or deleted (Windows)."""
+        if self._mapped_index is not None:
+            self.file_index = {}
+            self.language_files = defaultdict(list)
+            self._mapped_index.close()
+            self._mapped_index = None
+
     def invalidate_cache(self) -> None:
         """Invalidate the cache file."""
         try:
-            if self.cache_file.exists():
-                self.cache_file.unlink()
-                logger.info("Cache invalidated")
+            if self._mapped_index is not None:
+                # Keep the loaded entries usable once the mapping is gone
+                self.file_index = dict(self.file_index.items())
+                self.language_files = defaultdict(
+                    list, {lang: list(files) for lang, files in self.language_files.items()}
+                )
+                self._name_index = None
+                self._mapped_index.close()
+                self._mapped_index = None
+            self.cache_file.unlink()
+            logger.info("Cache invalidated")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to invalidate cache: {e}")
 
@@ -352,23 +880,39 @@ class ProjectContext:
         if not self._initialized:
             self.initialize()
 
-        matches = []
+        index = self._get_name_index()
+
+        # A name matches if it contains the pattern text (ignoring case) or
+        # matches it as a glob. Without wildcards the glob test is equality,
+        # which the substring test already covers; with them, only names
+        # sharing the pattern's literal prefix need the glob test.
+        hits = set(index.name_text.containing(pattern))
+        prefix = _GLOB_PREFIX.match(pattern).group()
+        if prefix != pattern:
+            names = index.names
+            # Compiled once here rather than looked up per name by fnmatch
+            glob_matches = re.compile(
+                fnmatch.translate(pattern), re.IGNORECASE if os.name == 'nt' else 0
+            ).match
+            hits.update(i for i in index.with_prefix(prefix) if glob_matches(names[i]))
 
         # Search in language-specific files
         if language:
-            files_to_search = self.language_files.get(language, [])
-        else:
-            files_to_search = self.file_index.values()
+            hit_names = {index.names[i] for i in hits}
+            return [
+                Path(file_path) for file_path in self.language_files.get(language, [])
+                if os.path.basename(file_path) in hit_names
+            ]
 
-        for file_path in files_to_search:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                matches.append(file_path)
-            elif pattern.lower() in file_path.name.lower():
-                matches.append(file_path)
+        return [Path(index.paths[i]) for i in sorted(hits)]
 
-        return matches
+    def _get_name_index(self) -> _NameIndex:
+        """Return the lookup index over file_index, building it on first use."""
+        if self._name_index is None:
+            self._name_index = _NameIndex(self.file_index)
+        return self._name_index
 
-    def get_file_context(self, file_path: Path) -> Dict[str, Any]:
+    def get_file_context(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Get contextual information about a file.
 
         Args:
@@ -377,34 +921,41 @@ class ProjectContext:
         Returns:
             Dictionary with file context.
         """
+        path = os.fspath(file_path)
+        name = os.path.basename(path)
+        stem, extension = os.path.splitext(name)
+
+        try:
+            size = os.stat(path).st_size
+        except (FileNotFoundError, NotADirectoryError):
+            size = 0
+
         context = {
-            'path': file_path,
-            'name': file_path.name,
-            'extension': file_path.suffix,
-            'size': file_path.stat().st_size if file_path.exists() else 0,
+            'path': Path(path),
+            'name': name,
+            'extension': extension,
+            'size': size,
             'relative_path': None,
             'language': None,
             'related_files': [],
         }
 
         # Get relative path
-        try:
-            context['relative_path'] = file_path.relative_to(self.root_path)
-        except ValueError:
-            context['relative_path'] = file_path
+        root_prefix = os.path.join(str(self.root_path), '')
+        if path.startswith(root_prefix):
+            context['relative_path'] = Path(path[len(root_prefix):])
+        else:
+            context['relative_path'] = context['path']
 
         # Detect language
-        ext = file_path.suffix.lower()
-        for lang, extensions in self.LANGUAGE_EXTENSIONS.items():
-            if ext in extensions:
-                context['language'] = lang
-                break
+        context['language'] = self.EXT_TO_LANG.get(extension.lower())
 
         # Find related files (same name, different extension)
-        stem = file_path.stem
-        for indexed_file in self.file_index.values():
-            if indexed_file.stem == stem and indexed_file != file_path:
-                context['related_files'].append(indexed_file)
+        context['related_files'] = [
+            Path(indexed_file)
+            for indexed_file in self._get_name_index().stems.get(stem, [])
+            if indexed_file != path
+        ]
 
         return context
 
@@ -455,9 +1006,17 @@ class ProjectContext:
             file_path: Path to Python file.
 
         Returns:
-            Analysis results.
+            Analysis results. Unchanged files are served from a cache keyed on
+            their modification time and size.
         """
         try:
+            key = str(file_path)
+            st = os.stat(key)
+            hit = self._analysis_cache.get(key)
+            if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+                self._analysis_cache.move_to_end(key)
+                return hit[2]
+
             with open(file_path, 'r', encoding='utf-8') as f:
                 source = f.read()
 
@@ -470,7 +1029,7 @@ class ProjectContext:
                 'docstring': ast.get_docstring(tree),
             }
 
-            for node in ast.walk(tree):
+            for node in _walk_statements(tree):
                 if isinstance(node, ast.FunctionDef):
                     analysis['functions'].append({
                         'name': node.name,
@@ -498,6 +1057,10 @@ class ProjectContext:
                         for alias in node.names:
                             analysis['imports'].append(f"{module}.{alias.name}")
 
+            self._analysis_cache[key] = (st.st_mtime_ns, st.st_size, analysis)
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > self.analysis_cache_max_size:
+                self._analysis_cache.popitem(last=False)
             return analysis
 
         except Exception as e:
@@ -521,39 +1084,31 @@ class ProjectContext:
         if not self._initialized:
             self.initialize()
 
-        # Simple relevance scoring based on filename matching
-        scored_files = []
-
-        query_lower = query.lower()
-        query_parts = query_lower.split()
+        # Simple relevance scoring based on filename matching. Each search
+        # only visits the files that hit, so files scoring 0 cost nothing.
+        index = self._get_name_index()
+        scores: Dict[int, int] = defaultdict(int)
 
-        for file_path in self.file_index.values():
-            score = 0
-            file_lower = str(file_path).lower()
+        # Exact filename match
+        for i in index.name_text.containing(query):
+            scores[i] += 10
 
-            # Exact filename match
-            if query_lower in file_path.name.lower():
-                score += 10
+        # Partial matches
+        for part in query.lower().split():
+            for i in index.path_text.containing(part):
+                scores[i] += 1
 
-            # Partial matches
-            for part in query_parts:
-                if part in file_lower:
-                    score += 1
-
-            if score > 0:
-                scored_files.append((score, file_path))
-
-        # Sort by score and return top results
-        scored_files.sort(reverse=True, key=lambda x: x[0])
+        # Highest score first; ties keep file index order
+        ranked = sorted(scores, key=lambda i: (-scores[i], i))
 
         return [
-            self.get_file_context(file_path)
-            for score, file_path in scored_files[:max_files]
+            self.get_file_context(index.paths[i])
+            for i in ranked[:max_files]
         ]
 
 
 class ContextCache:
-    """Cache for expensive context operations."""
+    """Cache for expensive context operations (least recently used eviction)."""
 
     def __init__(self, max_size: int = 100):
         """Initialize context cache.
@@ -561,9 +1116,9 @@ class ContextCache:
         Args:
             max_size: Maximum cache size.
         """
-        self.cache: Dict[str, Any] = {}
+        # Ordered from least to most recently used
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
         self.max_size = max_size
-        self.access_count: Dict[str, int] = defaultdict(int)
 
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache.
@@ -575,7 +1130,7 @@ class ContextCache:
             Cached value or None.
         """
         if key in self.cache:
-            self.access_count[key] += 1
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
 
@@ -586,16 +1141,14 @@ class ContextCache:
             key: Cache key.
             value: Value to cache.
         """
-        if len(self.cache) >= self.max_size:
-            # Evict least accessed item
-            least_accessed = min(self.access_count.items(), key=lambda x: x[1])[0]
-            del self.cache[least_accessed]
-            del self.access_count[least_accessed]
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Evict least recently used item
+            self.cache.popitem(last=False)
 
         self.cache[key] = value
-        self.access_count[key] = 0
 
     def clear(self) -> None:
         """Clear the cache."""
         self.cache.clear()
-        self.access_count.clear()
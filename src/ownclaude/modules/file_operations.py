@@ -1,18 +1,76 @@
 """File operations module for managing files and directories."""
 
+import errno
+import os
+import secrets
 import shutil
+import stat
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
 from loguru import logger
 
 
+def _stat_or_none(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path in one syscall, following symlinks.
+
+    Callers branch on ``stat.S_ISREG``/``S_ISDIR`` of the result instead of
+    paying separate ``exists()``/``is_file()``/``is_dir()`` stats.
+
+    Args:
+        path: Path to stat.
+
+    Returns:
+        The stat result, or None if the path does not exist.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 class FileOperations:
     """Handles file and directory operations."""
 
     def __init__(self):
         """Initialize file operations handler."""
-        pass
+        # Absolute path -> (monotonic time, stat result or None if missing).
+        # Back-to-back operations on a path share one stat while it is fresh.
+        self._stat_cache: "OrderedDict[str, tuple[float, Optional[os.stat_result]]]" = OrderedDict()
+        self.stat_cache_ttl = 0.1
+        self.stat_cache_max_size = 256
+
+    def _cached_stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a path, reusing a result taken within the last ``stat_cache_ttl`` seconds.
+
+        Args:
+            path: Path to stat (symlinks are followed, like ``Path.exists``).
+
+        Returns:
+            The stat result, or None if the path does not exist.
+        """
+        key = os.path.abspath(path)
+        now = time.monotonic()
+        hit = self._stat_cache.get(key)
+        if hit is not None and now - hit[0] < self.stat_cache_ttl:
+            return hit[1]
+
+        st = _stat_or_none(key)
+        self._stat_cache[key] = (now, st)
+        self._stat_cache.move_to_end(key)
+        if len(self._stat_cache) > self.stat_cache_max_size:
+            self._stat_cache.popitem(last=False)
+        return st
+
+    def _invalidate_stats(self) -> None:
+        """Forget cached stats after this handler changes the filesystem.
+
+        Changes are rare next to lookups, so the whole cache is dropped rather
+        than tracking every parent directory or subtree an operation touched.
+        """
+        self._stat_cache.clear()
 
     def create_file(
         self,
@@ -34,14 +92,16 @@ class FileOperations:
 
         try:
             # Check if file exists
-            if path.exists() and not overwrite:
+            st = self._cached_stat(path)
+            if st is not None and not overwrite:
                 return False, f"File already exists: {file_path}", None
 
+            self._invalidate_stats()
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write content
-            path.write_text(content, encoding='utf-8')
+            self._atomic_write(path, content, st)
 
             logger.info(f"Created file: {file_path}")
             rollback_info = {"path": str(path)}
@@ -51,6 +111,52 @@ class FileOperations:
             logger.error(f"Failed to create file {file_path}: {e}")
             return False, str(e), None
 
+    def _atomic_write(
+        self,
+        path: Path,
+        content: str,
+        st: Optional[os.stat_result] = None
+    ) -> None:
+        """Write text to a file so readers see either the old or the new content.
+
+        The data goes to a temporary file in the same directory, is flushed to
+        disk and then renamed over the target. A failure part-way leaves the
+        original file untouched.
+
+        Args:
+            path: File to write. A symlink is followed and its target replaced.
+            content: Text to write (UTF-8, platform newlines like ``write_text``).
+            st: Current stat of the file, if it exists; its permissions are kept.
+        """
+        if os.path.islink(path):
+            path = Path(os.path.realpath(path))
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        data = content.encode('utf-8')
+
+        mode = stat.S_IMODE(st.st_mode) if st is not None and stat.S_ISREG(st.st_mode) else None
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        # New files get the usual 0o666 & ~umask, as open() would give them
+        fd = os.open(
+            tmp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+            0o666
+        )
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def read_file(self, file_path: str) -> tuple[bool, str, Optional[str]]:
         """Read content from a file.
 
@@ -63,10 +169,11 @@ class FileOperations:
         path = Path(file_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"File not found: {file_path}", None
 
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return False, f"Not a file: {file_path}", None
 
             content = path.read_text(encoding='utf-8')
@@ -93,14 +200,16 @@ class FileOperations:
         path = Path(file_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"File not found: {file_path}", None
 
             # Save original content for rollback
             original_content = path.read_text(encoding='utf-8')
 
+            self._invalidate_stats()
             # Write new content
-            path.write_text(content, encoding='utf-8')
+            self._atomic_write(path, content, st)
 
             logger.info(f"Modified file: {file_path}")
             rollback_info = {
@@ -125,15 +234,17 @@ class FileOperations:
             content: Content to append.
 
         Returns:
-            Tuple of (success, message, rollback_info).
+            Tuple of (success, message, rollback_info). ``original_size`` in
+            the rollback info is None if the file did not exist before.
         """
         path = Path(file_path)
 
         try:
-            original_content = ""
-            if path.exists():
-                original_content = path.read_text(encoding='utf-8')
-            else:
+            # Undoing an append only needs the old length, not the old content
+            st = self._cached_stat(path)
+            original_size = st.st_size if st is not None else None
+            self._invalidate_stats()
+            if st is None:
                 path.parent.mkdir(parents=True, exist_ok=True)
 
             with path.open("a", encoding="utf-8") as fh:
@@ -142,7 +253,7 @@ class FileOperations:
             logger.info(f"Appended to file: {file_path}")
             rollback_info = {
                 "path": str(path),
-                "original_content": original_content
+                "original_size": original_size
             }
             return True, f"Appended content to {file_path}", rollback_info
 
@@ -162,16 +273,18 @@ class FileOperations:
         path = Path(file_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"File not found: {file_path}", None
 
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return False, f"Not a file: {file_path}", None
 
             # Save content for rollback
             content = path.read_text(encoding='utf-8')
 
             # Delete file
+            self._invalidate_stats()
             path.unlink()
 
             logger.info(f"Deleted file: {file_path}")
@@ -197,6 +310,7 @@ class FileOperations:
         path = Path(dir_path)
 
         try:
+            self._invalidate_stats()
             path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created directory: {dir_path}")
             return True, f"Created directory: {dir_path}"
@@ -222,12 +336,14 @@ class FileOperations:
         path = Path(dir_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"Directory not found: {dir_path}"
 
-            if not path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, f"Not a directory: {dir_path}"
 
+            self._invalidate_stats()
             if recursive:
                 shutil.rmtree(path)
             else:
@@ -252,22 +368,27 @@ class FileOperations:
         path = Path(dir_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"Directory not found: {dir_path}", None
 
-            if not path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, f"Not a directory: {dir_path}", None
 
             contents = []
-            for item in path.iterdir():
-                stat = item.stat()
-                contents.append({
-                    'name': item.name,
-                    'path': str(item),
-                    'type': 'directory' if item.is_dir() else 'file',
-                    'size': stat.st_size if item.is_file() else 0,
-                    'modified': stat.st_mtime
-                })
+            # Path('.') / name renders as a bare name, unlike scandir's './name'
+            bare_names = str(path) == '.'
+            # One stat per entry answers type, size and mtime together
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    entry_stat = entry.stat()
+                    contents.append({
+                        'name': entry.name,
+                        'path': entry.name if bare_names else entry.path,
+                        'type': 'directory' if stat.S_ISDIR(entry_stat.st_mode) else 'file',
+                        'size': entry_stat.st_size if stat.S_ISREG(entry_stat.st_mode) else 0,
+                        'modified': entry_stat.st_mtime
+                    })
 
             contents.sort(key=lambda x: (x['type'] != 'directory', x['name']))
             return True, f"Listed {len(contents)} items in {dir_path}", contents
@@ -295,10 +416,11 @@ class FileOperations:
         path = Path(directory)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"Directory not found: {directory}", None
 
-            if not path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, f"Not a directory: {directory}", None
 
             if recursive and not pattern.startswith("**"):
@@ -333,15 +455,17 @@ class FileOperations:
         dst = Path(destination)
 
         try:
-            if not src.exists():
+            src_st = self._cached_stat(src)
+            if src_st is None:
                 return False, f"Source file not found: {source}"
 
-            if not src.is_file():
+            if not stat.S_ISREG(src_st.st_mode):
                 return False, f"Source is not a file: {source}"
 
-            if dst.exists() and not overwrite:
+            if self._cached_stat(dst) is not None and not overwrite:
                 return False, f"Destination already exists: {destination}"
 
+            self._invalidate_stats()
             # Create destination directory if needed
             dst.parent.mkdir(parents=True, exist_ok=True)
 
@@ -373,16 +497,23 @@ class FileOperations:
         dst = Path(destination)
 
         try:
-            if not src.exists():
+            src_st = self._cached_stat(src)
+            if src_st is None:
                 return False, f"Source file not found: {source}"
 
-            if dst.exists() and not overwrite:
+            dst_st = self._cached_stat(dst)
+            if dst_st is not None and not overwrite:
                 return False, f"Destination already exists: {destination}"
 
+            self._invalidate_stats()
             # Create destination directory if needed
             dst.parent.mkdir(parents=True, exist_ok=True)
 
-            shutil.move(str(src), str(dst))
+            if dst_st is not None and stat.S_ISDIR(dst_st.st_mode):
+                # Moving into an existing directory
+                shutil.move(str(src), str(dst))
+            else:
+                self._move_path(src, dst, src_st)
             logger.info(f"Moved {source} to {destination}")
             return True, f"Moved {source} to {destination}"
 
@@ -390,6 +521,34 @@ class FileOperations:
             logger.error(f"Failed to move file: {e}")
             return False, str(e)
 
+    def _move_path(self, src: Path, dst: Path, src_st: os.stat_result) -> None:
+        """Move ``src`` to the exact path ``dst``, replacing any file there.
+
+        A same-filesystem move is a single rename. Across filesystems a
+        regular file is copied with ``shutil.copyfile``, which copies in the
+        kernel where the platform allows, and then the source is removed.
+
+        Args:
+            src: Source path.
+            dst: Destination path (not an existing directory).
+            src_st: Stat of the source, following symlinks.
+        """
+        try:
+            os.replace(src, dst)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        if not stat.S_ISREG(src_st.st_mode) or src.is_symlink():
+            # Directories and links keep shutil's handling
+            shutil.move(str(src), str(dst))
+            return
+
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+        os.unlink(src)
+
     def get_file_info(self, file_path: str) -> tuple[bool, str, Optional[Dict[str, Any]]]:
         """Get information about a file.
 
@@ -402,21 +561,21 @@ class FileOperations:
         path = Path(file_path)
 
         try:
-            if not path.exists():
+            st = self._cached_stat(path)
+            if st is None:
                 return False, f"File not found: {file_path}", None
 
-            stat = path.stat()
             info = {
                 'name': path.name,
                 'path': str(path.absolute()),
-                'type': 'directory' if path.is_dir() else 'file',
-                'size': stat.st_size,
-                'created': stat.st_ctime,
-                'modified': stat.st_mtime,
-                'accessed': stat.st_atime,
+                'type': 'directory' if stat.S_ISDIR(st.st_mode) else 'file',
+                'size': st.st_size,
+                'created': st.st_ctime,
+                'modified': st.st_mtime,
+                'accessed': st.st_atime,
             }
 
-            if path.is_file():
+            if stat.S_ISREG(st.st_mode):
                 info['extension'] = path.suffix
 
             return True, "File info retrieved", info
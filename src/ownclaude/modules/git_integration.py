@@ -1,14 +1,37 @@
 """Git integration for version control operations."""
 
+import asyncio
+import io
+import locale
+import os
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from loguru import logger
 
 
+def _git_read(*args: str) -> List[str]:
+    """Command line for a git command that only reads the repository.
+
+    ``--no-optional-locks`` (like GIT_OPTIONAL_LOCKS=0) stops commands such
+    as status and diff from taking index.lock to write back refreshed stat
+    data, so they never block, or fail because of, a concurrent git command.
+    """
+    return ['git', '--no-optional-locks', *args]
+
+
+@lru_cache(maxsize=1024)
+def _commit_date(timestamp: int) -> datetime:
+    """Local datetime for a commit timestamp; commits often share one."""
+    return datetime.fromtimestamp(timestamp)
+
+
 @dataclass
 class GitCommit:
     """Represents a git commit."""
@@ -33,6 +56,8 @@ class GitStatus:
 class GitIntegration:
     """Git version control integration."""
 
+    STATUS_COMMAND = _git_read('status', '--branch', '--porcelain=v2', '--ahead-behind', '-z')
+
     def __init__(self, repo_path: Optional[Path] = None):
         """Initialize git integration.
 
@@ -40,29 +65,163 @@ class GitIntegration:
             repo_path: Path to git repository. Defaults to current directory.
         """
         self.repo_path = repo_path or Path.cwd()
+        # Repository and common (shared by worktrees) git directories
+        self._git_dir: Optional[Path] = None
+        self._common_dir: Optional[Path] = None
         self._is_repo = self._check_is_repo()
+        # (expiry, key files' mtimes, result); reused while git's own files are
+        # unchanged. Working tree edits don't touch them, hence the short TTL.
+        self._status_cache: Optional[Tuple[float, Tuple, GitStatus]] = None
+        self._branches_cache: Optional[Tuple[float, Tuple, List[str]]] = None
+        self.status_cache_ttl = 0.5
+        # Long-lived `git cat-file --batch` for object reads, started on first use
+        self._cat_file: Optional[subprocess.Popen] = None
+        self._cat_file_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Stop the background git process, if one was started."""
+        with self._cat_file_lock:
+            proc, self._cat_file = self._cat_file, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+        finally:
+            proc.stdout.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _run(self, args: List[str], input: Optional[str] = None,
+             timeout: float = 30) -> subprocess.CompletedProcess:
+        """Run a git command in the repository and capture its text output.
+
+        On POSIX ``close_fds=False`` spares the child a sweep over every open
+        descriptor before exec. Nothing leaks: descriptors Python creates are
+        non-inheritable (PEP 446) and only the std streams are passed on.
+
+        Args:
+            args: Full command line.
+            input: Text to feed to the command's stdin.
+            timeout: Seconds before the command is abandoned.
+
+        Returns:
+            The completed process.
+        """
+        return subprocess.run(
+            args,
+            input=input,
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            close_fds=os.name == 'nt'
+        )
 
     def _check_is_repo(self) -> bool:
         """Check if current directory is a git repository.
 
+        Looks for ``.git`` in the directory and its parents first, which
+        settles almost every case with a few stats; git itself is only
+        asked when that finds nothing usable or GIT_DIR overrides discovery.
+
         Returns:
             True if is a git repo.
         """
+        if 'GIT_DIR' not in os.environ and self._find_git_dir():
+            return True
+
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                _git_read('rev-parse', '--absolute-git-dir', '--git-common-dir'),
                 timeout=5
             )
-            return result.returncode == 0
+            if result.returncode != 0:
+                return False
+
+            git_dir, common_dir = result.stdout.splitlines()[:2]
+            self._git_dir = Path(git_dir)
+            # Relative to the working directory when not absolute
+            self._common_dir = Path(self.repo_path, common_dir)
+            return True
         except Exception:
             return False
 
+    def _find_git_dir(self, max_levels: int = 40) -> bool:
+        """Locate the git directories by walking up from the repository path.
+
+        Args:
+            max_levels: Maximum number of directories to check.
+
+        Returns:
+            True if a usable ``.git`` directory or gitfile was found.
+        """
+        directory = os.path.abspath(self.repo_path)
+        for _ in range(max_levels):
+            dot_git = os.path.join(directory, '.git')
+            try:
+                if os.path.isdir(dot_git):
+                    git_dir = dot_git
+                elif os.path.isfile(dot_git):
+                    # Worktrees and submodules: "gitdir: <path>"
+                    with open(dot_git, 'r', encoding='utf-8') as f:
+                        content = f.read().strip()
+                    if not content.startswith('gitdir:'):
+                        return False
+                    git_dir = os.path.join(directory, content[len('gitdir:'):].strip())
+                else:
+                    parent = os.path.dirname(directory)
+                    if parent == directory:
+                        return False
+                    directory = parent
+                    continue
+
+                if not os.path.isfile(os.path.join(git_dir, 'HEAD')):
+                    return False
+
+                # Linked worktrees share refs with the main repository
+                common_dir = git_dir
+                try:
+                    with open(os.path.join(git_dir, 'commondir'), 'r', encoding='utf-8') as f:
+                        common_dir = os.path.join(git_dir, f.read().strip())
+                except FileNotFoundError:
+                    pass
+
+                self._git_dir = Path(os.path.normpath(git_dir))
+                self._common_dir = Path(os.path.normpath(common_dir))
+                return True
+            except OSError:
+                return False
+
+        return False
+
+    def _mtimes(self, *paths: Path) -> Tuple[Optional[int], ...]:
+        """Modification times of git's own files, None for missing ones."""
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _invalidate_cache(self) -> None:
+        """Forget cached status and branches after changing the repository."""
+        self._status_cache = None
+        self._branches_cache = None
+
     def is_repository(self) -> bool:
         """Check if this is a git repository.
 
+        Settled once in ``__init__``, normally by a few stats of ``.git``, so
+        this is free to call repeatedly.
+
         Returns:
             True if is a git repository.
         """
@@ -71,88 +230,189 @@ class GitIntegration:
     def get_status(self) -> Optional[GitStatus]:
         """Get current git status.
 
+        Branch, ahead/behind counts and file states all come from a single
+        ``git status --branch --porcelain=v2 -z`` call. Records are NUL
+        terminated and paths are never quoted, so any file name parses.
+        Repeated calls within ``status_cache_ttl`` seconds reuse the result
+        as long as the index and HEAD are unchanged.
+
         Returns:
             GitStatus object or None if not a repo.
         """
         if not self._is_repo:
             return None
 
+        # Taken before reading, so a change made while git runs is not masked
+        key = self._status_key()
+        cached = self._cached_status(key)
+        if cached is not None:
+            return cached
+
+        status = self._read_status()
+        self._store_status(status, key)
+        return status
+
+    def _status_key(self) -> Tuple[Optional[int], ...]:
+        """Cache key for get_status: the index and HEAD mtimes."""
+        return self._mtimes(self._git_dir / 'index', self._git_dir / 'HEAD')
+
+    def _cached_status(self, key: Tuple[Optional[int], ...]) -> Optional[GitStatus]:
+        """Return the cached status if it is still valid for ``key``."""
+        cached = self._status_cache
+        if cached and cached[0] > time.monotonic() and cached[1] == key:
+            return cached[2]
+        return None
+
+    def _store_status(self, status: Optional[GitStatus], key: Tuple[Optional[int], ...]) -> None:
+        """Cache a freshly read status under the key taken before reading."""
+        if status is not None:
+            self._status_cache = (time.monotonic() + self.status_cache_ttl, key, status)
+
+    def _read_status(self) -> Optional[GitStatus]:
+        """Run git status and parse it; see get_status."""
         try:
-            # Get branch name
-            branch_result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                self.STATUS_COMMAND,
                 timeout=5
             )
-            branch = branch_result.stdout.strip()
+            return self._parse_status(result.stdout)
 
-            # Get status
-            status_result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        except Exception as e:
+            logger.error(f"Failed to get git status: {e}")
+            return None
 
-            staged = []
-            unstaged = []
-            untracked = []
+    @staticmethod
+    def _parse_status(output: str) -> GitStatus:
+        """Parse ``git status --branch --porcelain=v2 -z`` output.
 
-            for line in status_result.stdout.splitlines():
-                if not line:
-                    continue
+        Args:
+            output: Output of STATUS_COMMAND.
 
-                status_code = line[:2]
-                file_path = line[3:]
-
-                if status_code[0] != ' ' and status_code[0] != '?':
-                    staged.append(file_path)
-                if status_code[1] != ' ':
-                    unstaged.append(file_path)
-                if status_code == '??':
-                    untracked.append(file_path)
-
-            # Get ahead/behind info
-            ahead, behind = self._get_ahead_behind()
-
-            return GitStatus(
-                branch=branch,
-                staged=staged,
-                unstaged=unstaged,
-                untracked=untracked,
-                ahead=ahead,
-                behind=behind
-            )
+        Returns:
+            GitStatus object.
+        """
+        branch = ""
+        ahead = behind = 0
+        staged = []
+        unstaged = []
+        untracked = []
+
+        records = iter(output.split('\0'))
+        for line in records:
+            kind = line[:1]
+
+            if kind == '#':
+                # "# branch.head <name>", "# branch.ab +<ahead> -<behind>"
+                header = line.split()
+                if header[1] == 'branch.head' and header[2] != '(detached)':
+                    branch = header[2]
+                elif header[1] == 'branch.ab':
+                    ahead, behind = int(header[2]), -int(header[3])
+                continue
+
+            if kind == '?':
+                untracked.append(line[2:])
+                continue
+
+            # Changed ("1"), renamed/copied ("2") and unmerged ("u")
+            # entries: fixed fields, then the path
+            if kind == '1':
+                fields = line.split(' ', 8)
+            elif kind == '2':
+                fields = line.split(' ', 9)
+                # The original path follows as its own record
+                next(records, None)
+            elif kind == 'u':
+                fields = line.split(' ', 10)
+            else:
+                continue
 
-        except Exception as e:
-            logger.error(f"Failed to get git status: {e}")
-            return None
+            status_code, file_path = fields[1], fields[-1]
+            if status_code[0] != '.':
+                staged.append(file_path)
+            if status_code[1] != '.':
+                unstaged.append(file_path)
+
+        return GitStatus(
+            branch=branch,
+            staged=staged,
+            unstaged=unstaged,
+            untracked=untracked,
+            ahead=ahead,
+            behind=behind
+        )
+
+    def _read_object(self, spec: str) -> Optional[Tuple[str, bytes]]:
+        """Read an object through the persistent ``git cat-file --batch``.
 
-    def _get_ahead_behind(self) -> Tuple[int, int]:
-        """Get ahead/behind commit count.
+        Spawning git costs far more than the read itself, so one process
+        serves every lookup made through this instance.
+
+        Args:
+            spec: Object name, e.g. a SHA or ``<rev>:<path>``.
 
         Returns:
-            Tuple of (ahead, behind).
+            Tuple of (object type, content), or None if it does not exist.
         """
-        try:
-            result = subprocess.run(
-                ['git', 'rev-list', '--left-right', '--count', 'HEAD...@{upstream}'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        if '\n' in spec:
+            raise ValueError("object name cannot contain a newline")
 
-            if result.returncode == 0:
-                parts = result.stdout.strip().split()
-                return int(parts[0]), int(parts[1])
-        except Exception:
-            pass
+        with self._cat_file_lock:
+            if self._cat_file is None or self._cat_file.poll() is not None:
+                self._cat_file = subprocess.Popen(
+                    _git_read('cat-file', '--batch'),
+                    cwd=self.repo_path,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            proc = self._cat_file
+
+            try:
+                proc.stdin.write(spec.encode('utf-8') + b'\n')
+                proc.stdin.flush()
+
+                # "<sha> <type> <size>", or "<spec> missing" / "<spec> ambiguous".
+                # Split from the right: the spec itself may contain spaces.
+                line = proc.stdout.readline()
+                if not line:
+                    raise EOFError("git cat-file exited")
+                header = line.rstrip(b'\n').rsplit(b' ', 2)
+                if len(header) != 3 or not header[2].isdigit():
+                    return None
+                size = int(header[2])
+                content = proc.stdout.read(size + 1)[:size]  # drop trailing LF
+                if len(content) != size:
+                    raise EOFError("git cat-file exited")
+                return header[1].decode('ascii'), content
+            except Exception:
+                # Out of sync with the process; start a fresh one next time
+                proc.kill()
+                self._cat_file = None
+                raise
+
+    def get_file_content(self, file_path: str, revision: str = "HEAD") -> Optional[str]:
+        """Get a file's content as of a revision.
+
+        Args:
+            file_path: Path to file, relative to the repository root.
+            revision: Commit, branch or tag to read from.
+
+        Returns:
+            File content, or None if it does not exist at that revision.
+        """
+        if not self._is_repo:
+            return None
+
+        try:
+            obj = self._read_object(f"{revision}:{file_path}")
+            if obj is None or obj[0] != 'blob':
+                return None
+            return obj[1].decode('utf-8', errors='replace')
 
-        return 0, 0
+        except Exception as e:
+            logger.error(f"Failed to read {file_path} at {revision}: {e}")
+            return None
 
     def get_diff(self, staged: bool = False) -> str:
         """Get git diff.
@@ -167,15 +427,8 @@ class GitIntegration:
             return ""
 
         try:
-            cmd = ['git', 'diff']
-            if staged:
-                cmd.append('--cached')
-
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                self._diff_command(staged),
                 timeout=30
             )
 
@@ -194,68 +447,94 @@ class GitIntegration:
         Returns:
             List of GitCommit objects.
         """
+        return list(self.iter_log(max_count))
+
+    def iter_log(self, max_count: int = 10) -> Iterator[GitCommit]:
+        """Iterate over the git log as git produces it.
+
+        Commits are parsed from git's output as it streams in, so callers
+        can stop early without waiting for, or holding, the whole log.
+
+        Args:
+            max_count: Maximum number of commits to retrieve.
+
+        Yields:
+            GitCommit objects, newest first.
+        """
         if not self._is_repo:
-            return []
+            return
 
         try:
-            result = subprocess.run(
-                [
-                    'git', 'log',
-                    f'-{max_count}',
-                    '--pretty=format:%H|%an|%at|%s',
-                    '--shortstat'
-                ],
+            with subprocess.Popen(
+                self._log_command(max_count),
                 cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            commits = []
-            lines = result.stdout.splitlines()
-            i = 0
-
-            while i < len(lines):
-                line = lines[i].strip()
-                if '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 4:
-                        commit_hash = parts[0]
-                        author = parts[1]
-                        timestamp = int(parts[2])
-                        message = parts[3]
-
-                        # Look for file changes in next line
-                        files_changed = 0
-                        if i + 1 < len(lines) and 'file' in lines[i + 1]:
-                            # Parse "X files changed" from stat line
-                            stat_line = lines[i + 1]
-                            if 'file' in stat_line:
-                                try:
-                                    files_changed = int(stat_line.split()[0])
-                                except (ValueError, IndexError):
-                                    pass
-                            i += 1
-
-                        commits.append(GitCommit(
-                            hash=commit_hash,
-                            author=author,
-                            date=datetime.fromtimestamp(timestamp),
-                            message=message,
-                            files_changed=files_changed
-                        ))
-
-                i += 1
-
-            return commits
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ) as process:
+                yield from self._parse_log(process.stdout)
 
         except Exception as e:
             logger.error(f"Failed to get log: {e}")
-            return []
+
+    @staticmethod
+    def _diff_command(staged: bool) -> List[str]:
+        """Command for get_diff."""
+        return _git_read('diff', '--cached') if staged else _git_read('diff')
+
+    @staticmethod
+    def _log_command(max_count: int) -> List[str]:
+        """Command for iter_log."""
+        return _git_read(
+            'log',
+            f'-{max_count}',
+            '--pretty=format:%H|%an|%at|%s',
+            '--shortstat'
+        )
+
+    @staticmethod
+    def _parse_log(lines: Iterable[str]) -> Iterator[GitCommit]:
+        """Parse ``_log_command`` output, yielding commits as they complete.
+
+        Args:
+            lines: Output lines, possibly still arriving.
+
+        Yields:
+            GitCommit objects.
+        """
+        # A commit is complete once the next one (or the end) arrives,
+        # since its "X files changed" line follows the header
+        pending = None
+
+        for line in lines:
+            line = line.strip()
+            parts = line.split('|')
+            if '|' in line and len(parts) >= 4:
+                if pending:
+                    yield pending
+                pending = GitCommit(
+                    hash=parts[0],
+                    author=parts[1],
+                    date=_commit_date(int(parts[2])),
+                    message=parts[3],
+                    files_changed=0
+                )
+            elif pending and 'file' in line:
+                # Parse "X files changed" from stat line
+                try:
+                    pending.files_changed = int(line.split()[0])
+                except (ValueError, IndexError):
+                    pass
+
+        if pending:
+            yield pending
 
     def stage_files(self, files: List[str]) -> Tuple[bool, str]:
         """Stage files for commit.
 
+        Paths are passed on stdin rather than the command line, so any
+        number of files takes one git call and never hits argument limits.
+
         Args:
             files: List of file paths to stage.
 
@@ -266,14 +545,13 @@ class GitIntegration:
             return False, "Not a git repository"
 
         try:
-            result = subprocess.run(
-                ['git', 'add'] + files,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                ['git', 'add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                input='\0'.join(files),
                 timeout=30
             )
 
+            self._invalidate_cache()
             if result.returncode == 0:
                 return True, f"Staged {len(files)} file(s)"
             else:
@@ -286,6 +564,8 @@ class GitIntegration:
     def unstage_files(self, files: List[str]) -> Tuple[bool, str]:
         """Unstage files.
 
+        Paths are passed on stdin, as in stage_files.
+
         Args:
             files: List of file paths to unstage.
 
@@ -296,14 +576,13 @@ class GitIntegration:
             return False, "Not a git repository"
 
         try:
-            result = subprocess.run(
-                ['git', 'reset', 'HEAD'] + files,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                ['git', 'reset', 'HEAD', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                input='\0'.join(files),
                 timeout=30
             )
 
+            self._invalidate_cache()
             if result.returncode == 0:
                 return True, f"Unstaged {len(files)} file(s)"
             else:
@@ -326,14 +605,12 @@ class GitIntegration:
             return False, "Not a git repository"
 
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['git', 'commit', '-m', message],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
+            self._invalidate_cache()
             if result.returncode == 0:
                 return True, "Commit created successfully"
             else:
@@ -357,30 +634,21 @@ class GitIntegration:
             return False, "Not a git repository"
 
         try:
-            cmd = ['git', 'branch', branch_name]
-            result = subprocess.run(
+            # "checkout -b" creates and switches in one step
+            if checkout:
+                cmd = ['git', 'checkout', '-b', branch_name]
+            else:
+                cmd = ['git', 'branch', branch_name]
+
+            result = self._run(
                 cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30
             )
+            self._invalidate_cache()
 
             if result.returncode != 0:
                 return False, result.stderr
 
-            if checkout:
-                checkout_result = subprocess.run(
-                    ['git', 'checkout', branch_name],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-
-                if checkout_result.returncode != 0:
-                    return False, checkout_result.stderr
-
             return True, f"Branch '{branch_name}' created" + (" and checked out" if checkout else "")
 
         except Exception as e:
@@ -400,14 +668,12 @@ class GitIntegration:
             return False, "Not a git repository"
 
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['git', 'checkout', branch_name],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
+            self._invalidate_cache()
             if result.returncode == 0:
                 return True, f"Switched to branch '{branch_name}'"
             else:
@@ -420,29 +686,31 @@ class GitIntegration:
     def list_branches(self) -> List[str]:
         """List all branches.
 
+        Repeated calls within ``status_cache_ttl`` seconds reuse the result
+        as long as the branch refs are unchanged.
+
         Returns:
             List of branch names.
         """
         if not self._is_repo:
             return []
 
+        key = self._mtimes(self._common_dir / 'refs' / 'heads', self._common_dir / 'packed-refs')
+        cached = self._branches_cache
+        if cached and cached[0] > time.monotonic() and cached[1] == key:
+            return list(cached[2])
+
         try:
-            result = subprocess.run(
-                ['git', 'branch', '--list'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                # Plumbing output: one bare name per line, no markers to strip
+                _git_read('for-each-ref', '--format=%(refname:lstrip=2)', 'refs/heads/'),
                 timeout=30
             )
 
-            branches = []
-            for line in result.stdout.splitlines():
-                # Remove * for current branch and whitespace
-                branch = line.strip().lstrip('* ')
-                if branch:
-                    branches.append(branch)
+            branches = [line for line in result.stdout.split('\n') if line]
 
-            return branches
+            self._branches_cache = (time.monotonic() + self.status_cache_ttl, key, branches)
+            return list(branches)
 
         except Exception as e:
             logger.error(f"Failed to list branches: {e}")
@@ -462,15 +730,12 @@ class GitIntegration:
             return []
 
         try:
-            cmd = ['git', 'diff', '--name-only', commit1]
+            cmd = _git_read('diff', '--name-only', commit1)
             if commit2:
                 cmd.append(commit2)
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
@@ -494,16 +759,13 @@ class GitIntegration:
             return []
 
         try:
-            result = subprocess.run(
-                [
-                    'git', 'log',
+            result = self._run(
+                _git_read(
+                    'log',
                     f'-{max_count}',
                     '--pretty=format:%H|%an|%at|%s',
                     '--', file_path
-                ],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+                ),
                 timeout=30
             )
 
@@ -514,7 +776,7 @@ class GitIntegration:
                     commits.append(GitCommit(
                         hash=parts[0],
                         author=parts[1],
-                        date=datetime.fromtimestamp(int(parts[2])),
+                        date=_commit_date(int(parts[2])),
                         message=parts[3],
                         files_changed=1
                     ))
@@ -524,3 +786,108 @@ class GitIntegration:
         except Exception as e:
             logger.error(f"Failed to get file history: {e}")
             return []
+
+    async def _a_run(self, args: List[str], timeout: float) -> str:
+        """Run a git command without blocking the event loop.
+
+        Args:
+            args: Command and arguments.
+            timeout: Timeout in seconds.
+
+        Returns:
+            Standard output, decoded as ``text=True`` would.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=self.repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        # Locale encoding and universal newlines, like text-mode subprocess
+        return io.TextIOWrapper(io.BytesIO(stdout), encoding=locale.getpreferredencoding(False)).read()
+
+    async def a_get_status(self) -> Optional[GitStatus]:
+        """Async version of get_status, sharing its cache.
+
+        Returns:
+            GitStatus object or None if not a repo.
+        """
+        if not self._is_repo:
+            return None
+
+        key = self._status_key()
+        cached = self._cached_status(key)
+        if cached is not None:
+            return cached
+
+        try:
+            status = self._parse_status(await self._a_run(self.STATUS_COMMAND, timeout=5))
+        except Exception as e:
+            logger.error(f"Failed to get git status: {e}")
+            return None
+
+        self._store_status(status, key)
+        return status
+
+    async def a_get_log(self, max_count: int = 10) -> List[GitCommit]:
+        """Async version of get_log.
+
+        Args:
+            max_count: Maximum number of commits to retrieve.
+
+        Returns:
+            List of GitCommit objects.
+        """
+        if not self._is_repo:
+            return []
+
+        try:
+            output = await self._a_run(self._log_command(max_count), timeout=30)
+            return list(self._parse_log(output.splitlines()))
+        except Exception as e:
+            logger.error(f"Failed to get log: {e}")
+            return []
+
+    async def a_get_diff(self, staged: bool = False) -> str:
+        """Async version of get_diff.
+
+        Args:
+            staged: Whether to get staged diff.
+
+        Returns:
+            Diff output.
+        """
+        if not self._is_repo:
+            return ""
+
+        try:
+            return await self._a_run(self._diff_command(staged), timeout=30)
+        except Exception as e:
+            logger.error(f"Failed to get diff: {e}")
+            return ""
+
+    async def gather_dashboard(self, max_count: int = 10) -> Dict[str, Any]:
+        """Fetch status, recent log and diff concurrently.
+
+        The three git commands run at the same time, so this takes about as
+        long as the slowest of them rather than their sum.
+
+        Args:
+            max_count: Maximum number of commits to retrieve.
+
+        Returns:
+            Dictionary with 'status', 'log' and 'diff'.
+        """
+        status, log, diff = await asyncio.gather(
+            self.a_get_status(),
+            self.a_get_log(max_count),
+            self.a_get_diff()
+        )
+        return {'status': status, 'log': log, 'diff': diff}
@@ -1,16 +1,85 @@
 """Terminal command execution with streaming output support."""
 
+import asyncio
+import codecs
+import io
+import locale
 import os
+import re
+import selectors
+import shlex
+import shutil
 import subprocess
 import threading
+import time
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Callable, Deque, Dict, Any, List, Union
 
 from loguru import logger
 
 
+@lru_cache(maxsize=32)
+def _list_names(directory: str, mtime_ns: int) -> frozenset:
+    """Names in a directory; ``mtime_ns`` keys the cache to its contents."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode complete output the same way _OutputLines decodes chunks."""
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace'),
+        translate=True
+    )
+    return decoder.decode(data, final=True)
+
+
+class _OutputLines:
+    """Collects complete lines from chunks of a command's output.
+
+    Decodes the way text-mode pipes do (locale encoding, universal newlines),
+    except that undecodable bytes are replaced rather than raising.
+    """
+
+    def __init__(self, prefix: str, callback: Callable[[str], None]):
+        """Initialize the collector.
+
+        Args:
+            prefix: Prefix for lines passed to the callback.
+            callback: Called with each complete line, right-stripped.
+        """
+        self.lines: List[str] = []
+        self.prefix = prefix
+        self._callback = callback
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace'),
+            translate=True
+        )
+        self._partial = ''
+
+    def feed(self, chunk: bytes) -> None:
+        """Add a chunk of output; an empty chunk marks the end of output."""
+        parts = (self._partial + self._decoder.decode(chunk, final=not chunk)).split('\n')
+        # Hold back an unterminated line until it completes
+        self._partial = parts.pop()
+        lines = [part + '\n' for part in parts]
+        if not chunk and self._partial:
+            lines.append(self._partial)
+            self._partial = ''
+
+        for line in lines:
+            self.lines.append(line)
+            self._callback(f"{self.prefix}{line.rstrip()}")
+
+
 class CommandResult:
     """Result of a command execution."""
 
@@ -58,6 +127,26 @@ class TerminalExecutor:
         'chown -R',
     ]
 
+    # DANGEROUS_COMMANDS as one case-insensitive search, and the chaining
+    # and substitution syntax is_safe_command looks for
+    _DANGER_RE = re.compile('|'.join(re.escape(c.lower()) for c in DANGEROUS_COMMANDS))
+    _DANGER_NAMES = {c.lower(): c for c in DANGEROUS_COMMANDS}
+    _INJECT_RE = re.compile(r'[;|`]|&&|\$\(')
+    _CHAIN_OK_RE = re.compile('git|echo|grep|find')
+
+    # Commands made only of these characters need no shell features beyond
+    # quoting: no expansion, redirection, globbing, comments or chaining
+    _PLAIN_COMMAND_RE = re.compile(r"[\w@%+=:,./'\" \t-]*")
+    # Shell builtins and keywords, plus builtins whose standalone binaries
+    # behave differently; these still go through the shell
+    _SHELL_WORDS = frozenset({
+        '.', 'alias', 'break', 'case', 'cd', 'command', 'continue', 'echo',
+        'eval', 'exec', 'exit', 'export', 'for', 'function', 'hash', 'if',
+        'local', 'pwd', 'read', 'readonly', 'return', 'set', 'shift',
+        'source', 'time', 'trap', 'type', 'ulimit', 'umask', 'unalias',
+        'unset', 'until', 'wait', 'while',
+    })
+
     # Safe commands that can be executed without confirmation
     SAFE_COMMANDS = [
         'ls', 'dir', 'cd', 'pwd', 'cat', 'echo', 'which', 'where',
@@ -74,8 +163,12 @@ class TerminalExecutor:
             working_directory: Working directory for commands. Defaults to current directory.
         """
         self.working_directory = working_directory or Path.cwd()
-        self.command_history: List[CommandResult] = []
         self.max_history = 100
+        # Oldest entries drop off once max_history results are stored
+        self.command_history: Deque[CommandResult] = deque(maxlen=self.max_history)
+        self._history_lock = threading.Lock()
+        # Concurrent commands in execute_multiple when stop_on_error is False
+        self.max_parallel_commands = max(1, (os.cpu_count() or 4) * 3 // 4)
 
     def is_safe_command(self, command: str) -> tuple[bool, Optional[str]]:
         """Check if a command is safe to execute.
@@ -89,9 +182,9 @@ class TerminalExecutor:
         command_lower = command.lower().strip()
 
         # Check dangerous commands
-        for dangerous in self.DANGEROUS_COMMANDS:
-            if dangerous.lower() in command_lower:
-                return False, f"Dangerous command detected: {dangerous}"
+        match = self._DANGER_RE.search(command_lower)
+        if match:
+            return False, f"Dangerous command detected: {self._DANGER_NAMES[match.group(0)]}"
 
         # Check for potentially dangerous patterns
         if 'rm -rf' in command_lower and '/' in command_lower:
@@ -101,9 +194,9 @@ class TerminalExecutor:
             return False, "sudo commands require manual execution for security"
 
         # Check for command injection attempts
-        if any(char in command for char in [';', '&&', '||', '|', '`', '$(']):
+        if self._INJECT_RE.search(command):
             # Allow these in specific safe contexts
-            if not any(safe in command_lower for safe in ['git', 'echo', 'grep', 'find']):
+            if not self._CHAIN_OK_RE.search(command_lower):
                 return False, "Command chaining detected - please execute commands individually"
 
         return True, None
@@ -130,18 +223,11 @@ class TerminalExecutor:
 
         # Safety check
         if check_safety:
-            is_safe, reason = self.is_safe_command(command)
-            if not is_safe:
-                logger.warning(f"Command blocked: {reason}")
-                return CommandResult(
-                    command=command,
-                    returncode=-1,
-                    stdout="",
-                    stderr=f"Command blocked for safety: {reason}",
-                    duration=0.0
-                )
+            blocked = self._blocked_result(command)
+            if blocked:
+                return blocked
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
             if stream_callback:
@@ -149,7 +235,7 @@ class TerminalExecutor:
             else:
                 result = self._execute_standard(command, timeout)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
 
             cmd_result = CommandResult(
                 command=command,
@@ -165,7 +251,7 @@ class TerminalExecutor:
             return cmd_result
 
         except subprocess.TimeoutExpired:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             logger.error(f"Command timed out after {timeout}s: {command}")
             return CommandResult(
                 command=command,
@@ -175,7 +261,7 @@ class TerminalExecutor:
                 duration=duration
             )
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             logger.error(f"Command execution failed: {e}")
             return CommandResult(
                 command=command,
@@ -185,6 +271,92 @@ class TerminalExecutor:
                 duration=duration
             )
 
+    async def aexecute(
+        self,
+        command: str,
+        timeout: Optional[int] = 300,
+        check_safety: bool = True
+    ) -> CommandResult:
+        """Execute a command without blocking the event loop.
+
+        Worth it only when several commands can overlap, e.g. under
+        ``asyncio.gather``; for a single command prefer execute.
+
+        Args:
+            command: Command to execute.
+            timeout: Command timeout in seconds.
+            check_safety: Whether to check command safety.
+
+        Returns:
+            CommandResult object.
+        """
+        logger.info(f"Executing command: {command}")
+
+        if check_safety:
+            blocked = self._blocked_result(command)
+            if blocked:
+                return blocked
+
+        start_time = time.monotonic()
+
+        try:
+            args = self._command_args(command)
+            options = {'cwd': self.working_directory, 'stdout': asyncio.subprocess.PIPE,
+                       'stderr': asyncio.subprocess.PIPE}
+            if isinstance(args, str):
+                process = await asyncio.create_subprocess_shell(args, **options)
+            else:
+                process = await asyncio.create_subprocess_exec(*args, **options)
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error(f"Command timed out after {timeout}s: {command}")
+                return CommandResult(
+                    command=command,
+                    returncode=-1,
+                    stdout="",
+                    stderr=f"Command timed out after {timeout} seconds",
+                    duration=time.monotonic() - start_time
+                )
+
+            cmd_result = CommandResult(
+                command=command,
+                returncode=process.returncode,
+                stdout=_decode_output(stdout),
+                stderr=_decode_output(stderr),
+                duration=time.monotonic() - start_time
+            )
+            self._add_to_history(cmd_result)
+            return cmd_result
+
+        except Exception as e:
+            logger.error(f"Command execution failed: {e}")
+            return CommandResult(
+                command=command,
+                returncode=-1,
+                stdout="",
+                stderr=str(e),
+                duration=time.monotonic() - start_time
+            )
+
+    def _blocked_result(self, command: str) -> Optional[CommandResult]:
+        """Result for a command that fails the safety check, else None."""
+        is_safe, reason = self.is_safe_command(command)
+        if is_safe:
+            return None
+
+        logger.warning(f"Command blocked: {reason}")
+        return CommandResult(
+            command=command,
+            returncode=-1,
+            stdout="",
+            stderr=f"Command blocked for safety: {reason}",
+            duration=0.0
+        )
+
     def _execute_standard(
         self,
         command: str,
@@ -192,6 +364,9 @@ class TerminalExecutor:
     ) -> subprocess.CompletedProcess:
         """Execute command without streaming.
 
+        Output is captured as bytes and decoded once at the end like the
+        other paths do, so a stray undecodable byte doesn't fail the command.
+
         Args:
             command: Command to execute.
             timeout: Timeout in seconds.
@@ -199,15 +374,51 @@ class TerminalExecutor:
         Returns:
             CompletedProcess object.
         """
-        return subprocess.run(
-            command,
-            shell=True,
+        args = self._command_args(command)
+        result = subprocess.run(
+            args,
+            shell=isinstance(args, str),
             cwd=self.working_directory,
             capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=os.environ.copy()
+            timeout=timeout
         )
+        result.stdout = _decode_output(result.stdout)
+        result.stderr = _decode_output(result.stderr)
+        return result
+
+    def _command_args(self, command: str) -> Union[str, List[str]]:
+        """Split a command into argv when it doesn't need a shell.
+
+        Running a plain command directly saves starting ``/bin/sh`` just to
+        parse it, and a timeout then kills the command itself rather than
+        only the shell around it.
+
+        Args:
+            command: Command to execute.
+
+        Returns:
+            Argument list to execute directly, or the command string if it
+            has to run through the shell.
+        """
+        if os.name == 'nt' or not self._PLAIN_COMMAND_RE.fullmatch(command):
+            return command
+
+        try:
+            args = shlex.split(command)
+        except ValueError:
+            return command
+
+        # Leave assignments, builtins, paths and unknown programs to the
+        # shell, so they behave and fail exactly as before
+        if (
+            not args
+            or '=' in args[0]
+            or '/' in args[0]
+            or args[0] in self._SHELL_WORDS
+            or shutil.which(args[0]) is None
+        ):
+            return command
+        return args
 
     def _execute_streaming(
         self,
@@ -217,6 +428,74 @@ class TerminalExecutor:
     ) -> subprocess.CompletedProcess:
         """Execute command with streaming output.
 
+        Both pipes are read from this thread as they become ready. Windows
+        cannot select on pipes, so there each pipe gets a reader thread.
+
+        Args:
+            command: Command to execute.
+            callback: Callback for output lines.
+            timeout: Timeout in seconds.
+
+        Returns:
+            CompletedProcess-like object.
+        """
+        if os.name == 'nt':
+            return self._execute_streaming_threads(command, callback, timeout)
+
+        args = self._command_args(command)
+        process = subprocess.Popen(
+            args,
+            shell=isinstance(args, str),
+            cwd=self.working_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        stdout = _OutputLines("", callback)
+        stderr = _OutputLines("[stderr] ", callback)
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ, stdout)
+            selector.register(process.stderr, selectors.EVENT_READ, stderr)
+
+            try:
+                while selector.get_map():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise subprocess.TimeoutExpired(command, timeout)
+
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        key.data.feed(chunk)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            key.fileobj.close()
+
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                returncode = process.wait(timeout=remaining)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+
+        # Create result object
+        result = type('CompletedProcess', (), {
+            'returncode': returncode,
+            'stdout': ''.join(stdout.lines),
+            'stderr': ''.join(stderr.lines),
+        })()
+
+        return result
+
+    def _execute_streaming_threads(
+        self,
+        command: str,
+        callback: Callable[[str], None],
+        timeout: Optional[int]
+    ) -> subprocess.CompletedProcess:
+        """Execute command with streaming output, one reader thread per pipe.
+
         Args:
             command: Command to execute.
             callback: Callback for output lines.
@@ -230,32 +509,31 @@ class TerminalExecutor:
             shell=True,
             cwd=self.working_directory,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=os.environ.copy()
+            stderr=subprocess.PIPE
         )
 
-        stdout_lines = []
-        stderr_lines = []
+        stdout = _OutputLines("", callback)
+        stderr = _OutputLines("[stderr] ", callback)
 
-        def read_output(pipe, lines_list, prefix=""):
-            """Read output from pipe."""
+        def read_output(pipe, output):
+            """Read output from pipe in large chunks."""
             try:
-                for line in iter(pipe.readline, ''):
-                    if line:
-                        lines_list.append(line)
-                        callback(f"{prefix}{line.rstrip()}")
+                while True:
+                    chunk = os.read(pipe.fileno(), 65536)
+                    output.feed(chunk)
+                    if not chunk:
+                        break
             finally:
                 pipe.close()
 
         # Start threads to read stdout and stderr
         stdout_thread = threading.Thread(
             target=read_output,
-            args=(process.stdout, stdout_lines, "")
+            args=(process.stdout, stdout)
         )
         stderr_thread = threading.Thread(
             target=read_output,
-            args=(process.stderr, stderr_lines, "[stderr] ")
+            args=(process.stderr, stderr)
         )
 
         stdout_thread.start()
@@ -275,8 +553,8 @@ class TerminalExecutor:
         # Create result object
         result = type('CompletedProcess', (), {
             'returncode': returncode,
-            'stdout': ''.join(stdout_lines),
-            'stderr': ''.join(stderr_lines),
+            'stdout': ''.join(stdout.lines),
+            'stderr': ''.join(stderr.lines),
         })()
 
         return result
@@ -289,14 +567,22 @@ class TerminalExecutor:
     ) -> List[CommandResult]:
         """Execute multiple commands.
 
+        Without stop_on_error the commands are treated as independent and run
+        concurrently, up to ``max_parallel_commands`` at a time. Streamed
+        lines are then tagged with their command's position.
+
         Args:
             commands: List of commands to execute.
             stop_on_error: Whether to stop on first error.
             stream_callback: Optional callback for streaming output.
 
         Returns:
-            List of CommandResult objects.
+            List of CommandResult objects, in command order.
         """
+        workers = min(len(commands), self.max_parallel_commands)
+        if not stop_on_error and workers > 1:
+            return self._execute_parallel(commands, workers, stream_callback)
+
         results = []
 
         for i, command in enumerate(commands):
@@ -313,17 +599,50 @@ class TerminalExecutor:
 
         return results
 
+    def _execute_parallel(
+        self,
+        commands: List[str],
+        workers: int,
+        stream_callback: Optional[Callable[[str], None]]
+    ) -> List[CommandResult]:
+        """Execute independent commands on a thread pool.
+
+        Args:
+            commands: List of commands to execute.
+            workers: Number of commands to run at once.
+            stream_callback: Optional callback for streaming output.
+
+        Returns:
+            List of CommandResult objects, in command order.
+        """
+        callback_lock = threading.Lock()
+
+        def run(numbered: tuple[int, str]) -> CommandResult:
+            i, command = numbered
+            tag = f"[{i+1}/{len(commands)}]"
+            if stream_callback:
+                def callback(line: str) -> None:
+                    # One line at a time, so output from different commands
+                    # interleaves by line rather than mid-line
+                    with callback_lock:
+                        stream_callback(f"{tag} {line}")
+
+                callback(f"Executing: {command}")
+            else:
+                callback = None
+            return self.execute(command, stream_callback=callback)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, enumerate(commands)))
+
     def _add_to_history(self, result: CommandResult) -> None:
         """Add command result to history.
 
         Args:
             result: Command result to add.
         """
-        self.command_history.append(result)
-
-        # Trim history if needed
-        if len(self.command_history) > self.max_history:
-            self.command_history = self.command_history[-self.max_history:]
+        with self._history_lock:
+            self.command_history.append(result)
 
     def get_history(self, limit: Optional[int] = None) -> List[CommandResult]:
         """Get command history.
@@ -334,13 +653,32 @@ class TerminalExecutor:
         Returns:
             List of CommandResult objects.
         """
-        if limit:
-            return self.command_history[-limit:]
-        return self.command_history.copy()
+        with self._history_lock:
+            if limit:
+                start = max(0, len(self.command_history) - limit)
+                return list(islice(self.command_history, start, None))
+            return list(self.command_history)
 
     def clear_history(self) -> None:
         """Clear command history."""
-        self.command_history.clear()
+        with self._history_lock:
+            self.command_history.clear()
+
+    def _detect_project_files(self) -> frozenset:
+        """Names in the working directory, for build tool auto-detection.
+
+        One directory listing answers every marker check, and it is reused
+        until the directory's modification time changes.
+
+        Returns:
+            Set of file and directory names.
+        """
+        directory = str(self.working_directory)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return frozenset()
+        return _list_names(directory, mtime_ns)
 
     def run_tests(self, test_command: Optional[str] = None) -> CommandResult:
         """Run project tests.
@@ -355,14 +693,14 @@ class TerminalExecutor:
             return self.execute(test_command)
 
         # Auto-detect test command
-        if (self.working_directory / 'package.json').exists():
+        files = self._detect_project_files()
+        if 'package.json' in files:
             return self.execute('npm test')
-        elif (self.working_directory / 'pytest.ini').exists() or \
-             (self.working_directory / 'setup.py').exists():
+        elif 'pytest.ini' in files or 'setup.py' in files:
             return self.execute('pytest')
-        elif (self.working_directory / 'Cargo.toml').exists():
+        elif 'Cargo.toml' in files:
             return self.execute('cargo test')
-        elif (self.working_directory / 'go.mod').exists():
+        elif 'go.mod' in files:
             return self.execute('go test ./...')
         else:
             return CommandResult(
@@ -386,15 +724,16 @@ class TerminalExecutor:
             return self.execute(build_command)
 
         # Auto-detect build command
-        if (self.working_directory / 'package.json').exists():
+        files = self._detect_project_files()
+        if 'package.json' in files:
             return self.execute('npm run build')
-        elif (self.working_directory / 'setup.py').exists():
+        elif 'setup.py' in files:
             return self.execute('python setup.py build')
-        elif (self.working_directory / 'Cargo.toml').exists():
+        elif 'Cargo.toml' in files:
             return self.execute('cargo build')
-        elif (self.working_directory / 'go.mod').exists():
+        elif 'go.mod' in files:
             return self.execute('go build ./...')
-        elif (self.working_directory / 'Makefile').exists():
+        elif 'Makefile' in files:
             return self.execute('make')
         else:
             return CommandResult(
@@ -418,11 +757,12 @@ class TerminalExecutor:
             return self.execute(linter_command)
 
         # Auto-detect linter
-        if (self.working_directory / 'package.json').exists():
+        files = self._detect_project_files()
+        if 'package.json' in files:
             return self.execute('npm run lint')
-        elif (self.working_directory / '.flake8').exists():
+        elif '.flake8' in files:
             return self.execute('flake8 .')
-        elif (self.working_directory / 'pyproject.toml').exists():
+        elif 'pyproject.toml' in files:
             return self.execute('black --check .')
         else:
             return CommandResult(
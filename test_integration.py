@@ -1,9 +1,42 @@
 #!/usr/bin/env python3
-"""Integration test to verify all PBOS AI modules work together."""
+"""Integration tests to verify all PBOS AI modules work together.
 
+Tests are grouped into one class per module, and the groups are independent,
+so the suite can be spread across processes a class at a time:
+
+    pytest -n auto --dist=loadscope --max-worker-restart=0 test_integration.py
+
+Each class then runs on a single worker, which builds that module's shared
+fixture once.
+
+Running this file directly does the same whenever pytest-xdist is installed,
+and stops at the first failure (-x). With pytest-timeout installed each test
+is capped at 10 seconds (5 for the terminal executor).
+
+While fixing a failure, rerun just the tests that failed last time with
+`pytest --lf test_integration.py` (also accepted when running the file
+directly), or let pytest-xdist rerun them on every source change with
+`pytest --looponfail test_integration.py`.
+
+Scratch files go to /dev/shm when it exists, or to OWNCLAUDE_TMP if set, so
+the file operation round-trip (which fsyncs) stays in memory. To scan a copy
+of the tree on a RAM disk as well, point OWNCLAUDE_TEST_ROOT at it:
+
+    sudo mount -t tmpfs -o size=256m tmpfs /mnt/ownclaude
+    rsync -a --exclude .git ./ /mnt/ownclaude/
+    OWNCLAUDE_TEST_ROOT=/mnt/ownclaude pytest test_integration.py
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -11,165 +44,223 @@ from ownclaude.modules.context_manager import ProjectContext
 from ownclaude.modules.terminal_executor import TerminalExecutor
 from ownclaude.modules.code_search import CodeSearch
 from ownclaude.modules.git_integration import GitIntegration
+from ownclaude.modules.file_operations import FileOperations
+
+
+def _time_limit(seconds: float) -> list:
+    """Marks capping a test's run time, when pytest-timeout is installed."""
+    if importlib.util.find_spec("pytest_timeout") is None:
+        return []
+    return [pytest.mark.timeout(seconds, method="thread")]
+
 
+# A hung git or shell command fails its test instead of stalling the run
+pytestmark = _time_limit(10)
 
-def test_project_context():
-    """Test project context manager."""
-    print("Testing ProjectContext...")
 
-    context = ProjectContext()
+@pytest.fixture(scope="session")
+def context():
+    """Project context for the working tree, scanned once per session."""
+    root = os.environ.get("OWNCLAUDE_TEST_ROOT")
+    context = ProjectContext(Path(root) if root else None)
     context.initialize(max_depth=3)
+    return context
 
-    print(f"✓ Project initialized")
-    print(f"✓ Found {len(context.file_index)} files")
-    print(f"✓ Project type: {context.project_type}")
 
-    summary = context.get_project_summary()
-    print(f"✓ Generated project summary")
+@pytest.fixture(scope="session")
+def project_summary(context):
+    """Summary of the shared project context."""
+    return context.get_project_summary()
 
-    # Test file finding
-    python_files = context.find_files("*.py")
-    print(f"✓ Found {len(python_files)} Python files")
 
-    print("ProjectContext: PASSED\n")
+@pytest.fixture(scope="session")
+def executor():
+    """Terminal executor shared by the executor tests."""
+    return TerminalExecutor()
 
 
-def test_terminal_executor():
-    """Test terminal command execution."""
-    print("Testing TerminalExecutor...")
+@pytest.fixture(scope="session")
+def search():
+    """Code search over the working tree, shared by the search tests."""
+    return CodeSearch()
 
-    executor = TerminalExecutor()
 
-    # Test safe command
-    result = executor.execute("echo 'Hello from PBOS AI!'")
-    assert result.success, "Echo command should succeed"
-    print(f"✓ Safe command execution works")
+@pytest.fixture(scope="session")
+def git():
+    """Git integration for the working tree."""
+    git = GitIntegration()
+    yield git
+    git.close()
 
-    # Test dangerous command blocking
-    result = executor.execute("rm -rf /")
-    assert not result.success, "Dangerous command should be blocked"
-    print(f"✓ Dangerous command blocked correctly")
 
-    # Test command history
-    history = executor.get_history(limit=5)
-    assert len(history) >= 1, "History should contain at least 1 command"
-    print(f"✓ Command history working ({len(history)} commands recorded)")
+@pytest.fixture(scope="session")
+def ops():
+    """File operations handler shared by the file operation tests."""
+    return FileOperations()
 
-    print("TerminalExecutor: PASSED\n")
 
+@pytest.fixture
+def scratch_dir(tmp_path):
+    """Directory for files a test writes, on a RAM disk when there is one."""
+    root = os.environ.get("OWNCLAUDE_TMP") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+    if root is None:
+        yield tmp_path
+        return
+    path = Path(tempfile.mkdtemp(prefix="ownclaude_test_", dir=root))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
 
-def test_code_search():
-    """Test code search functionality."""
-    print("Testing CodeSearch...")
 
-    search = CodeSearch()
+class TestProjectContext:
+    """Project context manager."""
 
-    # Search for imports in Python files
-    matches = search.grep("import", file_pattern="*.py", max_results=5)
-    print(f"✓ Found {len(matches)} import statements")
+    def test_project_context(self, context, project_summary):
+        """Test project context manager."""
+        assert context.file_index, "Project should contain indexed files"
+        assert context.project_type, "Project type should be detected"
+        assert project_summary, "Project summary should be generated"
 
-    # Find class definitions
-    definitions = search.find_definition("ProjectContext", def_type="class")
-    if definitions:
-        print(f"✓ Found ProjectContext class definition")
-    else:
-        print("⚠ ProjectContext class not found (may be expected)")
+        # Test file finding; it answers from the scan, without walking again
+        python_files = context.find_files("*.py")
+        assert python_files, "Python files should be found"
+        indexed = {path for path in context.file_index.values() if path.endswith(".py")}
+        assert {str(path) for path in python_files} == indexed
 
-    # Search for TODOs
-    todos = search.find_todos()
-    print(f"✓ Found {len(todos)} TODO comments")
 
-    print("CodeSearch: PASSED\n")
+class TestTerminalExecutor:
+    """Terminal command execution, sharing one executor."""
 
+    pytestmark = _time_limit(5)
 
-def test_git_integration():
-    """Test git integration."""
-    print("Testing GitIntegration...")
+    def test_safe_command(self, executor):
+        """Test that safe commands run, on the blocking and the async path."""
+        async def run_commands():
+            # Overlapped rather than back to back
+            return await asyncio.gather(
+                asyncio.to_thread(executor.execute, "echo 'Hello from PBOS AI!'"),
+                executor.aexecute("echo 'Hello again'")
+            )
 
-    git = GitIntegration()
+        result, async_result = asyncio.run(run_commands())
+        assert result.success and result.stdout == "Hello from PBOS AI!\n", "Echo command should succeed"
+        assert async_result.success and async_result.stdout == "Hello again\n"
 
-    if git.is_repository():
-        print(f"✓ Git repository detected")
+    def test_dangerous_command_blocked(self, executor):
+        """Test that dangerous commands are refused without running."""
+        assert not executor.execute("rm -rf /").success, "Dangerous command should be blocked"
+        assert not asyncio.run(executor.aexecute("rm -rf /")).success
 
-        # Get status
-        status = git.get_status()
-        if status:
-            print(f"✓ Current branch: {status.branch}")
-            print(f"✓ Staged files: {len(status.staged)}")
-            print(f"✓ Unstaged files: {len(status.unstaged)}")
+    def test_history_recorded(self, executor):
+        """Test that executed commands are kept in the history."""
+        result = executor.execute("echo 'Hello from PBOS AI!'")
 
-        # Get log
-        commits = git.get_log(max_count=3)
-        print(f"✓ Retrieved {len(commits)} recent commits")
+        history = executor.get_history(limit=5)
+        assert history and history[-1] is result, "History should end with the last command"
 
-        # Get branches
-        branches = git.list_branches()
-        print(f"✓ Found {len(branches)} branches")
-    else:
-        print("⚠ Not a git repository (testing in non-git directory)")
 
-    print("GitIntegration: PASSED\n")
+class TestCodeSearch:
+    """Code search over the working tree."""
 
+    @pytest.mark.parametrize("query,pattern,limit", [
+        ("import", "*.py", 5),
+        ("def ", "*.py", 3),
+    ])
+    def test_grep(self, search, query, pattern, limit):
+        """Test searching file contents."""
+        matches = search.grep(query, file_pattern=pattern, max_results=limit)
+        assert 0 < len(matches) <= limit, f"Matches for {query!r} should be found"
 
-def test_file_operations():
-    """Test file operations through code."""
-    print("Testing FileOperations...")
+    def test_find_class_definition(self, search):
+        """Test finding a class definition."""
+        definitions = search.find_definition("ProjectContext", def_type="class")
+        assert definitions, "ProjectContext class definition should be found"
 
-    from ownclaude.modules.file_operations import FileOperations
+    def test_find_todos(self, search):
+        """Test collecting TODO comments."""
+        todos = search.find_todos()
+        assert isinstance(todos, list)
 
-    ops = FileOperations()
 
+class TestGitIntegration:
+    """Git integration."""
+
+    def test_git_integration(self, git):
+        """Test git integration."""
+        if not git.is_repository():
+            pytest.skip("Not a git repository (testing in non-git directory)")
+
+        async def snapshot():
+            # One round of git process startups instead of one after another
+            return await asyncio.gather(
+                git.gather_dashboard(max_count=3),
+                asyncio.to_thread(git.list_branches)
+            )
+
+        dashboard, branches = asyncio.run(snapshot())
+
+        status = dashboard["status"]
+        assert status is not None and status.branch, "Status should report a branch"
+
+        commits = dashboard["log"]
+        assert 0 < len(commits) <= 3, "Recent commits should be retrieved"
+
+        assert branches, "At least one branch should be listed"
+
+
+@pytest.fixture
+def fake_fs(request):
+    """In-memory filesystem from pyfakefs, skipping the test without it."""
+    pytest.importorskip("pyfakefs")
+    return request.getfixturevalue("fs")
+
+
+def _check_file_round_trip(ops, test_file: Path):
+    """Create, read, append to and delete a file through FileOperations."""
     # Test create
-    test_file = Path("test_temp_file.txt")
     success, msg, _ = ops.create_file(str(test_file), "Test content")
     assert success, f"File creation should succeed: {msg}"
-    print("✓ File creation works")
 
     # Test read
     success, msg, content = ops.read_file(str(test_file))
     assert success and content == "Test content", "File read should succeed"
-    print("✓ File reading works")
 
     # Test append
     success, msg, _ = ops.append_file(str(test_file), "\nAppended line")
     assert success, "File append should succeed"
-    print("✓ File appending works")
+    success, msg, content = ops.read_file(str(test_file))
+    assert success and content == "Test content\nAppended line", "Append should be readable"
 
     # Test delete
     success, msg, _ = ops.delete_file(str(test_file))
     assert success, "File deletion should succeed"
-    print("✓ File deletion works")
+    assert not test_file.exists(), "Deleted file should be gone"
 
-    print("FileOperations: PASSED\n")
 
+class TestFileOperations:
+    """File operations through code."""
 
-def main():
-    """Run all integration tests."""
-    print("=" * 60)
-    print("PBOS AI Integration Test Suite")
-    print("=" * 60)
-    print()
+    def test_file_operations(self, ops, fake_fs):
+        """Test file operation logic without touching the disk."""
+        fake_fs.create_dir("/work")
+        _check_file_round_trip(ops, Path("/work/test_temp_file.txt"))
 
-    try:
-        test_project_context()
-        test_terminal_executor()
-        test_code_search()
-        test_git_integration()
-        test_file_operations()
-
-        print("=" * 60)
-        print("ALL TESTS PASSED! ✓")
-        print("=" * 60)
-        print()
-        print("PBOS AI is ready to use!")
-        print("Run: python ownclaude.py")
-
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    def test_file_operations_real_disk(self, ops, scratch_dir):
+        """Test one file operation round-trip on a real filesystem."""
+        # scratch_dir is unique per test, so parallel workers never share the file
+        _check_file_round_trip(ops, scratch_dir / "test_temp_file.txt")
+
+
+def main() -> int:
+    """Run the suite, in parallel when pytest-xdist is available."""
+    args = [__file__, "-x", *sys.argv[1:]]
+    if (importlib.util.find_spec("xdist") is not None
+            and not any(arg.startswith(("-n", "--numprocesses")) for arg in args)):
+        # The tests are dominated by subprocess and filesystem waits
+        args += ["-n", "auto", "--dist=loadscope"]
+    return pytest.main(args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Shared setup for the unit tests."""
+
+import sys
+from pathlib import Path
+
+# Add src to path, as test_integration.py does
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,48 @@
+"""Unit tests for closing applications by name."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from ownclaude.modules.app_control import AppController
+
+
+@pytest.fixture
+def sleeper(tmp_path):
+    """A sleep process running under a name no other process has."""
+    sleep = shutil.which("sleep")
+    if sleep is None:
+        pytest.skip("sleep is not available")
+    binary = tmp_path / "ownclaude_sleeper"
+    shutil.copy(sleep, binary)
+    proc = subprocess.Popen([str(binary), "30"])
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+def test_close_application_signals_indexed_process(sleeper):
+    controller = AppController()
+
+    ok, _ = controller.close_application("ownclaude_sleeper")
+
+    assert ok
+    assert sleeper.wait(timeout=5) != 0
+
+
+def test_close_application_skips_reused_pid(sleeper, monkeypatch):
+    controller = AppController()
+    index = controller._snapshot_names(force=True)
+    [listed] = index["ownclaude_sleeper"]
+
+    # Make the listed process look older than the one now holding its pid,
+    # as if it had exited and the pid been handed to the sleeper since
+    pid, started = listed._ident
+    monkeypatch.setattr(listed, "_ident", (pid, started - 60))
+    monkeypatch.setattr(controller, "_snapshot_names", lambda force=False: index)
+
+    ok, _ = controller.close_application("ownclaude_sleeper")
+
+    assert not ok
+    assert sleeper.poll() is None
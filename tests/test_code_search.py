@@ -0,0 +1,161 @@
+"""Unit tests for CodeSearch's grep backends."""
+
+import base64
+import json
+import os
+
+import pytest
+
+from ownclaude.modules.code_search import CodeSearch
+
+
+@pytest.fixture
+def search(tmp_path):
+    """CodeSearch over a small tree, forced onto the Python fallback."""
+    (tmp_path / "words.txt").write_bytes(
+        "café au lait\nnaïve approach\nÉCOLE normale\nplain ascii line\r\n".encode("utf-8")
+    )
+    (tmp_path / "ascii.txt").write_bytes(b"alpha\nbeta\n# TODO: gamma\n")
+    search = CodeSearch(tmp_path)
+    search._rg_path = None
+    return search
+
+
+def _hits(matches):
+    return [(m.file_path.name, m.line_number, m.match_start, m.match_end) for m in matches]
+
+
+def test_dot_matches_a_whole_character(search):
+    assert _hits(search.grep("caf.")) == [("words.txt", 1, 0, 4)]
+    assert _hits(search.grep("na.ve")) == [("words.txt", 2, 0, 5)]
+
+
+def test_character_class_is_not_a_byte_class(search):
+    assert _hits(search.grep("[é]", case_sensitive=True)) == [("words.txt", 1, 3, 4)]
+
+
+def test_word_class_is_unicode_aware(search):
+    assert _hits(search.grep(r"caf\w\b")) == [("words.txt", 1, 0, 4)]
+
+
+def test_non_ascii_literal_hint_ignoring_case(search):
+    matches = search.grep("école", literal_hint="école")
+    assert _hits(matches) == [("words.txt", 3, 0, 5)]
+
+
+def test_ascii_file_scan(search):
+    assert _hits(search.grep("beta", literal_hint="beta")) == [("ascii.txt", 2, 0, 4)]
+    matches = search.grep("^plain.*line$")
+    assert _hits(matches) == [("words.txt", 4, 0, 16)]
+    assert matches[0].line_content == "plain ascii line"
+
+
+def test_find_todos(search):
+    assert _hits(search.find_todos()) == [("ascii.txt", 3, 0, 6)]
+
+
+def test_definition_cache_holds_a_whole_scan(tmp_path):
+    for i in range(12):
+        (tmp_path / f"m{i}.py").write_text(f"class C{i}:\n    pass\n")
+    search = CodeSearch(tmp_path)
+    search._rg_path = None
+    search.ast_cache_max_size = 4
+
+    assert len(search.find_definition("C3", def_type="class")) == 1
+    assert len(search._ast_cache) == 12
+    cached = dict(search._ast_cache)
+    assert len(search.find_definition("C3", def_type="class")) == 1
+    assert all(search._ast_cache[path] is entry for path, entry in cached.items())
+
+
+def test_walker_honours_ignore_patterns(search, tmp_path):
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "lib.txt").write_text("alpha\n")
+    (tmp_path / "notes.log").write_text("alpha\n")
+    search.ignore_patterns += ["vendor", "*.log"]
+
+    assert _hits(search.grep("alpha")) == [("ascii.txt", 1, 0, 5)]
+
+
+def _fake_rg(tmp_path, events, exit_code=0):
+    """Executable that prints canned ripgrep JSON events, one per line."""
+    output = tmp_path / "rg.jsonl"
+    output.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+    script = tmp_path / "rg"
+    script.write_text(f"#!/bin/sh\ncat '{output}'\nexit {exit_code}\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def _rg_line(kind, number, text, submatches=()):
+    data = {"lines": {"text": text}, "line_number": number}
+    if kind == "match":
+        data["submatches"] = list(submatches)
+    return {"type": kind, "data": data}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake rg is a shell script")
+def test_grep_ripgrep_parses_json_events(tmp_path):
+    search = CodeSearch(tmp_path)
+    search._rg_path = _fake_rg(tmp_path, [
+        {"type": "begin", "data": {"path": {"text": "/p/a.py"}}},
+        _rg_line("context", 1, "import os\n"),
+        # Byte offsets: "é" is two bytes, so "lait" starts at byte 6, char 5
+        _rg_line("match", 2, "café lait\n", [{"match": {"text": "lait"}, "start": 6, "end": 10}]),
+        _rg_line("context", 3, "x = 1\r\n"),
+        {"type": "end", "data": {"path": {"text": "/p/a.py"}}},
+        {"type": "begin", "data": {"path": {"bytes": base64.b64encode(b"/p/b\xff.py").decode()}}},
+        {"type": "match", "data": {
+            "lines": {"bytes": base64.b64encode(b"lait\xff\n").decode()},
+            "line_number": 7,
+            "submatches": [{"match": {"text": "lait"}, "start": 0, "end": 4}],
+        }},
+        {"type": "end", "data": {"path": {"bytes": base64.b64encode(b"/p/b\xff.py").decode()}}},
+        {"type": "summary", "data": {}},
+    ])
+
+    matches = search._grep_ripgrep("lait", "*", True, 1, 10)
+
+    assert [(str(m.file_path), m.line_number, m.match_start, m.match_end) for m in matches] == [
+        ("/p/a.py", 2, 5, 9),
+        ("/p/b.py", 7, 0, 4),
+    ]
+    first = matches[0]
+    assert (first.context_before, first.line_content, first.context_after) == (
+        ["import os"], "café lait", ["x = 1"]
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake rg is a shell script")
+def test_grep_ripgrep_stops_at_max_results(tmp_path):
+    search = CodeSearch(tmp_path)
+    events = [{"type": "begin", "data": {"path": {"text": "/p/a.py"}}}]
+    events += [
+        _rg_line("match", n, "hit\n", [{"match": {"text": "hit"}, "start": 0, "end": 3}])
+        for n in range(1, 6)
+    ]
+    events.append({"type": "end", "data": {"path": {"text": "/p/a.py"}}})
+    search._rg_path = _fake_rg(tmp_path, events)
+
+    assert [m.line_number for m in search._grep_ripgrep("hit", "*", True, 0, 2)] == [1, 2]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake rg is a shell script")
+def test_grep_ripgrep_error_falls_back(tmp_path):
+    search = CodeSearch(tmp_path)
+    search._rg_path = _fake_rg(tmp_path, [], exit_code=2)
+
+    assert search._grep_ripgrep("(?<=x)", "*", True, 0, 10) is None
+
+
+def test_signature_after_form_feed_line(tmp_path):
+    (tmp_path / "m.py").write_text(
+        "def f():\n    pass\n\x0c\ndef g(a: int) -> int:\n    return a\n"
+    )
+    search = CodeSearch(tmp_path)
+    search._rg_path = None
+
+    [definition] = search.find_definition("g")
+
+    assert definition.line_number == 4
+    assert definition.signature == "def g(a: int) -> int"
@@ -0,0 +1,93 @@
+"""Unit tests for the memory-mapped project index."""
+
+import pytest
+
+from ownclaude.modules.context_manager import (
+    ProjectContext,
+    _MappedFileIndex,
+    _MappedIndex,
+    _MappedPaths,
+    _write_index,
+)
+
+_FILE_INDEX = {
+    "setup.py": "/p/setup.py",
+    "café.py": "/p/src/café.py",
+    "a b.md": "/p/docs/a b.md",
+    "zeta.js": "/p/web/zeta.js",
+}
+_LANGUAGES = {
+    "python": ["/p/setup.py", "/p/src/café.py"],
+    "javascript": ["/p/web/zeta.js"],
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    cache_file = tmp_path / "index.bin"
+    _write_index(cache_file, {"root_path": "/p"}, _FILE_INDEX, _LANGUAGES)
+    index = _MappedIndex(cache_file)
+    yield index
+    index.close()
+
+
+def test_header_round_trip(index):
+    assert index.header["root_path"] == "/p"
+    assert index.header["languages"] == [["python", 2], ["javascript", 1]]
+
+
+def test_file_index_lookups(index):
+    file_index = _MappedFileIndex(index)
+
+    assert len(file_index) == 4
+    assert list(file_index) == list(_FILE_INDEX)
+    assert dict(file_index.items()) == _FILE_INDEX
+    assert list(file_index.values()) == list(_FILE_INDEX.values())
+    assert file_index["café.py"] == "/p/src/café.py"
+    assert file_index["a b.md"] == "/p/docs/a b.md"
+    assert "missing.py" not in file_index
+    with pytest.raises(KeyError):
+        file_index["cafe.py"]
+
+
+def test_language_lists(index):
+    python = _MappedPaths(index, 0, 2)
+    javascript = _MappedPaths(index, 2, 1)
+
+    assert list(python) == _LANGUAGES["python"]
+    assert python[-1] == "/p/src/café.py"
+    assert python[1:] == ["/p/src/café.py"]
+    assert list(javascript) == _LANGUAGES["javascript"]
+    with pytest.raises(IndexError):
+        javascript[1]
+
+
+def test_truncated_or_foreign_file_is_rejected(tmp_path):
+    cache_file = tmp_path / "index.bin"
+    _write_index(cache_file, {}, _FILE_INDEX, _LANGUAGES)
+    cache_file.write_bytes(cache_file.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        _MappedIndex(cache_file)
+
+    cache_file.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        _MappedIndex(cache_file)
+
+
+def test_project_context_reloads_from_cache(tmp_path):
+    root = tmp_path / "proj"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "naïve.py").write_text("x = 1\n")
+    (root / "README.md").write_text("# proj\n")
+    cache_dir = tmp_path / "cache"
+
+    scanned = ProjectContext(root, cache_dir)
+    scanned.initialize()
+    loaded = ProjectContext(root, cache_dir)
+    loaded.initialize()
+
+    assert isinstance(loaded.file_index, _MappedFileIndex)
+    assert dict(loaded.file_index.items()) == dict(scanned.file_index)
+    assert loaded.file_index["naïve.py"] == str(root / "src" / "naïve.py")
+    assert list(loaded.language_files["python"]) == list(scanned.language_files["python"])
+    loaded.invalidate_cache()
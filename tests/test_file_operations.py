@@ -0,0 +1,52 @@
+"""Unit tests for FileOperations' atomic writes."""
+
+import os
+import stat
+
+import pytest
+
+from ownclaude.modules.file_operations import FileOperations
+
+
+@pytest.fixture
+def ops():
+    return FileOperations()
+
+
+def test_atomic_write_replaces_content_and_keeps_mode(ops, tmp_path):
+    target = tmp_path / "f.txt"
+    target.write_text("old")
+    os.chmod(target, 0o640)
+
+    ops._atomic_write(target, "new\ncontent", target.stat())
+
+    assert target.read_bytes() == "new\ncontent".replace("\n", os.linesep).encode()
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert os.listdir(tmp_path) == ["f.txt"]
+
+
+def test_atomic_write_follows_symlink(ops, tmp_path):
+    real = tmp_path / "real.txt"
+    real.write_text("old")
+    link = tmp_path / "link.txt"
+    link.symlink_to(real)
+
+    ops._atomic_write(link, "café", link.stat())
+
+    assert link.is_symlink()
+    assert real.read_text(encoding="utf-8") == "café"
+
+
+def test_atomic_write_failure_leaves_original(ops, tmp_path, monkeypatch):
+    target = tmp_path / "f.txt"
+    target.write_text("old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        ops._atomic_write(target, "new", target.stat())
+
+    assert target.read_text() == "old"
+    assert os.listdir(tmp_path) == ["f.txt"]
@@ -0,0 +1,110 @@
+"""Unit tests for git status parsing and object reads."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from ownclaude.modules.git_integration import GitIntegration
+
+_SHA = "0" * 40
+
+
+def _status(*records: str):
+    return GitIntegration._parse_status("\0".join(records) + "\0")
+
+
+def test_branch_headers():
+    status = _status(
+        f"# branch.oid {_SHA}",
+        "# branch.head feature/x",
+        "# branch.upstream origin/feature/x",
+        "# branch.ab +3 -12",
+    )
+
+    assert status.branch == "feature/x"
+    assert (status.ahead, status.behind) == (3, 12)
+
+
+def test_detached_head_without_upstream():
+    status = _status(f"# branch.oid {_SHA}", "# branch.head (detached)")
+
+    assert status.branch == ""
+    assert (status.ahead, status.behind) == (0, 0)
+
+
+def test_changed_entries():
+    status = _status(
+        f"1 M. N... 100644 100644 100644 {_SHA} {_SHA} staged.py",
+        f"1 .M N... 100644 100644 100644 {_SHA} {_SHA} unstaged.py",
+        f"1 MM N... 100644 100644 100644 {_SHA} {_SHA} both.py",
+    )
+
+    assert status.staged == ["staged.py", "both.py"]
+    assert status.unstaged == ["unstaged.py", "both.py"]
+
+
+def test_rename_consumes_original_path_record():
+    status = _status(
+        f"2 R. N... 100644 100644 100644 {_SHA} {_SHA} R100 new name.py",
+        "old name.py",
+        "? after.txt",
+    )
+
+    assert status.staged == ["new name.py"]
+    assert status.unstaged == []
+    assert status.untracked == ["after.txt"]
+
+
+def test_unmerged_entry():
+    status = _status(
+        f"u UU N... 100644 100644 100644 100644 {_SHA} {_SHA} {_SHA} conflict.py",
+    )
+
+    assert status.staged == ["conflict.py"]
+    assert status.unstaged == ["conflict.py"]
+
+
+def test_paths_with_spaces_and_non_ascii_names():
+    status = _status(
+        f"1 A. N... 000000 100644 100644 {_SHA} {_SHA} docs/read me.md",
+        f"1 .M N... 100644 100644 100644 {_SHA} {_SHA} naïve/café.py",
+        "? 日本語 ファイル.txt",
+    )
+
+    assert status.staged == ["docs/read me.md"]
+    assert status.unstaged == ["naïve/café.py"]
+    assert status.untracked == ["日本語 ファイル.txt"]
+
+
+def test_ignored_entries_are_skipped():
+    status = _status("! build/out.o")
+
+    assert (status.staged, status.unstaged, status.untracked) == ([], [], [])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """GitIntegration over a one-commit repository holding "a b.txt"."""
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "a b.txt").write_text("spaced\n")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    repo = GitIntegration(tmp_path)
+    yield repo
+    repo.close()
+
+
+def test_missing_path_with_space_keeps_cat_file(repo):
+    assert repo.get_file_content("a b.txt") == "spaced\n"
+    proc = repo._cat_file
+
+    assert repo.get_file_content("no such") is None
+    assert repo._cat_file is proc and proc.poll() is None
+    assert repo.get_file_content("a b.txt") == "spaced\n"
@@ -0,0 +1,97 @@
+"""Unit tests for the streamed NDJSON reader and the response cache."""
+
+import json
+
+import pytest
+
+from ownclaude.core.config import Config, ConfigManager
+from ownclaude.core.ollama_client import OllamaClient
+
+
+class _Response:
+    """Stands in for a streaming requests.Response with canned chunks."""
+
+    def __init__(self, *chunks: bytes):
+        self._chunks = chunks
+
+    def iter_content(self, chunk_size: int):
+        return iter(self._chunks)
+
+
+def _parse(*chunks: bytes):
+    return list(OllamaClient._iter_ndjson(_Response(*chunks)))
+
+
+def test_lines_split_across_chunks():
+    assert _parse(b'{"a": 1}\n{"b"', b': 2}\n{"c": 3}\n') == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+def test_multibyte_character_split_across_chunks():
+    body = '{"text": "café"}\n'.encode("utf-8")
+    cut = body.index(b"\xa9")
+
+    assert _parse(body[:cut], body[cut:]) == [{"text": "café"}]
+
+
+def test_blank_and_invalid_lines_are_skipped():
+    assert _parse(b'\n{"a": 1}\n  \nnot json\n{"b": 2}\n') == [{"a": 1}, {"b": 2}]
+
+
+def test_final_line_without_newline():
+    assert _parse(b'{"a": 1}\n', b'{"done": true}') == [{"a": 1}, {"done": True}]
+    assert _parse(b'{"a": 1}\n{"trunc') == [{"a": 1}]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client with the response cache on and the model replaced by canned replies."""
+    config_file = tmp_path / "config.json"
+    ConfigManager.create_default_config(config_file)
+    data = json.loads(config_file.read_text())
+    data["features"]["enable_response_cache"] = True
+    client = OllamaClient(Config(**data))
+    client.model_calls = 0
+
+    def answer(model):
+        # Like _local_chat: record the reply in history, then return it
+        client.model_calls += 1
+        reply = f"answer {client.model_calls}"
+        client._add_to_history("assistant", reply)
+        return reply
+
+    monkeypatch.setattr(client, "_standard_chat", answer)
+    return client
+
+
+def test_cache_stops_once_conversation_passes_max_history(client):
+    for turn in range(client.cache_max_history // 2):
+        client.chat(f"question {turn}")
+    # chat() trims the stored history, but the conversation is now too long
+    assert len(client.conversation_history) <= client.cache_max_history
+    assert client._get_cache_key(client.model_config.model) is not None
+
+    client.chat("one more")
+    assert client._get_cache_key(client.model_config.model) is None
+
+    client.clear_history()
+    client.chat("fresh")
+    assert client._get_cache_key(client.model_config.model) is not None
+
+
+def test_route_cache_keeps_digests_not_messages(tmp_path):
+    config_file = tmp_path / "config.json"
+    ConfigManager.create_default_config(config_file)
+    data = json.loads(config_file.read_text())
+    data["enable_model_routing"] = True
+    data["model_routing"] = {
+        "default_model": "general",
+        "models": {"code": {"model": "coder", "triggers": ["python"]}},
+    }
+    client = OllamaClient(Config(**data))
+    message = "Write Python " + "x" * 100_000
+
+    assert client._select_model(message) == "coder"
+    assert client._select_model(message.upper()) == "coder"
+    assert client._select_model("hello") == "general"
+    assert len(client._route_cache) == 2
+    assert all(len(key) <= 16 for key in client._route_cache)
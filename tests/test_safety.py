@@ -0,0 +1,66 @@
+"""Unit tests for the safety manager's path checks and rollback."""
+
+import json
+import os
+
+import pytest
+
+from ownclaude.core.config import Config, ConfigManager
+from ownclaude.core.safety import Operation, OperationType, RollbackManager, SafetyManager
+from ownclaude.modules.file_operations import FileOperations
+
+
+@pytest.fixture
+def safety(tmp_path):
+    """Safety manager whose only sensitive path is tmp_path/secret."""
+    config_file = tmp_path / "config.json"
+    ConfigManager.create_default_config(config_file)
+    data = json.loads(config_file.read_text())
+    data["security"]["sensitive_paths"] = [str(tmp_path / "secret")]
+    (tmp_path / "secret").mkdir()
+    (tmp_path / "secret" / "key").write_text("x")
+    return SafetyManager(Config(**data))
+
+
+def test_sensitive_path_and_children(safety, tmp_path):
+    assert safety._is_sensitive_path(str(tmp_path / "secret"))
+    assert safety._is_sensitive_path(str(tmp_path / "secret" / "key"))
+    assert not safety._is_sensitive_path(str(tmp_path / "secretive"))
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="needs symlinks")
+def test_path_swapped_for_symlink_after_check(safety, tmp_path):
+    link = tmp_path / "link"
+    assert not safety._is_sensitive_path(str(link))
+
+    # A path approved while missing must not stay approved once it points
+    # into a sensitive directory
+    link.symlink_to(tmp_path / "secret" / "key")
+    assert safety._is_sensitive_path(str(link))
+
+
+def _append_and_record(target, existing):
+    if existing is not None:
+        target.write_text(existing)
+    ok, _, rollback_info = FileOperations().append_file(str(target), "appended")
+    assert ok
+    rollback = RollbackManager()
+    operation = Operation(OperationType.FILE_APPEND, str(target))
+    rollback.record_operation(operation, rollback_info)
+    return rollback, operation
+
+
+def test_append_rollback_truncates_to_original_size(tmp_path):
+    target = tmp_path / "log.txt"
+    rollback, operation = _append_and_record(target, "kept\n")
+
+    assert rollback.rollback(operation.id)
+    assert target.read_text() == "kept\n"
+
+
+def test_append_rollback_removes_file_the_append_created(tmp_path):
+    target = tmp_path / "new.txt"
+    rollback, operation = _append_and_record(target, None)
+
+    assert rollback.rollback(operation.id)
+    assert not target.exists()